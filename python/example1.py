@@ -46,7 +46,7 @@ if True:
         print("------------------------------")
         print("BlockId: ", Block.BlockId, " Address: ", Block.Address, " Length: ", Block.Length)
         if Block.BlockId == 101 or True:
-            print(tcpmodbus.ReadBlock(Configuration_UnitID, Block.Address, Block.BlockId))
+            print(tcpmodbus.ReadBlock(Configuration_UnitID, Block.Address, Block.BlockId, Length = Block.Length))
     print("------------------------------")
 
 if True:
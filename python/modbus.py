@@ -25,9 +25,21 @@
 # For more information, please refer to <https://unlicense.org>
 #
 
+import array
+import bisect
+import collections
 import socket
 import struct
+import threading
+import time
 from collections import namedtuple
+from modbus_holes import ModbusHoleMap
+from modbus_limits import ModbusLimits
+from modbus_rtu import ModbusRtu, SerialLink, TcpLink
+try:
+    import numpy
+except ImportError:
+    numpy = None
 from sunspec_specification import SunSpec_Specification
 
 # https://github.com/sunspec/models/blob/master/json/model_1.json
@@ -38,13 +50,24 @@ from sunspec_specification import SunSpec_Specification
 #   -SmartMeter()
 #   -Battery()
 #   -GridProtectionTripLimits()
+#   -ExportControl()
+#   -SetExportLimit()
+#   -SetActivePowerLimit()
+#   -Poll()
 # }
 
 # class SunSpec << T, #FF7700 >> {  
-#   -__sunspec_adresses
+#   +SunSpecAddresses
 #   -__sunspec_blocks_cache
+#   -__sunspec_negative_cache
+#   +DiscoveryCache
+#   +WalkBlocks()
+#   +BlockDefinitions()
+#   +NestGroups()
+#   +BlockScale()
 # --
 #   +ReadBlock()
+#   +ReadBlocks()
 # ..
 #   +SunSpec()
 # }
@@ -53,195 +76,1092 @@ from sunspec_specification import SunSpec_Specification
 #   -Specification
 # }
 
+# class SunSpec_Models << T, #FF7700 >> {
+#   +Write()
+# }
+
+# class ModbusReadPlan << T, #FF7700 >> {
+#   +Ranges
+#   +Blocks
+# }
+
+# class ModbusPlan << T, #FF7700 >> {
+#   -__plans
+# --
+#   +Compile()
+#   +Unpack()
+#   +Pack()
+# }
+
+# class ModbusScale << T, #FF7700 >> {
+#   -__scales
+# --
+#   +Compile()
+#   +Apply()
+#   +Batch()
+# }
+
+# class SunSpecCache << T, #FF7700 >> {
+#   +Get()
+#   +Put()
+# }
+
+# class ModbusHoleMap << T, #FF7700 >> {
+#   +Get()
+#   +Add()
+# }
+
+# class ModbusLimits << T, #FF7700 >> {
+#   +Registers()
+#   +Interval()
+#   +Success()
+#   +Rejected()
+#   +Timeout()
+# }
+
+# class ModbusRtu << T, #FF7700 >> {
+#   +sendall()
+#   +recv_into()
+# }
+
 # class modbus << T, #FF7700 >> {
-#   -__unpack_invalid
-#   -__unpack_size
+#   -__pending
+#   -__window
+#   +HoleMap
+#   +Limits
+#   +Retries
+#   +Hooks
+#   +Capture
 # --
-#   +__unpack_from
-#   +__req_uint16
-#   +__res_bytes
-#   +__res_string
+#   +__Unpack
+#   +__recv_into()
+#   +__wait()
 #   +__read_register_req()
 #   +__read_register_res()
 # ..
 #   +ReadRegister()
+#   +ReadRegisters()
+#   +WriteRegister()
+#   +WriteRegisters()
+#   +ReadWriteRegisters()
+#   +Request()
+#   +ResetDelta()
 #   +tcp_send()
 #   +tcp_recv()
 #   +tcp_connect()
+#   +rtu_connect()
+#   +rtu_tcp_connect()
 #   +tcp_close()
 # }
 
 # SolarEdge <|-- SunSpec
 # SunSpec <|-- modbus
 # SunSpec <|-- SunSpec_Specification  
+# SunSpec_Specification *-- SunSpec_Models
+# modbus ..> ModbusPlan
+# modbus ..> ModbusReadPlan
+# modbus ..> ModbusHoleMap
+# modbus ..> ModbusLimits
+# modbus ..> ModbusRtu
+# SunSpec ..> SunSpecCache
+# SunSpec ..> ModbusScale
 
 # hide empty members
 # @enduml
 
-class Modbus:
-    # transforms the Value (uint16) to a list of bytes in modbus byte order.
-    def __req_uint16(self, Value):
-        return [(Value >> 8) & 0xFF, Value & 0xFF]   # high byte, low byte
-
-    # transforms the byte message to a list of bytes.
-    # if the message is empty or None, it returns None
-    def __res_words(self, Message):
-        if Message is None or len(Message) == 0:
-            return None
-        for i in range(0, len(Message), 2):
-            Message[i], Message[i + 1] = Message[i + 1], Message[i]
-        return bytes(Message)  
-
-    # @brief transforms the byte message to a string. the end of string is marked by a 0 byte or the end of the message.
-    # if the message is empty or None, it returns None
-    def __res_string(self, Message):
-        if Message is None or len(Message) == 0:
-            return None
-        Result = ""
-        for i in range(0, len(Message)):
-            if Message[i] == 0:
-                break
-            Result += chr(Message[i])
-        return Result
-
-    __DefinitionRegister = namedtuple("DefinitionRegister", ["name", "type", "length"])
-    __UnpackNotImplemented = {
-        "int16": [0x80, 0x00], 
-        "uint16": [0xff, 0xff], 
-        "acc16": [0x00, 0x00], 
-        "enum16": [0xff, 0xff], 
-        "bitfield16": [0xff, 0xff], 
-        "pad": [0x80, 0x00],
-        "int32": [0x80, 0x00, 0x00, 0x00], 
-        "uint32": [0xff, 0xff, 0xff, 0xff], 
-        "acc32": [0x00, 0x00, 0x00, 0x00], 
-        "enum32": [0xff, 0xff, 0xff, 0xff], 
-        "bitfield32": [0xff, 0xff, 0xff, 0xff], 
-        "int64": [0x80, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00], 
-        "uint64": [0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff], 
-        "acc64" : [0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00],
-        "float32": [0xff, 0xff, 0x7f, 0xff],
-        "float64": [0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0x7f, 0xff],
-        "string": [0x00, 0x80],
-        "sunssf": [0x80, 0x00], 
-        "ipaddr": [0, 0, 0, 0],
-        "ipv6addr": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-     }
-    __UnpackStructFormat = {
-        "int16": "h", "uint16": "H", "acc16": "H", "enum16": "H", "bitfield16": "H", 
-        "int32": "i", 
-        "uint32": "I", 
-        "acc32": "I", "enum32": "I", "bitfield32": "I", 
-        "int64": "q", 
-        "uint64": "Q", "acc64" : "Q",
-        "float32": 'f', 
-        "float64": 'd',
+# @brief compiled decode plan for a register definition ({offset: (name, type, length)}).
+# The plan is built once per definition: all numeric fields are folded into one struct.Struct so a whole
+# response is decoded with a single unpack_from call, "not implemented" sentinels are checked in place on
+# the raw (big-endian) message and strings are cut at the first 0 byte without per character work.
+# Plans are cached by definition identity, see ModbusPlan.Compile().
+class ModbusPlan:
+    # field kinds
+    NUMBER = 0
+    STRING = 1
+    BYTES = 2
+    # number of fields per run compared at once when looking for changed fields
+    RunLength = 8
+
+    # "not implemented" sentinels, compared against the start of the raw field
+    NotImplementedSentinel = {
+        "int16": b"\x80\x00",
+        "uint16": b"\xff\xff",
+        "acc16": b"\x00\x00",
+        "enum16": b"\xff\xff",
+        "bitfield16": b"\xff\xff",
+        "pad": b"\x80\x00",
+        "int32": b"\x80\x00\x00\x00",
+        "uint32": b"\xff\xff\xff\xff",
+        "acc32": b"\x00\x00\x00\x00",
+        "enum32": b"\xff\xff\xff\xff",
+        "bitfield32": b"\xff\xff\xff\xff",
+        "int64": b"\x80\x00\x00\x00\x00\x00\x00\x00",
+        "uint64": b"\xff\xff\xff\xff\xff\xff\xff\xff",
+        "acc64": b"\x00\x00\x00\x00\x00\x00\x00\x00",
+        "float32": b"\xff\xff\x7f\xff",
+        "float64": b"\xff\xff\xff\xff\xff\xff\x7f\xff",
+        "string": b"\x00\x80",
+        "sunssf": b"\x80\x00",
+        "ipaddr": b"\x00\x00\x00\x00",
+        "ipv6addr": bytes(16),
+    }
+    # struct format per type. values are decoded from the word swapped message (16 bit words, low word first)
+    StructFormat = {
+        "int16": "h", "uint16": "H", "acc16": "H", "enum16": "H", "bitfield16": "H",
+        "int32": "i",
+        "uint32": "I",
+        "acc32": "I", "enum32": "I", "bitfield32": "I",
+        "int64": "q",
+        "uint64": "Q", "acc64": "Q",
+        "float32": "f",
+        "float64": "d",
         "sunssf": "h",
-        "count": "H" 
+        "count": "H"
         # string, ipaddr and, ipv6addr are handled separately
-     }    
-    
+    }
+
+    # cache of the compiled plans: id(definition) -> (definition, plan)
+    __plans = {}
+    __plans_limit = 4096
+
+    # @brief returns the (cached) plan for the given definition
+    # @param Definitions: register definition {offset: (name, type, length)}
+    @classmethod
+    def Compile(cls, Definitions):
+        entry = cls.__plans.get(id(Definitions))
+        if entry is not None and entry[0] is Definitions:
+            return entry[1]
+        plan = cls(Definitions)
+        if len(cls.__plans) >= cls.__plans_limit:
+            # definitions built on the fly must not grow the cache without bounds
+            cls.__plans.clear()
+        # the definition is kept alive by the cache so its id can't be reused
+        cls.__plans[id(Definitions)] = (Definitions, plan)
+        return plan
+
+    # @param Definitions: register definition {offset: (name, type, length)}
+    def __init__(self, Definitions):
+        structformat = "<"
+        fields = []
+        index = 0
+        offset = 0
+        for key in Definitions:
+            name, type_, length = Definitions[key]
+            size = length * 2
+            sentinel = self.NotImplementedSentinel.get(type_)
+            format_ = self.StructFormat.get(type_)
+            if format_ is not None and struct.calcsize("<" + format_) == size:
+                structformat += format_
+                fields.append((name, self.NUMBER, offset, size, sentinel, index))
+                index += 1
+            else:
+                if size > 0:
+                    structformat += str(size) + "x"
+                    # fields which can't be decoded (pad, unknown types, size mismatch) are dropped
+                    if type_ == "string":
+                        fields.append((name, self.STRING, offset, size, sentinel, 0))
+                    elif type_ == "ipaddr" or type_ == "ipv6addr":
+                        fields.append((name, self.BYTES, offset, size, sentinel, 0))
+            offset += size
+        # number of registers covered by the definition (offset of the last register + its length)
+        self.Registers = 0
+        if len(Definitions) > 0:
+            last = next(reversed(Definitions))
+            self.Registers = last + Definitions[last][2]
+        self.Definitions = Definitions
+        self.Size = offset
+        self.Struct = struct.Struct(structformat)
+        self.Fields = tuple(fields)
+        # runs of fields (first byte, end byte, fields) compared at once to find the changed fields, see Unpack()
+        self.__runs = tuple((run[0][2], run[-1][2] + run[-1][3], run)
+            for run in (self.Fields[i:i + self.RunLength] for i in range(0, len(self.Fields), self.RunLength)))
+
+    # @brief returns the names of the fields overlapping the registers [First, End) of the definition
+    def Names(self, First, End):
+        return [name for name, kind, offset, size, sentinel, index in self.Fields
+            if offset < End * 2 and First * 2 < offset + size]
+
+    # @brief decodes the raw modbus message (big-endian registers) into a dictionary {name: value}
+    # returns None if the message is too short for the definition
+    # @param Message: bytes or bytearray holding the registers
+    # @param Offset: byte offset of the first register within Message
+    # @param Previous: raw registers of the last read (Size bytes). Only the fields whose bytes differ are decoded,
+    # an empty dictionary is returned without decoding if the registers are unchanged
+    def Unpack(self, Message, Offset = 0, Previous = None):
+        if len(Message) - Offset < self.Size:
+            return None
+        raw = memoryview(Message)[Offset:Offset + self.Size]
+        fields = self.Fields
+        if Previous is not None:
+            if raw == Previous:
+                return {}
+            fields = self.__changed(bytes(raw), Previous)
+        words = array.array("H")
+        words.frombytes(raw)
+        words.byteswap()
+        values = self.Struct.unpack(words)
+        result = {}
+        for name, kind, offset, size, sentinel, index in fields:
+            offset += Offset
+            if sentinel is not None and Message.startswith(sentinel, offset):
+                continue
+            if kind == self.NUMBER:
+                result[name] = values[index]
+            elif kind == self.STRING:
+                end = Message.find(b"\x00", offset, offset + size)
+                if end < 0:
+                    end = offset + size
+                result[name] = Message[offset:end].decode("latin-1")
+            else:
+                result[name] = bytes(Message[offset:offset + size])
+        return result
+
+    # @brief encodes the values {name: value} into raw modbus registers (big-endian), the inverse of Unpack().
+    # Missing values are encoded as the "not implemented" sentinel of their type, strings are cut or padded with
+    # 0 bytes to the size of their field. returns a bytearray of Size bytes
+    # @param Values: dictionary {name: value}
+    def Pack(self, Values):
+        numbers = [0] * sum(1 for field in self.Fields if field[1] == self.NUMBER)
+        for name, kind, offset, size, sentinel, index in self.Fields:
+            if kind == self.NUMBER and Values.get(name) is not None:
+                numbers[index] = Values[name]
+        words = array.array("H")
+        words.frombytes(self.Struct.pack(*numbers))
+        words.byteswap()
+        message = bytearray(words.tobytes())
+        for name, kind, offset, size, sentinel, index in self.Fields:
+            value = Values.get(name)
+            if value is None:
+                if sentinel is not None:
+                    message[offset:offset + len(sentinel)] = sentinel
+            elif kind == self.STRING:
+                value = value.encode("latin-1")[:size]
+                message[offset:offset + size] = value + bytes(size - len(value))
+            elif kind == self.BYTES:
+                message[offset:offset + size] = bytes(value)[:size].ljust(size, b"\x00")
+        return message
+
+    # @brief returns the fields whose bytes differ between the raw registers Current and Previous. Runs of fields
+    # are compared first, so only the fields of the changed runs are compared one by one
+    def __changed(self, Current, Previous):
+        fields = []
+        for first, end, run in self.__runs:
+            if Current[first:end] != Previous[first:end]:
+                fields += [field for field in run
+                    if Current[field[2]:field[2] + field[3]] != Previous[field[2]:field[2] + field[3]]]
+        return fields
+
+
+# @brief scale factor resolution for a register definition. Each value point is mapped to its scale factor
+# (sunssf) point once per definition, see ModbusScale.Compile(). Decoded blocks are then converted into
+# engineering values (value * 10 ** sf) in one pass over the mapped points. Points whose value or scale factor is
+# "not implemented" (missing in the decoded block) become None, or NaN in the numpy matrix of Batch().
+class ModbusScale:
+    # cache of the compiled scales: id(definition) -> (definition, scale factors, scale)
+    __scales = {}
+    __scales_limit = 4096
+
+    # @brief returns the (cached) scale for the given definition
+    # @param Definitions: register definition {offset: (name, type, length)}
+    # @param ScaleFactors: {point name: scale factor point name}. Points of repeating groups named (i, name)
+    # (see SunSpec.BlockDefinitions()) are looked up by name and use the scale factor of their own repeat if
+    # there is one, otherwise the one of the fixed points.
+    @classmethod
+    def Compile(cls, Definitions, ScaleFactors):
+        entry = cls.__scales.get(id(Definitions))
+        if entry is not None and entry[0] is Definitions and entry[1] is ScaleFactors:
+            return entry[2]
+        scale = cls(Definitions, ScaleFactors)
+        if len(cls.__scales) >= cls.__scales_limit:
+            cls.__scales.clear()
+        cls.__scales[id(Definitions)] = (Definitions, ScaleFactors, scale)
+        return scale
+
+    # @param Definitions: register definition {offset: (name, type, length)}
+    # @param ScaleFactors: {point name: scale factor point name}
+    def __init__(self, Definitions, ScaleFactors):
+        names = set(name for name, type_, length in Definitions.values())
+        points = []
+        for name, type_, length in Definitions.values():
+            repeat = type(name) is tuple
+            scalefactor = ScaleFactors.get(name[1] if repeat else name)
+            if scalefactor is None:
+                continue
+            if repeat and (name[0], scalefactor) in names:
+                scalefactor = (name[0], scalefactor)
+            elif scalefactor not in names:
+                # the scale factor isn't part of the definition
+                continue
+            points.append((name, scalefactor))
+        # (point name, scale factor point name)
+        self.Points = tuple(points)
+
+    # @brief returns a copy of the decoded block with the engineering values of the scaled points
+    # @param Values: decoded block {name: value} or None
+    def Apply(self, Values):
+        if Values is None:
+            return None
+        result = dict(Values)
+        for name, scalefactor in self.Points:
+            value = Values.get(name)
+            sf = Values.get(scalefactor)
+            if value is None or sf is None:
+                result[name] = None
+            elif sf < 0:
+                result[name] = value / 10 ** -sf
+            else:
+                result[name] = value * 10 ** sf
+        return result
+
+    # @brief scales the same block of many devices at once. returns the names of the scaled points and a matrix
+    # with a row per block: a numpy array (NaN for missing values) if numpy is installed, otherwise a list of lists
+    # (None for missing values).
+    # @param ValuesList: list of decoded blocks {name: value} or None
+    def Batch(self, ValuesList):
+        names = [name for name, scalefactor in self.Points]
+        if numpy is None:
+            rows = []
+            for values in ValuesList:
+                values = self.Apply(values if values is not None else {})
+                rows.append([values[name] for name in names])
+            return names, rows
+        nan = float("nan")
+        empty = {}
+        raw = numpy.array([[(values or empty).get(name, nan) for name, scalefactor in self.Points]
+            for values in ValuesList], dtype = float).reshape(len(ValuesList), len(names))
+        sf = numpy.array([[(values or empty).get(scalefactor, nan) for name, scalefactor in self.Points]
+            for values in ValuesList], dtype = float).reshape(len(ValuesList), len(names))
+        return names, raw * numpy.power(10.0, sf)
+
+
+# @brief read plan for several register blocks of one unit. Adjacent and nearby blocks are coalesced into as
+# few read requests as possible: gaps of up to MaxGap unused registers are read over, each request covers at
+# most MaxRegisters registers and never a known unreadable hole. The requests are received into one buffer
+# in which each block is contiguous, so the blocks are decoded with their ModbusPlan at their offset.
+class ModbusReadPlan:
+    # protocol limit of registers per read request (function code 3)
+    MaxRegisters = 125
+
+    # @param Requests: list of (Address, Definitions)
+    # @param MaxGap: maximum number of unused registers read to bridge two blocks
+    # @param Holes: list of unreadable register ranges (first, end) with end excluded
+    # @param MaxRegisters: maximum number of registers per request
+    def __init__(self, Requests, MaxGap = 16, Holes = (), MaxRegisters = None):
+        limit = MaxRegisters if MaxRegisters is not None else self.MaxRegisters
+        holes = sorted(Holes)
+        plans = [ModbusPlan.Compile(definitions) for address, definitions in Requests]
+        # union of the register ranges needed
+        intervals = []
+        for address, end in sorted((Requests[i][0], Requests[i][0] + plans[i].Registers) for i in range(len(plans))):
+            if address == end:
+                continue
+            if len(intervals) > 0 and address <= intervals[-1][1]:
+                intervals[-1][1] = max(intervals[-1][1], end)
+            else:
+                intervals.append([address, end])
+        # readable pieces (first, end, interval) of the intervals: holes within a block are not requested
+        pieces = []
+        for group in range(len(intervals)):
+            first, end = intervals[group]
+            for hole in holes:
+                if hole[0] < end and first < hole[1]:
+                    if first < hole[0]:
+                        pieces.append((first, hole[0], group))
+                    first = max(first, hole[1])
+            if first < end:
+                pieces.append((first, end, group))
+        # requests (address, count, last interval): each starts at the first register not read
+        # yet and is extended over the following pieces as long as the gap is small, free of holes and the
+        # request limit isn't reached
+        ranges = []
+        k = 0
+        address = None
+        while k < len(pieces):
+            if address is None:
+                address = pieces[k][0]
+            start = address
+            end = min(pieces[k][1], start + limit)
+            group = pieces[k][2]
+            address = end if end < pieces[k][1] else None
+            if address is None:
+                k += 1
+                while k < len(pieces):
+                    first, last, next_group = pieces[k]
+                    if next_group == group or first - end > MaxGap or first >= start + limit \
+                            or self.__overlaps(holes, end, first):
+                        break
+                    end = min(last, start + limit)
+                    group = next_group
+                    if end < last:
+                        # the piece is continued by the next request
+                        address = end
+                        break
+                    k += 1
+            ranges.append((start, end - start, group))
+        # the buffer is laid out by address within each run of intervals connected by requests, so every block
+        # is contiguous, including the registers of holes within a block which are not requested
+        self.Ranges = []
+        layout = {}         # interval -> (buffer offset, address) of the run it belongs to
+        size = 0
+        last_group = None
+        for start, count, group in ranges:
+            first_group = bisect.bisect_right(intervals, [start, float("inf")]) - 1
+            if first_group != last_group:
+                # new run starting at its first interval
+                base = (size, intervals[first_group][0])
+            for g in range(first_group, group + 1):
+                layout[g] = base
+            offset = base[0] + (start - base[1]) * 2
+            self.Ranges.append((start, count, offset))
+            size = max(size, base[0] + (intervals[group][1] - base[1]) * 2)
+            last_group = group
+        self.Size = size
+        # per block: (plan, buffer offset, index of the first and the last request covering it, names of the
+        # fields within holes)
+        ends = [start + count for start, count, offset in self.Ranges]
+        starts = [start for start, count, offset in self.Ranges]
+        self.Blocks = []
+        for i in range(len(plans)):
+            address = Requests[i][0]
+            registers = plans[i].Registers
+            group = bisect.bisect_right(intervals, [address, float("inf")]) - 1
+            if registers == 0 or group not in layout:
+                # empty or completely unreadable block
+                self.Blocks.append((plans[i], 0, 0, -1, ()))
+                continue
+            first = bisect.bisect_right(ends, address)
+            last = bisect.bisect_left(starts, address + registers) - 1
+            masked = set()
+            for hole in holes:
+                if hole[0] < address + registers and address < hole[1]:
+                    masked.update(plans[i].Names(hole[0] - address, hole[1] - address))
+            base = layout[group]
+            self.Blocks.append((plans[i], base[0] + (address - base[1]) * 2, first, last, tuple(masked)))
+
+    # @brief returns True if one of the holes overlaps the registers [First, End)
+    @staticmethod
+    def __overlaps(Holes, First, End):
+        for first, end in Holes:
+            if first < End and First < end:
+                return True
+        return False
+
+
+# @brief state of one modbus request in flight
+class ModbusTransaction:
+    __slots__ = ("MessageId", "UnitId", "FunctionCode", "View", "Echo", "Raw", "Done", "Valid", "ExceptionCode",
+        "Error", "Sent")
+
+    # @param UnitId: unit ID (uint8)
+    # @param FunctionCode: function code of the request
+    # @param View: memoryview receiving the response data
+    def __init__(self, UnitId, FunctionCode, View):
+        self.MessageId = None
+        self.UnitId = UnitId
+        self.FunctionCode = FunctionCode
+        self.View = View
+        self.Echo = None            # data the response of a write request repeats (address, value or count)
+        self.Raw = False            # View receives the whole response PDU, whatever its length, see Request()
+        self.Done = False
+        self.Valid = False          # a response matching the request was received
+        self.ExceptionCode = None   # modbus exception code of an exception response
+        self.Error = None           # exception raised while receiving (timeout, connection lost)
+        self.Sent = None            # time the request was sent, only measured with hooks
+
+
+class Modbus:
+    # MBAP header (message ID, protocol ID, length, unit ID) followed by the function code and the
+    # byte count of a read response. Exception responses have the same size (function code | 0x80, 
+    # exception code)
+    __mbap_response = struct.Struct(">HHHBBB")
+    # MBAP header followed by a read register request (function code, address, number of registers)
+    __mbap_read_request = struct.Struct(">HHHBBHH")
+    # MBAP header of a request (message ID, protocol ID, length, unit ID)
+    __mbap_header = struct.Struct(">HHHB")
+    # default number of requests in flight per connection
+    Window = 4
+    # register ranges ((first, end), ...) known to be unreadable, e.g. gaps between vendor blocks
+    KnownHoles = ()
+    # unreadable register ranges learned per device type, see modbus_holes.ModbusHoleMap. in memory by
+    # default, assign a map with a path to persist it
+    HoleMap = ModbusHoleMap()
+    # learn the unreadable registers from "illegal data address" exception responses
+    LearnHoles = True
+    # request size and interval limits learned per device, see modbus_limits.ModbusLimits. in memory by default,
+    # assign limits with a path to persist them
+    Limits = ModbusLimits()
+    # adapt the request size and interval to the device
+    AdaptLimits = True
+    # instrumentation hooks (see modbus_metrics.ModbusHooks) called around connecting, the requests and decoding
+    Hooks = ()
+    # modbus_capture.ModbusCapture the request and response frames of new connections are appended to
+    Capture = None
+    # modbus exception code "illegal data address"
+    IllegalDataAddress = 0x02
+    # modbus exception code "illegal data value", e.g. too many registers requested
+    IllegalDataValue = 0x03
+    # modbus exception code "server device busy"
+    ServerDeviceBusy = 0x06
+    # number of times a chunk of a read is requested again after a timeout, an invalid or a "busy" response
+    Retries = 1
+    # time budget of a read in seconds including its retries, no retry is started after it. None for no limit
+    Deadline = None
+    # register range of a read which failed, see ReadRegisters(Partial = True). ExceptionCode is the modbus
+    # exception code of an exception response, Error the exception raised while receiving (e.g. a timeout), both
+    # are None for an invalid response
+    RangeError = namedtuple("RangeError", ["Address", "Count", "ExceptionCode", "Error"])
+    # maximum number of registers per write request (function code 16)
+    MaxWriteRegisters = 123
+
     # @brief decodes the byte message based on the defintion passed in the Format string.
     # @param definition: the format string to decode the message
-    # if n is not specified, it defaults to 1
     def __Unpack(self, definition, message):
-        result = {}
-        for key in definition:
-            item_ = self.__DefinitionRegister._make(definition[key])
-            item_length = item_.length * 2
-            item_notimplemented = self.__UnpackNotImplemented.get(item_.type, None)
-            result_ = None
-            # print("1. item notimplemented: ", item_notimplemented, " item type: ", item_.type, " message : ", message)
-            if item_notimplemented == None or item_notimplemented != message[0:len(item_notimplemented)]:
-                try:
-                    struct_format = self.__UnpackStructFormat[item_.type]
-                    result_ = struct.unpack("<" + struct_format, self.__res_words(message[0:item_length]))
-                    if len(result_) == 1:
-                        result_ = result_[0]
-                except:
-                    if item_.type == "string":
-                        result_ = self.__res_string(message[0:item_length])
-                    elif item_.type =="ipaddr" or item_.type == "ipv6addr":
-                        result_ = message[0:item_length]
-                
-                if not result_ is None:
-                    result[item_.name] = result_
-            message = message[item_length:]
-        return result
-       
+        return ModbusPlan.Compile(definition).Unpack(message)
+
+    # @brief receives exactly len(View) bytes into View. raises ConnectionError if the device closed
+    # the connection
+    # @param View: memoryview to fill
+    def __recv_into(self, View):
+        while len(View) > 0:
+            received = self.s.recv_into(View)
+            if received == 0:
+                raise ConnectionError("connection closed by the device")
+            View = View[received:]
+
+    # @brief discards Length bytes of the current frame to keep the stream in sync
+    def __recv_discard(self, Length):
+        scratch = memoryview(self.__rx_scratch)
+        while Length > 0:
+            chunk = min(Length, len(scratch))
+            self.__recv_into(scratch[:chunk])
+            Length -= chunk
+
+    # @brief returns the receive buffer of the calling thread with at least Length bytes
+    def __result_buffer(self, Length):
+        buffer = getattr(self.__local, "buffer", None)
+        if buffer is None or len(buffer) < Length:
+            buffer = bytearray(max(Length, 256))
+            self.__local.buffer = buffer
+        return buffer
 
-    # @brief creates a modbus read register request message
-    # @param MessageId: message ID (uint16)
+    # @brief sends a read register request and registers the transaction. waits while the window of
+    # requests in flight is full, unless Block is False, then None is returned instead.
     # @param UnitId: unit ID (uint8)
     # @param Address: register address (uint16)
     # @param Length: number of registers (uint16)
-    def __read_register_req(self, MessageId: int, UnitId: int, Address: int, Length: int):
-        message = []
-        message += self.__req_uint16(MessageId)     # message ID
-        message += self.__req_uint16(0)             # protocol ID  
-        message.append(0x00)                        # message length (high)
-        message.append(0x06)                        # message length (low)
-        message.append(UnitId)                      # unit ID 
-        message.append(3)                           # function code
-        message += self.__req_uint16(Address)       # register address  
-        message += self.__req_uint16(Length)        # number of registers   
-        return message    
-
-    # @brief: decodes the modbus read register response message
-    # @param Message: message (byte array)
-    # @param expected message ID (uint16)
-    # @param UnitId: unit ID (uint8)
-    def __read_register_res(self, Message, MessageId: int, UnitId: int):
-        if len(Message) < 9:
-            return None
-        if (Message[0] << 8) + Message[1] != MessageId: # message ID
-            return None
-        if Message[2] != 0x00 or Message[3] != 0x00: # protocol ID
+    # @param View: memoryview receiving the register data (2 * Length bytes)
+    # @param Block: wait for a free slot in the window
+    def __read_register_req(self, UnitId: int, Address: int, Length: int, View, Block = True):
+        transaction = ModbusTransaction(UnitId, 3, View)
+        if not self.__register(transaction, Block):
             return None
-        messageLength = (Message[4] << 8) + Message[5]
-        if messageLength != len(Message) - 6:       # message length
-            return None 
-        if Message[6] != UnitId:                    # unit ID
-            return None
-        if Message[7] != 3:                         # function code 
+        try:
+            with self.__tx_lock:
+                if self.__interval:
+                    self.__pace()
+                self.__mbap_read_request.pack_into(self.__tx_buffer, 0, transaction.MessageId, 0, 6, UnitId, 3,
+                    Address, Length)
+                if self.Hooks:
+                    transaction.Sent = time.perf_counter()
+                self.s.sendall(self.__tx_buffer)
+        except BaseException as e:
+            self.__complete(transaction, e)
+            raise
+        if self.Hooks:
+            for hook in self.Hooks:
+                hook.Request(self, self.__device, UnitId, 3, len(self.__tx_buffer))
+        return transaction
+
+    # @brief sends a request with any function code and registers the transaction, see __read_register_req()
+    # @param UnitId: unit ID (uint8)
+    # @param Pdu: function code and data of the request
+    # @param View: memoryview receiving the response data (after the byte count of read responses), None to
+    # receive the whole response PDU into a new bytearray
+    # @param Echo: data the response of a write request repeats, None for read requests
+    # @param Block: wait for a free slot in the window
+    def __request_req(self, UnitId, Pdu, View, Echo, Block = True):
+        transaction = ModbusTransaction(UnitId, Pdu[0], View)
+        transaction.Echo = Echo
+        transaction.Raw = View is None
+        if not self.__register(transaction, Block):
             return None
-        dataLength = Message[8]
-        if dataLength + 3 > messageLength:          # data length
-            return None 
-        Message = Message[9:]
-        return Message
+        frame = self.__mbap_header.pack(transaction.MessageId, 0, len(Pdu) + 1, UnitId) + Pdu
+        try:
+            with self.__tx_lock:
+                if self.__interval:
+                    self.__pace()
+                if self.Hooks:
+                    transaction.Sent = time.perf_counter()
+                self.s.sendall(frame)
+        except BaseException as e:
+            self.__complete(transaction, e)
+            raise
+        for hook in self.Hooks:
+            hook.Request(self, self.__device, UnitId, Pdu[0], len(frame))
+        return transaction
+
+    # @brief waits until the interval since the previous request passed. called with the tx lock held
+    def __pace(self):
+        delay = self.__next_send - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self.__next_send = time.monotonic() + self.__interval
+
+    # @brief registers the transaction under the next free message ID. waits while the window of requests in
+    # flight is full, unless Block is False, then False is returned instead.
+    def __register(self, Transaction, Block):
+        with self.__condition:
+            while len(self.__pending) >= self.__window:
+                if not Block:
+                    return False
+                self.__condition.wait()
+            # next free message ID
+            messageId = self.__message_id
+            while messageId in self.__pending:
+                messageId = (messageId + 1) & 0xffff
+            self.__message_id = (messageId + 1) & 0xffff
+            Transaction.MessageId = messageId
+            self.__pending[messageId] = Transaction
+        return True
+
+    # @brief marks the transaction as done, frees its slot in the window and wakes up the waiting threads
+    def __complete(self, Transaction, Error = None):
+        with self.__condition:
+            if self.__pending.get(Transaction.MessageId) is Transaction:
+                del self.__pending[Transaction.MessageId]
+            Transaction.Error = Error
+            Transaction.Done = True
+            self.__condition.notify_all()
+        if Transaction.Sent is not None:
+            seconds = time.perf_counter() - Transaction.Sent
+            if Transaction.Raw and Transaction.View is not None:
+                received = self.__mbap_response.size - 2 + len(Transaction.View)
+            elif Transaction.Valid:
+                # write responses have no byte count
+                received = self.__mbap_response.size - (Transaction.Echo is not None) + len(Transaction.View)
+            else:
+                received = self.__mbap_response.size if Transaction.ExceptionCode is not None else 0
+            for hook in self.Hooks:
+                hook.Response(self, self.__device, Transaction.UnitId, Transaction.FunctionCode, seconds, received,
+                    Transaction.ExceptionCode, Error)
+
+    # @brief: receives one modbus response frame and dispatches it to the pending transaction with the same
+    # message ID. the MBAP header is read first, the register data is then received directly into the
+    # memoryview of the transaction. frames without a pending transaction are dropped.
+    def __read_register_res(self):
+        header = memoryview(self.__rx_header)
+        self.__recv_into(header)
+        messageId, protocolId, messageLength, unitId, functionCode, dataLength = self.__mbap_response.unpack(header)
+        if messageLength < 3:
+            # length covers the unit ID, the function code and the byte count as minimum
+            raise ConnectionError("invalid MBAP header")
+        transaction = self.__pending.get(messageId)
+        if transaction is None or protocolId != 0 or unitId != transaction.UnitId:
+            # late response of an abandoned request or a foreign frame
+            self.__recv_discard(messageLength - 3)
+            return
+        if transaction.Raw:
+            # function code, first data byte and the rest of the frame
+            pdu = bytearray(messageLength - 1)
+            pdu[0] = functionCode
+            pdu[1] = dataLength
+            self.__recv_into(memoryview(pdu)[2:])
+            transaction.View = pdu
+            transaction.Valid = functionCode == transaction.FunctionCode
+            if functionCode == transaction.FunctionCode | 0x80:
+                transaction.ExceptionCode = dataLength
+        elif transaction.Echo is not None and functionCode == transaction.FunctionCode \
+                and messageLength == len(transaction.Echo) + 2:
+            # write response, repeats the address and the value or number of registers of the request
+            transaction.View[0] = dataLength
+            self.__recv_into(transaction.View[1:])
+            transaction.Valid = transaction.View == transaction.Echo
+        elif transaction.Echo is None and functionCode == transaction.FunctionCode \
+                and dataLength == len(transaction.View) and messageLength == dataLength + 3:
+            self.__recv_into(transaction.View)
+            transaction.Valid = True
+        else:
+            if functionCode == transaction.FunctionCode | 0x80:
+                transaction.ExceptionCode = dataLength
+            self.__recv_discard(messageLength - 3)
+        self.__complete(transaction)
+
+    # @brief waits for the response of the transaction. the waiting threads take turns in receiving
+    # frames, each frame is handed to the transaction it belongs to. If receiving fails (timeout,
+    # connection lost) all transactions in flight are failed with the error.
+    def __wait(self, Transaction):
+        while True:
+            with self.__condition:
+                while not Transaction.Done and self.__receiving:
+                    self.__condition.wait()
+                if Transaction.Done:
+                    return Transaction
+                self.__receiving = True
+            try:
+                self.__read_register_res()
+            except BaseException as e:
+                with self.__condition:
+                    for transaction in list(self.__pending.values()):
+                        self.__complete(transaction, e)
+            finally:
+                with self.__condition:
+                    self.__receiving = False
+                    self.__condition.notify_all()
+
+    # @brief abandons the transactions; responses arriving later are dropped
+    def __cancel(self, Transactions):
+        for transaction in Transactions:
+            if not transaction.Done:
+                self.__complete(transaction)
+
+    # @brief reads the register ranges [(Address, Count, View)] of the unit, see __pipeline(). returns the
+    # transactions in the order of the ranges.
+    def __read_ranges(self, UnitId, Ranges, Collect = False):
+        return self.__pipeline(len(Ranges), lambda i, Block: self.__read_register_req(UnitId, *Ranges[i], Block),
+            Collect)
+
+    # @brief requests the failed ranges again, up to Retries times and while the Deadline isn't over. Timeouts,
+    # invalid and "busy" responses are retried, other exception responses are final. The transactions are
+    # replaced by the ones of the retries.
+    # @param Ranges: list of (Address, Count, View), see __read_ranges()
+    # @param Transactions: the transactions of the ranges
+    def __retry(self, UnitId, Ranges, Transactions):
+        deadline = time.monotonic() + self.Deadline if self.Deadline is not None else None
+        for attempt in range(self.Retries):
+            failed = [i for i in range(len(Transactions)) if not Transactions[i].Valid
+                and Transactions[i].ExceptionCode in (None, self.ServerDeviceBusy)]
+            if len(failed) == 0 or (deadline is not None and time.monotonic() >= deadline):
+                return
+            for i, transaction in zip(failed, self.__read_ranges(UnitId, [Ranges[i] for i in failed], True)):
+                Transactions[i] = transaction
+
+    # @brief sends Count requests and waits for their responses. up to Window requests are in flight, the first
+    # one may wait for a free slot in the window, the following are only sent while the window isn't full.
+    # returns the transactions in the order of the requests.
+    # @param Send: function sending the i-th request, Send(i, Block), see __read_register_req()
+    # @param Collect: keep going after a failed transaction (timeout, connection lost) instead of raising its
+    # error, the error is left in the transaction
+    def __pipeline(self, Count, Send, Collect = False):
+        transactions = []
+        inflight = collections.deque()
+        i = 0
+        try:
+            while i < Count or len(inflight) > 0:
+                while i < Count:
+                    transaction = Send(i, len(inflight) == 0)
+                    if transaction is None:
+                        break
+                    inflight.append(transaction)
+                    i += 1
+                transaction = self.__wait(inflight.popleft())
+                if transaction.Error is not None and not Collect:
+                    raise transaction.Error
+                transactions.append(transaction)
+        finally:
+            self.__cancel(inflight)
+        return transactions
 
-    # @todo support rs485
     # @brief Reads a registers from the device defined by the Format string. returns a dictionary with the labels as keys and the register 
     # register values as values.
+    # The request is split into chunks of up to the number of registers the device accepts (see Limits), the
+    # chunks are pipelined: up to Window requests are in flight on the
+    # connection, the responses are matched by their message ID. ReadRegister may be called from several
+    # threads sharing the same connection. Known unreadable holes within the registers are not requested, the
+    # fields within them are missing in the result. Failed chunks are requested again, see Retries.
     # @param UnitId: the unit ID of the device
     # @param Address: the address of the register to read
     # @param Format: the format string to decode the register value
     # @param Labels: the labels for the register values
-    def ReadRegister(self, UnitId, Address, Definitions):
-        last_def = list(Definitions)[-1] 
-        formatsize = last_def + self.__DefinitionRegister._make(Definitions[last_def]).length
-        messageId = 0x1248
+    # @param Delta: return only the values which changed since the last read, see ReadRegisters()
+    # @param Partial: return the values of the chunks read along with the failed register ranges, see
+    # ReadRegisters()
+    def ReadRegister(self, UnitId, Address, Definitions, Delta = False, Partial = False):
+        # if the format is empty, return None
+        if ModbusPlan.Compile(Definitions).Registers == 0:
+            return (None, []) if Partial else None
+        if Partial:
+            results, errors = self.ReadRegisters(UnitId, [(Address, Definitions)], 0, None, Delta, Partial)
+            return results[0], errors
+        return self.ReadRegisters(UnitId, [(Address, Definitions)], 0, None, Delta)[0]
+
+    # @brief Reads the register ranges of the unit without decoding them. The requests are pipelined, exception
+    # responses don't raise and no holes are learned, which makes it suitable for speculative reads.
+    # returns a list with the register data (bytes, big endian) or None for each range that couldn't be read
+    # @param UnitId: the unit ID of the device
+    # @param Ranges: list of (Address, Count), Count up to ModbusReadPlan.MaxRegisters
+    def ReadRaw(self, UnitId, Ranges):
+        buffer = bytearray(2 * sum(count for address, count in Ranges))
+        view = memoryview(buffer)
+        ranges = []
+        offset = 0
+        for address, count in Ranges:
+            ranges.append((address, count, view[offset:offset + count * 2]))
+            offset += count * 2
+        transactions = self.__read_ranges(UnitId, ranges)
+        return [bytes(ranges[i][2]) if transactions[i].Valid else None for i in range(len(ranges))]
+
+    # @brief Sends a request with any function code and returns the response PDU (function code and data) as
+    # received, an exception response included. Raises the error if no response was received (timeout,
+    # connection lost). The request shares the window of the connection with the other requests, e.g. to forward
+    # the requests of other clients (see modbus_proxy.ModbusProxy)
+    # @param UnitId: the unit ID of the device
+    # @param Pdu: function code and data of the request
+    def Request(self, UnitId, Pdu):
+        transaction = self.__pipeline(1, lambda i, Block: self.__request_req(UnitId, Pdu, None, None, Block))[0]
+        return bytes(transaction.View)
+
+    # @brief Writes the values to the registers of the device, encoded with the same definition ReadRegister()
+    # decodes them with. A single register is written with function code 6, more registers with function code 16.
+    # returns True if the device acknowledged the write, False otherwise (exception response)
+    # @param UnitId: the unit ID of the device
+    # @param Address: the address of the first register
+    # @param Definitions: register definition {offset: (name, type, length)}
+    # @param Values: dictionary {name: value} with a value for every field of the definition
+    def WriteRegister(self, UnitId, Address, Definitions, Values):
+        return self.WriteRegisters(UnitId, [(Address, Definitions, Values)])
+
+    # @brief Writes several register blocks, e.g. a set of setpoints. Blocks following each other directly
+    # are joined into one request (up to MaxWriteRegisters registers), the requests are pipelined and sent in
+    # the order of Writes. returns True if the device acknowledged all writes, False otherwise
+    # @param UnitId: the unit ID of the device
+    # @param Writes: list of (Address, Definitions, Values), see WriteRegister()
+    def WriteRegisters(self, UnitId, Writes):
+        frames = []
+        for address, definitions, values in Writes:
+            data = self.__encode(definitions, values)
+            if len(frames) > 0 and frames[-1][0] + len(frames[-1][1]) // 2 == address:
+                frames[-1][1].extend(data)
+            else:
+                frames.append((address, bytearray(data)))
+        requests = []
+        for address, data in frames:
+            for offset in range(0, len(data), self.MaxWriteRegisters * 2):
+                chunk = data[offset:offset + self.MaxWriteRegisters * 2]
+                first = address + offset // 2
+                if len(chunk) == 2:
+                    pdu = struct.pack(">BH", 6, first) + chunk
+                    requests.append((pdu, pdu[1:]))
+                else:
+                    pdu = struct.pack(">BHHB", 16, first, len(chunk) // 2, len(chunk)) + chunk
+                    requests.append((pdu, pdu[1:5]))
+        transactions = self.__pipeline(len(requests), lambda i, Block:
+            self.__request_req(UnitId, requests[i][0], memoryview(bytearray(4)), requests[i][1], Block))
+        return all(transaction.Valid for transaction in transactions)
+
+    # @brief Writes the values and reads registers in one round trip (function code 23). The device writes
+    # before it reads, so a control step can set its setpoints and read back the resulting state at once.
+    # returns a dictionary with the read values or None if the device didn't accept the request
+    # @param UnitId: the unit ID of the device
+    # @param ReadAddress: the address of the registers to read
+    # @param ReadDefinitions: register definition of the read registers (up to 125 registers)
+    # @param WriteAddress: the address of the registers to write
+    # @param WriteDefinitions: register definition of the written registers (up to 121 registers)
+    # @param Values: dictionary {name: value} with a value for every field of WriteDefinitions
+    def ReadWriteRegisters(self, UnitId, ReadAddress, ReadDefinitions, WriteAddress, WriteDefinitions, Values):
+        plan = ModbusPlan.Compile(ReadDefinitions)
+        data = self.__encode(WriteDefinitions, Values)
+        if plan.Size > 250 or len(data) > 242:
+            raise ValueError("read/write of more than 125/121 registers")
+        pdu = struct.pack(">BHHHHB", 23, ReadAddress, plan.Size // 2, WriteAddress, len(data) // 2, len(data)) + data
+        buffer = bytearray(plan.Size)
+        transaction = self.__pipeline(1, lambda i, Block:
+            self.__request_req(UnitId, pdu, memoryview(buffer), None, Block))[0]
+        return plan.Unpack(buffer) if transaction.Valid else None
+
+    # @brief encodes the values of a write. raises ValueError if a value is missing, its register would be
+    # written with the "not implemented" sentinel otherwise
+    # @param Definitions: register definition {offset: (name, type, length)}
+    # @param Values: dictionary {name: value}
+    @staticmethod
+    def __encode(Definitions, Values):
+        plan = ModbusPlan.Compile(Definitions)
+        missing = [field[0] for field in plan.Fields if Values.get(field[0]) is None]
+        if len(missing) > 0:
+            raise ValueError("no value for " + ", ".join(missing))
+        return plan.Pack(Values)
+
+    # @brief returns the key identifying the type of the device (manufacturer, model, firmware) in the HoleMap.
+    # defaults to "host:port/unit" until set by SetDeviceKey()
+    # @param UnitId: the unit ID of the device
+    def DeviceKey(self, UnitId):
+        key = self.__device_keys.get(UnitId)
+        if key is None:
+            key = "%s:%d/%d" % (self.Peer + (UnitId,))
+        return key
+
+    # @brief sets the key identifying the type of the device, see DeviceKey()
+    # @param UnitId: the unit ID of the device
+    # @param Key: e.g. "manufacturer/model/version"
+    def SetDeviceKey(self, UnitId, Key):
+        self.__device_keys[UnitId] = Key
+
+    # @brief returns the unreadable register ranges [(first, end)] of the unit: the KnownHoles of the class and
+    # the ones learned for the device type
+    # @param UnitId: the unit ID of the device
+    def Holes(self, UnitId):
+        return self.KnownHoles + self.HoleMap.Get(self.DeviceKey(UnitId))
+
+    # @brief locates the unreadable registers within the range by bisecting it. The halves of all failing
+    # ranges are requested together, ranges failing with "illegal data address" are split further down to
+    # single registers. returns the unreadable registers [(first, end)]
+    # @param UnitId: the unit ID of the device
+    # @param Address: first register of the range failing with "illegal data address"
+    # @param Count: number of registers of the range
+    def __probe(self, UnitId, Address, Count):
+        holes = []
+        scratch = memoryview(bytearray(Count * 2))
+        failing = [(Address, Count)]
+        while len(failing) > 0:
+            ranges = []
+            for address, count in failing:
+                if count == 1:
+                    holes.append((address, address + 1))
+                    continue
+                half = count // 2
+                for first, length in ((address, half), (address + half, count - half)):
+                    offset = (first - Address) * 2
+                    ranges.append((first, length, scratch[offset:offset + length * 2]))
+            transactions = self.__read_ranges(UnitId, ranges)
+            failing = [(ranges[i][0], ranges[i][1]) for i in range(len(ranges))
+                if transactions[i].ExceptionCode == self.IllegalDataAddress]
+        return holes
+
+    # @brief Reads several register blocks of the unit with as few requests as possible, see ModbusReadPlan.
+    # returns a list with the decoded blocks (or None if a block couldn't be read) in the order of Requests.
+    # Requests failing with "illegal data address" are bisected to learn the unreadable registers of the device
+    # type (see HoleMap), the blocks are then read again around them. The size of the requests and their interval
+    # adapt to the device (see Limits): requests rejected for their size are read again in smaller chunks.
+    # Requests failing with a timeout or an invalid response are sent again (see Retries and Deadline), a timeout
+    # is raised if they still fail.
+    # With Delta the raw registers of every block are kept per connection. A block whose registers didn't change
+    # since the last read isn't decoded and returned as an empty dictionary, of a changed block only the values
+    # whose registers changed are returned. The first read of a block returns all values.
+    # @param UnitId: the unit ID of the device
+    # @param Requests: list of (Address, Definitions)
+    # @param MaxGap: maximum number of unused registers read to bridge two blocks
+    # @param MaxRegisters: maximum number of registers per request (defaults to the limit of the device, see
+    # Limits)
+    # @param Delta: return only the values which changed since the last read
+    # @param Partial: nothing is raised for failed requests, the blocks hold the values outside of the failed
+    # register ranges. returns (blocks, [RangeError]) with the failed ranges. Can't be combined with Delta
+    def ReadRegisters(self, UnitId, Requests, MaxGap = 16, MaxRegisters = None, Delta = False, Partial = False):
+        if Partial and Delta:
+            raise ValueError("Partial can't be combined with Delta")
+        start = time.perf_counter() if self.Hooks else None
+        return self.__read_registers(UnitId, Requests, MaxGap, MaxRegisters, True, Delta, Partial, start)
+
+    # @brief forgets the registers kept for Delta reads, the next Delta read returns all values again
+    # @param UnitId: the unit ID of the device, None for all units
+    def ResetDelta(self, UnitId = None):
+        for key in [key for key in self.__delta if UnitId is None or key[0] == UnitId]:
+            self.__delta.pop(key, None)
+
+    # @param Retry: learn the holes and request limits from the exception responses and read again
+    # @param Start: time the read started, only measured with hooks
+    def __read_registers(self, UnitId, Requests, MaxGap, MaxRegisters, Retry, Delta, Partial, Start):
+        limits = None
+        if self.AdaptLimits:
+            limits = "%s:%d/%d" % (self.Peer + (UnitId,))
+            registers = self.Limits.Registers(limits)
+            if MaxRegisters is None or registers < MaxRegisters:
+                MaxRegisters = registers
+            self.__interval = self.Limits.Interval(limits)
+        holes = self.Holes(UnitId)
+        key = (UnitId, MaxGap, MaxRegisters, tuple((address, id(definitions)) for address, definitions in Requests), holes)
+        entry = self.__read_plans.get(key)
+        if entry is None:
+            if len(self.__read_plans) >= 256:
+                self.__read_plans.clear()
+            # the entry keeps the definitions alive so their ids in the key can't be reused
+            entry = (list(Requests), ModbusReadPlan(Requests, MaxGap, holes, MaxRegisters))
+            self.__read_plans[key] = entry
+        plan = entry[1]
+        buffer = self.__result_buffer(plan.Size)
+        view = memoryview(buffer)
+        ranges = [(address, count, view[offset:offset + count * 2]) for address, count, offset in plan.Ranges]
+        collect = Partial or self.Retries > 0
+        try:
+            transactions = self.__read_ranges(UnitId, ranges, collect)
+            if self.Retries > 0:
+                self.__retry(UnitId, ranges, transactions)
+            error = next((transaction.Error for transaction in transactions if transaction.Error is not None), None)
+        except socket.timeout as e:
+            error = e
+        if isinstance(error, socket.timeout) and limits is not None:
+            self.Limits.Timeout(limits, max((count for address, count, offset in plan.Ranges), default = 0))
+        if error is not None and not Partial:
+            raise error
+        if Retry:
+            learned = []
+            rejected = []
+            for i in range(len(transactions)):
+                code = transactions[i].ExceptionCode
+                count = plan.Ranges[i][1]
+                if code == self.IllegalDataAddress and self.LearnHoles:
+                    holes = self.__probe(UnitId, plan.Ranges[i][0], count)
+                    if len(holes) == 0 and count > 1:
+                        # all registers are readable in smaller requests
+                        rejected.append(count)
+                    learned += holes
+                elif code == self.IllegalDataValue and count > 1:
+                    rejected.append(count)
+            if len(learned) > 0:
+                self.HoleMap.Add(self.DeviceKey(UnitId), learned)
+            adapted = limits is not None and len(rejected) > 0
+            if adapted:
+                self.Limits.Rejected(limits, min(rejected))
+            if len(learned) > 0 or adapted:
+                # read again, adapting further while the limit shrinks
+                retry = adapted and self.Limits.Registers(limits) < MaxRegisters
+                return self.__read_registers(UnitId, Requests, MaxGap, MaxRegisters, retry, Delta, Partial, Start)
+        if limits is not None and all(transaction.Valid for transaction in transactions):
+            self.Limits.Success(limits, max((count for address, count, offset in plan.Ranges), default = 0))
+        decoding = time.perf_counter() if Start is not None else None
         result = []
+        for request, (block, offset, first, last, masked) in zip(Requests, plan.Blocks):
+            values = None
+            if last >= first and all(transactions[i].Valid for i in range(first, last + 1)):
+                if Delta:
+                    values = self.__unpack_delta(UnitId, request, block, buffer, offset)
+                else:
+                    values = block.Unpack(buffer, offset)
+                for name in masked:
+                    values.pop(name, None)
+            elif Partial and last >= first and any(transactions[i].Valid for i in range(first, last + 1)):
+                values = block.Unpack(buffer, offset)
+                for name in masked:
+                    values.pop(name, None)
+                # drop the fields of the failed requests
+                for i in range(first, last + 1):
+                    if not transactions[i].Valid:
+                        address, count, start = plan.Ranges[i]
+                        for name in block.Names(address - request[0], address + count - request[0]):
+                            values.pop(name, None)
+            result.append(values)
+        if Start is not None:
+            end = time.perf_counter()
+            fields = sum(len(values) for values in result if values is not None)
+            for hook in self.Hooks:
+                hook.Decode(self, self.__device, UnitId, len(result), fields, end - decoding)
+                hook.Read(self, self.__device, UnitId, len(Requests), len(plan.Ranges), end - Start)
+        if Partial:
+            return result, [self.RangeError(plan.Ranges[i][0], plan.Ranges[i][1], transactions[i].ExceptionCode,
+                transactions[i].Error) for i in range(len(transactions)) if not transactions[i].Valid]
+        return result
 
-        # if the format is empty, return None
-        if formatsize == 0:
-            return None
-        # split the format into chunks of 120 bytes (approx 256 - 9 / 2) as the modbus protocol has a limit 
-        # of 256 bytes per message
-        while formatsize > 0:
-            chunk = formatsize if formatsize < 120 else 120   # approx 256 - 9 / 2
-            message = self.__read_register_req(messageId, UnitId, Address, chunk)
-            self.s.send(bytes(message))
-            message = self.s.recv(300) 
-            message = self.__read_register_res(message, messageId, UnitId)
-            if message is None:
-                return None
-            result += message
-            formatsize -= chunk
-            Address += chunk
-        #decode the byte message
-        values = self.__Unpack(Definitions, result)
+    # @brief decodes the values of the block which changed since the last Delta read and keeps its registers
+    # @param Request: (Address, Definitions) of the block
+    # @param Plan: ModbusPlan of the block
+    def __unpack_delta(self, UnitId, Request, Plan, Buffer, Offset):
+        # the entry keeps the definitions alive so their id in the key can't be reused
+        key = (UnitId, Request[0], id(Request[1]))
+        entry = self.__delta.get(key)
+        previous = entry[1] if entry is not None and entry[0] is Request[1] else None
+        values = Plan.Unpack(Buffer, Offset, previous)
+        if len(values) > 0 or previous is None:
+            if len(self.__delta) >= 4096 and key not in self.__delta:
+                self.__delta.clear()
+            self.__delta[key] = (Request[1], bytes(Buffer[Offset:Offset + Plan.Size]))
         return values
 
     # @brief send a message via TCP        
@@ -256,12 +1176,75 @@ class Modbus:
     # @param ip: the IP address of the device
     # @param port: the port of the device
     # @param timeout: the timeout for the connection in seconds when receiving data or sending data        
-    def tcp_connect(self, ip, port, timeout):
-        self.s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.s.connect((ip, port))
+    # @param window: maximum number of requests in flight (defaults to Modbus.Window)
+    # @param pool: modbus_pool.ModbusPool to lease the connection from. The connection is then opened lazily,
+    # reopened after errors and returned to the pool by tcp_close()
+    def tcp_connect(self, ip, port, timeout, window = None, pool = None):
+        def connect():
+            if pool is not None:
+                return pool.Connect(ip, port)
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            s.connect((ip, port))
+            return s
+        self.__connect(connect, ip, port, timeout, window)
+
+    # @brief connect to the devices on a RS485 bus via a serial port (Modbus RTU), see modbus_rtu.ModbusRtu. The
+    # requests are put on the bus one after the other, the ones of a window are queued.
+    # @param port: path of the serial port, e.g. "/dev/ttyUSB0"
+    # @param baudrate: bits per second
+    # @param timeout: the timeout for a response in seconds
+    # @param parity: "N", "E" or "O"
+    # @param window: maximum number of requests queued (defaults to Modbus.Window)
+    def rtu_connect(self, port, baudrate, timeout, parity = "E", window = None):
+        self.__connect(lambda: ModbusRtu(SerialLink(port, baudrate, parity), baudrate), port, baudrate, timeout, window)
+
+    # @brief connect to a gateway forwarding Modbus RTU frames over TCP to the devices on its bus
+    # @param ip: the IP address of the gateway
+    # @param port: the port of the gateway
+    # @param timeout: the timeout for connecting and for a response in seconds
+    # @param window: maximum number of requests queued (defaults to Modbus.Window)
+    def rtu_tcp_connect(self, ip, port, timeout, window = None):
+        self.__connect(lambda: ModbusRtu(TcpLink(ip, port, timeout)), ip, port, timeout, window)
+
+    # @brief opens the transport returned by Connect (a socket or a socket-like object) and resets the
+    # transaction state
+    # @param Host: IP address, host name or serial port of the device
+    # @param Port: port or baudrate
+    def __connect(self, Connect, Host, Port, timeout, window):
+        self.__device = "%s:%d" % (Host, Port)
+        start = time.perf_counter()
+        try:
+            self.s = Connect()
+        except BaseException as e:
+            for hook in self.Hooks:
+                hook.Connect(self, self.__device, time.perf_counter() - start, e)
+            raise
+        for hook in self.Hooks:
+            hook.Connect(self, self.__device, time.perf_counter() - start, None)
+        if self.Capture is not None:
+            self.s = self.Capture.Wrap(self.s, self.__device)
         self.s.settimeout(timeout)
+        # transaction state, shared by all threads using this connection
+        self.__window = window if window is not None else self.Window
+        self.__message_id = 1
+        self.__pending = {}
+        self.__receiving = False
+        self.__condition = threading.Condition()
+        self.__tx_lock = threading.Lock()
+        self.__tx_buffer = bytearray(self.__mbap_read_request.size)
+        # minimum interval between two requests (see Limits) and the earliest time of the next one
+        self.__interval = 0
+        self.__next_send = 0
+        self.__rx_header = bytearray(self.__mbap_response.size)
+        self.__rx_scratch = bytearray(256)
+        self.__local = threading.local()
+        self.__read_plans = {}
+        # raw registers of the last Delta read per block {(unit ID, address, id(definitions)): (definitions, bytes)}
+        self.__delta = {}
+        self.Peer = (Host, Port)
+        self.__device_keys = {}
 
-    # @brief closes the TCP socket
+    # @brief closes the TCP socket or the serial port (or returns the socket to the pool)
     def tcp_close(self):
         self.s.close()
         self.s = None
@@ -269,179 +1252,574 @@ class Modbus:
 
 class SunSpec(Modbus, SunSpec_Specification):
     # SunSpec's addresses
-    __sunspec_adresses = [0, 40000, 50000]
-    # cache for the SunSpec blocks
+    SunSpecAddresses = [0, 40000, 50000]
+    # cache for the SunSpec blocks and the device key (see DeviceKey()), keyed by (host, port, unit ID)
     __sunspec_blocks_cache = { }
+    # persistent discovery cache (sunspec_cache.SunSpecCache), None disables it
+    DiscoveryCache = None
+    # base addresses without SunSpec marker per device {(host, port, unit): {address: retry time}}
+    __sunspec_negative_cache = { }
+    # time in seconds a base address without SunSpec marker isn't probed again
+    NegativeTTL = 3600
+    # number of full size requests in flight while reading the block chain during the discovery
+    SunSpecReadAhead = 4
     #   data type for the SunSpec block definition      
     SunSpecBlock = namedtuple("SunSpecBlock", ["BlockId", "SubBlockId", "Address", "Length"])
+    # register definitions of the blocks per (BlockId, SubBlockId, Length), see BlockDefinitions()
+    __block_definitions = { }
+    # definitions used for the discovery of the SunSpec blocks
+    SunSpecMarker = {0: ('C_SunSpec_ID', 'string', 2)}
+    SunSpecHeader = {0: ('C_SunSpec_DID', 'uint16', 1), 1: ('C_SunSpec_Length', 'uint16', 1)}
+    # SunSpec marker and common block (model 1) at the base address, identifies the device
+    SunSpecFingerprint = {0: ('C_SunSpec_ID', 'string', 2), 2: ('ID', 'uint16', 1), 3: ('L', 'uint16', 1),
+        4: ('Mn', 'string', 16), 20: ('Md', 'string', 16), 36: ('Opt', 'string', 8), 44: ('Vr', 'string', 8),
+        52: ('SN', 'string', 16)}
 
     # @ brief Retrieves the SunSpec IDs and the length of the SunSpec blocks
     # the function returns a dictionary with the address as key and a tuple (blocktype, length) as value
     # If no SunSpecAddressId is given the function will iterate over the SunSpec addresses (0, 40000, 50000) 
-    # until a valid block is found. 
+    # until a valid block is found. The candidate addresses are probed concurrently, addresses without a
+    # SunSpec marker are remembered for NegativeTTL seconds and not probed again.
+    # The block chain is read ahead with full size requests (SunSpecReadAhead of them in flight), the headers
+    # are parsed from the responses, so a discovery takes a few round trips independent of the number of blocks.
+    # The result is cached per device (host, port, unit). With a DiscoveryCache the result survives the process:
+    # a cached entry is validated by a single read of the device fingerprint (SunSpec marker, common block
+    # manufacturer, model, version and serial number) and rediscovered on mismatch.
     # @param Configuration_UnitID: the unit ID of the SunSpec device
     # @param SunSpecAddressId: the ID of the SunSpec block to read (0, 1, 2) 
     def SunSpec(self, Configuration_UnitID, SunSpecAddressId = -1):
-        if SunSpecAddressId == -1:
-            # if no SunSpecAddressId is given, iterate over the SunSpec addresses
-            for i in range(0, len(self.__sunspec_adresses)):
-                result = self.SunSpec(Configuration_UnitID, self.__sunspec_adresses[i])
-                if result is not None:
-                    return result
-            return None
-        
-        if SunSpecAddressId < 0 or SunSpecAddressId >= len(self.__sunspec_adresses):
+        if SunSpecAddressId < -1 or SunSpecAddressId >= len(self.SunSpecAddresses):
             # SunSpecAddressId is out of range
             return None
-        if not self.__sunspec_blocks_cache.get(Configuration_UnitID) is None:
-            # return the cached result
-            return self.__sunspec_blocks_cache[Configuration_UnitID]; 
-    
-        Address = self.__sunspec_adresses[SunSpecAddressId]
-        message = self.ReadRegister(Configuration_UnitID, Address, {0: ('C_SunSpec_ID', 'string', 2)})
-        if message is None:
-            # stop if the message is None
+        device = self.Peer + (Configuration_UnitID,)
+        entry = self.__sunspec_blocks_cache.get(device)
+        if entry is not None:
+            # return the cached result. the device key is restored, it is lost when the connection is reopened
+            self.SetDeviceKey(Configuration_UnitID, entry[1])
+            return entry[0]
+
+        result = None
+        if self.DiscoveryCache is not None:
+            result = self.__cached(Configuration_UnitID, SunSpecAddressId)
+        if result is None:
+            if SunSpecAddressId == -1:
+                # if no SunSpecAddressId is given, probe all SunSpec addresses
+                base = self.__probe_bases(Configuration_UnitID, self.SunSpecAddresses)
+            else:
+                base = self.__probe_bases(Configuration_UnitID, [self.SunSpecAddresses[SunSpecAddressId]])
+            if base is not None:
+                result = self.__discover(Configuration_UnitID, base)
+        if result is not None:
+            # add block list to cache
+            self.__sunspec_blocks_cache.setdefault(device, (result, self.DeviceKey(Configuration_UnitID)))
+        return result
+
+    # @brief returns the fingerprint of the device from the decoded SunSpecFingerprint registers and sets the
+    # device key (manufacturer, model and version of the common block) of the unit, which identifies the device
+    # type in the HoleMap. returns None if there is no SunSpec marker
+    # @param UnitId: the unit ID of the SunSpec device
+    # @param Message: SunSpecFingerprint registers read at the SunSpec base address
+    def __fingerprint(self, UnitId, Message):
+        if Message is None or Message.get("C_SunSpec_ID") != "SunS":
+            return None
+        if Message.get("ID") == 1:
+            self.SetDeviceKey(UnitId, "%s/%s/%s" % (Message.get("Mn", ""), Message.get("Md", ""), Message.get("Vr", "")))
+        return "/".join(str(Message.get(name, "")) for name in ("C_SunSpec_ID", "ID", "L", "Mn", "Md", "Vr", "SN"))
+
+    # @brief returns the blocks of the DiscoveryCache if the fingerprint of the device still matches
+    # @param UnitId: the unit ID of the SunSpec device
+    # @param SunSpecAddressId: the ID of the SunSpec block to read (0, 1, 2) or -1
+    def __cached(self, UnitId, SunSpecAddressId):
+        key = "%s:%d/%d" % (self.Peer + (UnitId,))
+        entry = self.DiscoveryCache.Get(key)
+        if entry is None:
             return None
-        # the message must contain the SunSpec ID
-        sunspec = message["C_SunSpec_ID"]
-        if sunspec != "SunS":
-             return None
-        Address += 2
-        
+        if SunSpecAddressId != -1 and entry["Base"] != self.SunSpecAddresses[SunSpecAddressId]:
+            return None
+        message = self.ReadRegister(UnitId, entry["Base"], self.SunSpecFingerprint)
+        if self.__fingerprint(UnitId, message) != entry["Fingerprint"]:
+            # other device or firmware changed
+            self.DiscoveryCache.Remove(key)
+            return None
+        return [self.SunSpecBlock(*block) for block in entry["Blocks"]]
+
+    # @brief reads the SunSpec marker at the candidate base addresses concurrently. returns the first address
+    # (in the order of Bases) with a marker or None. Addresses without a marker are remembered in the negative
+    # cache of the device.
+    # @param UnitId: the unit ID of the SunSpec device
+    # @param Bases: candidate SunSpec base addresses
+    def __probe_bases(self, UnitId, Bases):
+        now = time.monotonic()
+        negative = self.__sunspec_negative_cache.setdefault(self.Peer + (UnitId,), {})
+        bases = [base for base in Bases if negative.get(base, 0) <= now]
+        if len(bases) == 0:
+            return None
+        markers = self.ReadRaw(UnitId, [(base, 2) for base in bases])
+        found = None
+        for base, marker in zip(bases, markers):
+            if marker == b"SunS":
+                negative.pop(base, None)
+                if found is None:
+                    found = base
+            else:
+                negative[base] = now + self.NegativeTTL
+        return found
+
+    # @brief walks the SunSpec block chain at the base address, see WalkBlocks(). returns the blocks.
+    # @param Configuration_UnitID: the unit ID of the SunSpec device
+    # @param Base: SunSpec base address
+    def __discover(self, Configuration_UnitID, Base):
+        registers = self.Limits.Registers("%s:%d/%d" % (self.Peer + (Configuration_UnitID,))) if self.AdaptLimits else None
+        walk = self.WalkBlocks(Base, self.SunSpecReadAhead, registers)
+        try:
+            ranges = next(walk)
+            while True:
+                ranges = walk.send(self.ReadRaw(Configuration_UnitID, ranges))
+        except StopIteration as stop:
+            result, message = stop.value
+        if message is None:
+            message = self.ReadRegister(Configuration_UnitID, Base, self.SunSpecFingerprint)
+        fingerprint = self.__fingerprint(Configuration_UnitID, message)
+        if self.DiscoveryCache is not None and fingerprint is not None:
+            self.DiscoveryCache.Put("%s:%d/%d" % (self.Peer + (Configuration_UnitID,)), Base, fingerprint, result)
+        return result
+
+    # @brief walks the SunSpec block chain at the base address without doing I/O: the generator yields lists of
+    # register ranges [(Address, Count)] to read and expects the register data (bytes or None per range, see
+    # ReadRaw()) to be sent back. The chain is read ahead with ReadAhead requests of up to
+    # MaxRegisters registers, all block headers within the received registers are parsed. If a request fails
+    # (the device limits the request size or the end of the register map is reached), the registers up to it are
+    # kept and the next read consists of shrinking requests and the header alone, continuing with the largest
+    # readable size. The generator returns the blocks and the decoded SunSpecFingerprint if it is part of the
+    # registers read (or None).
+    # @param Base: SunSpec base address
+    # @param ReadAhead: number of requests read ahead
+    # @param MaxRegisters: registers per request, defaults to ModbusReadPlan.MaxRegisters
+    @staticmethod
+    def WalkBlocks(Base, ReadAhead, MaxRegisters = None):
+        window = MaxRegisters if MaxRegisters is not None else ModbusReadPlan.MaxRegisters
+        plan = ModbusPlan.Compile(SunSpec.SunSpecFingerprint)
+        message = None
+        # registers read so far: data holds the contiguous registers from start on
+        start = Base
+        data = b""
+        # a request of the last read failed, the next one shrinks
+        limited = False
+        Address = Base + 2
+
         result = []
         # process all SunSpec blocks until the end
         while Address < 0x10000:
-            message = self.ReadRegister(Configuration_UnitID, Address, {0: ('C_SunSpec_DID', 'uint16', 1), 1: ('C_SunSpec_Length', 'uint16', 1)})
-
-            BlockId = message.get("C_SunSpec_DID", 0xffff) # id might be discared due to not implemented logic
-            Length =  message["C_SunSpec_Length"]
+            offset = (Address - start) * 2
+            while offset + 4 > len(data):
+                if message is None and start == Base and len(data) >= plan.Registers * 2:
+                    # the marker and the common block were read along, no separate read of the fingerprint
+                    message = plan.Unpack(data)
+                if len(data) > 0 and offset > len(data) and not limited:
+                    # the header is beyond the registers read so far
+                    start = Address
+                    data = b""
+                end = start + len(data) // 2
+                ranges = []
+                if not limited:
+                    # read ahead, continuing the registers read so far
+                    while len(ranges) < ReadAhead and end < 0x10000:
+                        ranges.append((end, min(window, 0x10000 - end)))
+                        end += ranges[-1][1]
+                    if len(ranges) == 0:
+                        return result, message
+                    chunks = yield ranges
+                    for chunk in chunks:
+                        if chunk is None:
+                            # continue with shrinking requests from the first failed one
+                            limited = True
+                            break
+                        data += chunk
+                else:
+                    # the device limits the request size or the window crosses the end of the register map:
+                    # request shrinking windows and the header alone at once, continue with the largest readable
+                    size = window // 2
+                    while size > 2 and end + size >= Address + 2:
+                        ranges.append((end, size))
+                        size //= 2
+                    ranges.append((Address, 2))
+                    chunks = yield ranges
+                    readable = [i for i in range(len(chunks)) if chunks[i] is not None]
+                    if len(readable) == 0:
+                        return result, message
+                    if readable[0] < len(ranges) - 1:
+                        window = ranges[readable[0]][1]
+                        data += chunks[readable[0]]
+                    else:
+                        start = Address
+                        data = chunks[-1]
+                    limited = False
+                offset = (Address - start) * 2
+            BlockId, Length = struct.unpack_from(">HH", data, offset)
             if Length == 0 or BlockId == 0xffff:
                 # end block reached
                 break
-            result.append(self.SunSpecBlock(BlockId , 0, Address, Length))
+            result.append(SunSpec.SunSpecBlock(BlockId , 0, Address, Length))
             Address += Length + 2
 
-        if(self.__sunspec_blocks_cache.get(Configuration_UnitID) is None):
-            # add block list to cache
-            self.__sunspec_blocks_cache[Configuration_UnitID] = result
-        return result
+        if message is None and start == Base and len(data) >= plan.Registers * 2:
+            message = plan.Unpack(data)
+        return result, message
+
+    # @brief returns the register definitions {offset: (name, type, length)} of a SunSpec block or None if the
+    # model is unknown. If the Length of the block is given and the model has a repeating group (e.g. the modules
+    # of model 160), the definitions cover the fixed points and all repeats of the block, the points of repeat i
+    # are named (i, name), see NestGroups(). Otherwise the definitions of (BlockId, SubBlockId) are returned.
+    # The definitions are built once per model and length.
+    # @param BlockId: ID of the SunSpec block
+    # @param SubBlockId: ID of the sub block
+    # @param Length: length of the block without ID and L (SunSpecBlock.Length)
+    @classmethod
+    def BlockDefinitions(cls, BlockId, SubBlockId = 0, Length = None):
+        key = (BlockId, SubBlockId, Length)
+        definitions = cls.__block_definitions.get(key)
+        if definitions is None:
+            BlockDef = SunSpec_Specification.Specification.get((BlockId, SubBlockId))
+            if BlockDef is None:
+                return None
+            definitions = BlockDef[1]
+            group = SunSpec_Specification.Specification.Group(BlockId)
+            if Length is not None and SubBlockId == 0 and group is not None:
+                # (BlockId, 1) holds the fixed points followed by one repeat
+                points = SunSpec_Specification.Specification[(BlockId, 1)][1]
+                definitions = dict(definitions)
+                for i in range(cls.Repeats(BlockId, Length)):
+                    for offset, (name, type_, size) in points.items():
+                        if offset >= group.FixedLength:
+                            definitions[offset + i * group.RepeatLength] = ((i, name), type_, size)
+            definitions = cls.__block_definitions.setdefault(key, definitions)
+        return definitions
+
+    # @brief returns the number of repeats of the repeating group in a block of the given length
+    # @param BlockId: ID of the SunSpec block
+    # @param Length: length of the block without ID and L (SunSpecBlock.Length)
+    @staticmethod
+    def Repeats(BlockId, Length):
+        group = SunSpec_Specification.Specification.Group(BlockId)
+        if group is None or Length is None:
+            return 0
+        return max(0, (Length + 2 - group.FixedLength) // group.RepeatLength)
+
+    # @brief moves the points of the repeats (named (i, name), see BlockDefinitions()) of a decoded block into a
+    # list of dictionaries under the name of the repeating group, e.g. block["module"][0]["DCA[A]"]. returns Values
+    # @param BlockId: ID of the SunSpec block
+    # @param Values: decoded block or None
+    # @param Length: length of the block without ID and L (SunSpecBlock.Length)
+    @staticmethod
+    def NestGroups(BlockId, Values, Length):
+        group = SunSpec_Specification.Specification.Group(BlockId)
+        if Values is None or group is None or Length is None:
+            return Values
+        repeats = [{} for i in range(SunSpec.Repeats(BlockId, Length))]
+        for key in [key for key in Values if type(key) is tuple]:
+            repeats[key[0]][key[1]] = Values.pop(key)
+        Values[group.Name] = repeats
+        return Values
+
+    # @brief returns the ModbusScale of a SunSpec block (see BlockDefinitions()) or None if the model is unknown.
+    # raises ValueError if the specification has no scale factors for the model (see SunSpec_Models.Scalable())
+    # @param BlockId: ID of the SunSpec block
+    # @param SubBlockId: ID of the sub block
+    # @param Length: length of the block without ID and L (SunSpecBlock.Length)
+    @classmethod
+    def BlockScale(cls, BlockId, SubBlockId = 0, Length = None):
+        BlockDef = cls.BlockDefinitions(BlockId, SubBlockId, Length)
+        if BlockDef is None:
+            return None
+        if not SunSpec_Specification.Specification.Scalable(BlockId):
+            raise ValueError("no scale factors for model %d in %s" % (BlockId, SunSpec_Specification.Specification.Path))
+        if Length is not None and SubBlockId == 0 and SunSpec_Specification.Specification.Group(BlockId) is not None:
+            # the scale factors of the repeats are part of (BlockId, 1)
+            SubBlockId = 1
+        return ModbusScale.Compile(BlockDef, SunSpec_Specification.Specification.ScaleFactors((BlockId, SubBlockId)))
 
-    # @brief reads a SunSpec block for the given UnitId and Address.
+    # @brief reads a SunSpec block for the given UnitId and Address. With the Length of the block the fixed points
+    # and all repeats of a repeating group are read and decoded at once, see BlockDefinitions() and NestGroups().
     # @param UnitId: the unit ID of the SunSpec device
     # @param Address: the address of the SunSpec block
     # @param BlockId: ID of the SunSpec block; specifies the SunSpec specification to use
-    def ReadBlock(self, UnitId, Address, BlockId, SubBlockId = 0):
-        BlockDef = SunSpec_Specification.Specification.get((BlockId, SubBlockId))
+    # @param SubBlockId: ID of the sub block, ignored with Length
+    # @param Length: length of the block without ID and L (SunSpecBlock.Length)
+    # @param Scaled: return engineering values, see ModbusScale
+    # @param Delta: return only the points which changed since the last read, see Modbus.ReadRegisters(). Scaling
+    # needs all points of a block and can't be combined with Delta
+    def ReadBlock(self, UnitId, Address, BlockId, SubBlockId = 0, Length = None, Scaled = False, Delta = False):
+        if Scaled and Delta:
+            raise ValueError("Scaled can't be combined with Delta")
+        if Length is not None:
+            SubBlockId = 0
+        BlockDef = self.BlockDefinitions(BlockId, SubBlockId, Length)
         if BlockDef is None:
             return None
-    #@@@ defblock[0] to be considered
-        return self.ReadRegister(UnitId, Address, BlockDef[1])
-   
+        values = self.ReadRegister(UnitId, Address, BlockDef, Delta)
+        if Scaled:
+            values = self.BlockScale(BlockId, SubBlockId, Length).Apply(values)
+        return self.NestGroups(BlockId, values, Length) if values != {} else values
+
+    # @brief reads several SunSpec blocks with as few requests as possible, see Modbus.ReadRegisters().
+    # returns a list with the decoded blocks (None for unknown or unreadable blocks) in the order of Blocks.
+    # Repeating groups are decoded as by ReadBlock() with the Length of the block.
+    # @param UnitId: the unit ID of the SunSpec device
+    # @param Blocks: list of SunSpecBlock, e.g. the result of SunSpec()
+    # @param Scaled: return engineering values, see ModbusScale
+    # @param Delta: return only the points which changed since the last read, see ReadBlock()
+    def ReadBlocks(self, UnitId, Blocks, Scaled = False, Delta = False):
+        if Scaled and Delta:
+            raise ValueError("Scaled can't be combined with Delta")
+        requests = []
+        for block in Blocks:
+            BlockDef = self.BlockDefinitions(block.BlockId, block.SubBlockId, block.Length if block.SubBlockId == 0 else None)
+            requests.append((block.Address, BlockDef if BlockDef is not None else {}))
+        values = self.ReadRegisters(UnitId, requests, Delta = Delta)
+        return [self.__block_values(block, value, Scaled) for block, value in zip(Blocks, values)]
+
+    # @brief returns the decoded block as returned by ReadBlock() with the Length of the block
+    # @param Block: SunSpecBlock
+    # @param Values: decoded registers of the block
+    # @param Scaled: return engineering values, see ModbusScale
+    def __block_values(self, Block, Values, Scaled):
+        Length = Block.Length if Block.SubBlockId == 0 else None
+        if Scaled and Values is not None:
+            Values = self.BlockScale(Block.BlockId, Block.SubBlockId, Length).Apply(Values)
+        return self.NestGroups(Block.BlockId, Values, Length) if Values != {} else Values
+
 class SolarEdge(SunSpec):
+    # SolarEdge register addresses and definitions (proprietary blocks), see sunspec-implementation-technical-note.pdf
+    SmartMeterAddresses = (40121, 40295, 40469)
+    BatteryAddresses = (0xE100, 0xE200)
+    # unfortunatley the gap between the battery blocks can't be read, so the second block is read separately
+    BatteryStatusOffset = 0x42
+    GridProtectionTripLimitsAddress = 0xF602
+    KnownHoles = ((0xE141, 0xE142), (0xE241, 0xE242))
+    SmartMeterDefinition = {
+        0: ("C_SunSpec_DID", "uint16", 1),
+        1: ("C_SunSpec_Length", "uint16", 1),
+        2: ("C_Manufacturer", "string", 16),
+        18: ("C_Model", "string", 16),
+        34: ("C_Option", "string", 8),
+        42: ("C_Version", "string", 8),
+        50: ("C_SerialNumber", "string", 16),
+        66: ("C_DeviceAddress", "uint16", 1),
+
+        67: ("C_SunSpec_DID", "uint16", 1),
+        68: ("C_SunSpec_Length", "uint16", 1),
+
+        69: ("M_AC_Current", "int16", 1),
+        70: ("M_AC_Current_A", "int16", 1),
+        71: ("M_AC_Current_B", "int16", 1),
+        72: ("M_AC_Current_C", "int16", 1),
+        73: ("M_AC_Current_SF", "sunssf", 1),
+
+        74: ("M_AC_Voltage_L_N", "int16", 1),
+        75: ("M_AC_Voltage_A_N", "int16", 1),
+        76: ("M_AC_Voltage_B_N", "int16", 1),
+        77: ("M_AC_Voltage_C_N", "int16", 1),
+        78: ("M_AC_Voltage_L_N", "int16", 1),
+        79: ("M_AC_Voltage_A_B", "int16", 1),
+        80: ("M_AC_Voltage_B_C", "int16", 1),
+        81: ("M_AC_Voltage_A_C", "int16", 1),
+        82: ("M_AC_Voltage_SF", "sunssf", 1),
+
+        83: ("M_AC_Freq", "int16", 1),
+        84: ("M_AC_Freq_SF", "sunssf", 1),
+
+        85: ("M_AC_Power", "int16", 1),
+        86: ("M_AC_Power_A", "int16", 1),
+        87: ("M_AC_Power_B", "int16", 1),
+        88: ("M_AC_Power_C", "int16", 1),
+        89: ("M_AC_Power_SF", "sunssf", 1),
+
+        90: ("M_AC_VA", "int16", 1),
+        91: ("C_AC_VA_A", "int16", 1),
+        92: ("M_AC_VA_B", "int16", 1),
+        93: ("M_AC_VA_C", "int16", 1),
+        94: ("M_AC_VA_SF", "sunssf", 1),
+
+        95: ("M_AC_VAR", "int16", 1),
+        96: ("M_AC_VAR_A", "int16", 1),
+        97: ("M_AC_VAR_B", "int16", 1),
+        98: ("M_AC_VAR_C", "int16", 1),
+        99: ("M_AC_VAR_SF", "sunssf", 1),
+
+        100: ("M_AC_PF", "int16", 1),
+        101: ("M_AC_PF_A", "int16", 1),
+        102: ("M_AC_PF_B", "int16", 1),
+        103: ("M_AC_PF_C", "int16", 1),
+        104: ("M_AC_PF_SF", "sunssf", 1),
+
+        105: ("M_Exported", "uint32", 2),
+        107: ("M_Exported_A", "uint32", 2),
+        109: ("M_Exported_B", "uint32", 2),
+        111: ("M_Exported_C", "uint32", 2),
+        113: ("M_Imported", "uint32", 2),
+        115: ("M_Imported_A", "uint32", 2),
+        117: ("M_Imported_B", "uint32", 2),
+        119: ("M_Imported_C", "uint32", 2),
+        121: ("M_Energy_WH_SF", "sunssf", 1),
+
+        122: ("M_Exported_VA", "uint32", 2),
+        124: ("M_Exported_VA_A", "uint32", 2),
+        126: ("M_Exported_VA_B", "uint32", 2),
+        128: ("M_Exported_VA_C", "uint32", 2),
+        130: ("M_Imported_VA", "uint32", 2),
+        132: ("M_Imported_VA_A", "uint32", 2),
+        134: ("M_Imported_VA_B", "uint32", 2),
+        136: ("M_Imported_VA_C", "uint32", 2),
+        138: ("M_Energy_VA_SF", "sunssf", 1),
+
+        139: ("M_Import_VARh_Q1", "uint32", 2),
+        141: ("M_Import_VARh_Q1a", "uint32", 2),
+        143: ("M_Import_VARh_Q1b", "uint32", 2),
+        145: ("M_Import_VARh_Q1c", "uint32", 2),
+        147: ("M_Import_VARh_Q2", "uint32", 2),
+        149: ("M_Import_VARh_Q2a", "uint32", 2),
+        151: ("M_Import_VARh_Q2b", "uint32", 2),
+        153: ("M_Import_VARh_Q2c", "uint32", 2),
+        155: ("M_Import_VARh_Q3", "uint32", 2),
+        157: ("M_Import_VARh_Q3a", "uint32", 2),
+        159: ("M_Import_VARh_Q3b", "uint32", 2),
+        161: ("M_Import_VARh_Q3c", "uint32", 2),
+        163: ("M_Import_VARh_Q4", "uint32", 2),
+        165: ("M_Import_VARh_Q4a", "uint32", 2),
+        167: ("M_Import_VARh_Q4b", "uint32", 2),
+        169: ("M_Import_VARh_Q4c", "uint32", 2),
+        171: ("M_Import_VAR_SF", "sunssf", 1),
+        172: ("M_Events", "uint32", 2)
+    }
+    # scale factors of the SmartMeter values
+    SmartMeterScaleFactors = {
+        "M_AC_Current": "M_AC_Current_SF", "M_AC_Current_A": "M_AC_Current_SF", "M_AC_Current_B": "M_AC_Current_SF",
+        "M_AC_Current_C": "M_AC_Current_SF",
+        "M_AC_Voltage_L_N": "M_AC_Voltage_SF", "M_AC_Voltage_A_N": "M_AC_Voltage_SF", "M_AC_Voltage_B_N": "M_AC_Voltage_SF",
+        "M_AC_Voltage_C_N": "M_AC_Voltage_SF", "M_AC_Voltage_A_B": "M_AC_Voltage_SF", "M_AC_Voltage_B_C": "M_AC_Voltage_SF",
+        "M_AC_Voltage_A_C": "M_AC_Voltage_SF",
+        "M_AC_Freq": "M_AC_Freq_SF",
+        "M_AC_Power": "M_AC_Power_SF", "M_AC_Power_A": "M_AC_Power_SF", "M_AC_Power_B": "M_AC_Power_SF",
+        "M_AC_Power_C": "M_AC_Power_SF",
+        "M_AC_VA": "M_AC_VA_SF", "C_AC_VA_A": "M_AC_VA_SF", "M_AC_VA_B": "M_AC_VA_SF", "M_AC_VA_C": "M_AC_VA_SF",
+        "M_AC_VAR": "M_AC_VAR_SF", "M_AC_VAR_A": "M_AC_VAR_SF", "M_AC_VAR_B": "M_AC_VAR_SF", "M_AC_VAR_C": "M_AC_VAR_SF",
+        "M_AC_PF": "M_AC_PF_SF", "M_AC_PF_A": "M_AC_PF_SF", "M_AC_PF_B": "M_AC_PF_SF", "M_AC_PF_C": "M_AC_PF_SF",
+        "M_Exported": "M_Energy_WH_SF", "M_Exported_A": "M_Energy_WH_SF", "M_Exported_B": "M_Energy_WH_SF",
+        "M_Exported_C": "M_Energy_WH_SF", "M_Imported": "M_Energy_WH_SF", "M_Imported_A": "M_Energy_WH_SF",
+        "M_Imported_B": "M_Energy_WH_SF", "M_Imported_C": "M_Energy_WH_SF",
+        "M_Exported_VA": "M_Energy_VA_SF", "M_Exported_VA_A": "M_Energy_VA_SF", "M_Exported_VA_B": "M_Energy_VA_SF",
+        "M_Exported_VA_C": "M_Energy_VA_SF", "M_Imported_VA": "M_Energy_VA_SF", "M_Imported_VA_A": "M_Energy_VA_SF",
+        "M_Imported_VA_B": "M_Energy_VA_SF", "M_Imported_VA_C": "M_Energy_VA_SF",
+        "M_Import_VARh_Q1": "M_Import_VAR_SF", "M_Import_VARh_Q1a": "M_Import_VAR_SF", "M_Import_VARh_Q1b": "M_Import_VAR_SF",
+        "M_Import_VARh_Q1c": "M_Import_VAR_SF", "M_Import_VARh_Q2": "M_Import_VAR_SF", "M_Import_VARh_Q2a": "M_Import_VAR_SF",
+        "M_Import_VARh_Q2b": "M_Import_VAR_SF", "M_Import_VARh_Q2c": "M_Import_VAR_SF", "M_Import_VARh_Q3": "M_Import_VAR_SF",
+        "M_Import_VARh_Q3a": "M_Import_VAR_SF", "M_Import_VARh_Q3b": "M_Import_VAR_SF", "M_Import_VARh_Q3c": "M_Import_VAR_SF",
+        "M_Import_VARh_Q4": "M_Import_VAR_SF", "M_Import_VARh_Q4a": "M_Import_VAR_SF", "M_Import_VARh_Q4b": "M_Import_VAR_SF",
+        "M_Import_VARh_Q4c": "M_Import_VAR_SF",
+    }
+    BatteryInfoDefinition = {
+        0: ("C_Manufacturer", "string", 16),
+        16: ("C_Model", "string", 16),
+        32: ("C_Version", "string", 16),
+        44: ("C_SerialNumber", "string", 16),
+        64: ("C_DeviceAddress", "uint16", 1),
+    }
+    BatteryStatusDefinition = {
+        0: ("RatedEnergy", "float32", 2),
+        2: ("MaxChargeContinuesPower", "float32", 2),
+        4: ("MaxDischargeContinuesPower", "float32", 2),
+        6: ("MaxChargePeakPower", "float32", 2),
+        8: ("MaxDischargePeakPower", "float32", 2),
+        10: ("Reserved", "pad", 32),
+        42: ("AverageTemperature", "float32", 2),
+        44: ("MaxTemperature", "float32", 2),
+        46: ("InstantaneousVoltage", "float32", 2),
+        48: ("InstantaneousCurrent", "float32", 2),
+        50: ("InstantaneousPower", "float32", 2),
+        52: ("LifetimeExportEnergyCounter", "uint64", 4),
+        56: ("LifetimeImportEnergyCounter", "uint64", 4),
+        60: ("MaxEnergy", "float32", 2),
+        62: ("AvailableEngergy", "float32", 2),
+        64: ("StateOfHealth", "float32", 2),
+        66: ("StateOfEnergy", "float32", 2),
+        68: ("Status", "uint32", 2),
+        70: ("StatusInternal", "uint32", 2),
+        72: ("EventLog", "8unit16", 8),
+        80: ("EventLogInternal0", "uint16", 8)
+    }
+    GridProtectionTripLimitsDefinition = {
+        0: ("VgMax1", "float32", 2),
+        2: ("VgMax1_HoldTime", "uint32", 2),
+        4: ("VgMax2", "float32", 2),
+        6: ("VgMax2_HoldTime", "uint32", 2),
+        8: ("VgMax3", "float32", 2),
+        10: ("VgMax3_HoldTime", "uint32", 2),
+        12: ("VgMax4", "float32", 2),
+        14: ("VgMax4_HoldTime", "uint32", 2),
+        16: ("VgMax5", "float32", 2),
+        18: ("VgMax5_HoldTime", "uint32", 2),
+        20: ("VgMin1", "float32", 2),
+        22: ("VgMin1_HoldTime", "uint32", 2),
+        24: ("VgMin2", "float32", 2),
+        26: ("VgMin2_HoldTime", "uint32", 2),
+        28: ("VgMin3", "float32", 2),
+        30: ("VgMin3_HoldTime", "uint32", 2),
+        32: ("VgMin4", "float32", 2),
+        34: ("VgMin4_HoldTime", "uint32", 2),
+        36: ("VgMin5", "float32", 2),
+        38: ("VgMin5_HoldTime", "uint32", 2),
+        40: ("FgMax1", "float32", 2),
+        42: ("FgMax1_HoldTime", "uint32", 2),
+        44: ("FgMax2", "float32", 2),
+        46: ("FgMax2_HoldTime", "uint32", 2),
+        48: ("FgMax3", "float32", 2),
+        50: ("FgMax3_HoldTime", "uint32", 2),
+        52: ("FgMax4", "float32", 2),
+        54: ("FgMax4_HoldTime", "uint32", 2),
+        56: ("FgMax5", "float32", 2),
+        58: ("FgMax5_HoldTime", "uint32", 2),
+        60: ("FgMin1", "float32", 2),
+        62: ("FgMin1_HoldTime", "uint32", 2),
+        64: ("FgMin2", "float32", 2),
+        66: ("FgMin2_HoldTime", "uint32", 2),
+        68: ("FgMin3", "float32", 2),
+        70: ("FgMin3_HoldTime", "uint32", 2),
+        72: ("FgMin4", "float32", 2),
+        74: ("FgMin4_HoldTime", "uint32", 2),
+        76: ("FgMin5", "float32", 2),
+        78: ("FgMin5_HoldTime", "uint32", 2),
+        80: ("GRM_Time", "uint32", 2),
+    }
+    # export limitation and active power limit (power control), written by WriteRegister()
+    ExportControlAddress = 0xE000
+    ExportControlDefinition = {
+        0: ("ExportControlMode", "uint16", 1),
+        1: ("ExportControlLimitMode", "uint16", 1),
+        2: ("ExportControlSiteLimit", "float32", 2),
+    }
+    ExportSiteLimitAddress = 0xE002
+    ExportSiteLimitDefinition = {
+        0: ("ExportControlSiteLimit", "float32", 2),
+    }
+    ActivePowerLimitAddress = 0xF001
+    ActivePowerLimitDefinition = {
+        0: ("ActivePowerLimit", "uint16", 1),
+    }
+
     # @brief reads the SolarEdge SmartMeter data for the given UnitId and SmartMeterId.
     # @param UnitId: the unit ID of the SolarEdge device
     # @apram SmartMeterId: 1, 2 or 3
-    def SmartMeter(self, UnitId, SmartMeterId):
+    # @param Scaled: return engineering values, see ModbusScale
+    def SmartMeter(self, UnitId, SmartMeterId, Scaled = False):
         if SmartMeterId < 1 or SmartMeterId > 3:
             return None
-        Address = (40121, 40295, 40469)[SmartMeterId - 1]
+        Address = self.SmartMeterAddresses[SmartMeterId - 1]
    
-        block = self.ReadRegister(UnitId, Address, 
-            {0: ("C_SunSpec_DID", "uint16", 1),
-            1: ("C_SunSpec_Length", "uint16", 1),
-            2: ("C_Manufacturer", "string", 16),
-            18: ("C_Model", "string", 16),
-            34: ("C_Option", "string", 8),
-            42: ("C_Version", "string", 8),
-            50: ("C_SerialNumber", "string", 16),
-            66: ("C_DeviceAddress", "uint16", 1),
-
-            67: ("C_SunSpec_DID", "uint16", 1),
-            68: ("C_SunSpec_Length", "uint16", 1),
-             
-            69: ("M_AC_Current", "int16", 1),
-            70: ("M_AC_Current_A", "int16", 1),
-            71: ("M_AC_Current_B", "int16", 1),
-            72: ("M_AC_Current_C", "int16", 1),
-            73: ("M_AC_Current_SF", "sunssf", 1),
-             
-            74: ("M_AC_Voltage_L_N", "int16", 1),
-            75: ("M_AC_Voltage_A_N", "int16", 1),
-            76: ("M_AC_Voltage_B_N", "int16", 1),
-            77: ("M_AC_Voltage_C_N", "int16", 1),
-            78: ("M_AC_Voltage_L_N", "int16", 1),
-            79: ("M_AC_Voltage_A_B", "int16", 1),
-            80: ("M_AC_Voltage_B_C", "int16", 1),
-            81: ("M_AC_Voltage_A_C", "int16", 1),
-            82: ("M_AC_Voltage_SF", "sunssf", 1),
-             
-            83: ("M_AC_Freq", "int16", 1),
-            84: ("M_AC_Freq_SF", "sunssf", 1),
-             
-            85: ("M_AC_Power", "int16", 1),
-            86: ("M_AC_Power_A", "int16", 1),
-            87: ("M_AC_Power_B", "int16", 1),
-            88: ("M_AC_Power_C", "int16", 1),
-            89: ("M_AC_Power_SF", "sunssf", 1),
-             
-            90: ("M_AC_VA", "int16", 1),
-            91: ("C_AC_VA_A", "int16", 1),
-            92: ("M_AC_VA_B", "int16", 1),
-            93: ("M_AC_VA_C", "int16", 1),
-            94: ("M_AC_VA_SF", "sunssf", 1),
-             
-            95: ("M_AC_VAR", "int16", 1),
-            96: ("M_AC_VAR_A", "int16", 1),
-            97: ("M_AC_VAR_B", "int16", 1),
-            98: ("M_AC_VAR_C", "int16", 1),
-            99: ("M_AC_VAR_SF", "sunssf", 1),
-             
-            100: ("M_AC_PF", "int16", 1),
-            101: ("M_AC_PF_A", "int16", 1),
-            102: ("M_AC_PF_B", "int16", 1),
-            103: ("M_AC_PF_C", "int16", 1),
-            104: ("M_AC_PF_SF", "sunssf", 1),
-            
-            105: ("M_Exported", "uint32", 2),
-            107: ("M_Exported_A", "uint32", 2),
-            109: ("M_Exported_B", "uint32", 2),
-            111: ("M_Exported_C", "uint32", 2),
-            113: ("M_Imported", "uint32", 2),
-            115: ("M_Imported_A", "uint32", 2),
-            117: ("M_Imported_B", "uint32", 2),
-            119: ("M_Imported_C", "uint32", 2),
-            121: ("M_Energy_WH_SF", "sunssf", 1),
-             
-            122: ("M_Exported_VA", "uint32", 2),
-            124: ("M_Exported_VA_A", "uint32", 2),
-            126: ("M_Exported_VA_B", "uint32", 2),
-            128: ("M_Exported_VA_C", "uint32", 2),
-            130: ("M_Imported_VA", "uint32", 2),
-            132: ("M_Imported_VA_A", "uint32", 2),
-            134: ("M_Imported_VA_B", "uint32", 2),
-            136: ("M_Imported_VA_C", "uint32", 2),
-            138: ("M_Energy_VA_SF", "sunssf", 1),
-             
-            139: ("M_Import_VARh_Q1", "uint32", 2),
-            141: ("M_Import_VARh_Q1a", "uint32", 2),
-            143: ("M_Import_VARh_Q1b", "uint32", 2),
-            145: ("M_Import_VARh_Q1c", "uint32", 2),
-            147: ("M_Import_VARh_Q2", "uint32", 2),
-            149: ("M_Import_VARh_Q2a", "uint32", 2),
-            151: ("M_Import_VARh_Q2b", "uint32", 2),
-            153: ("M_Import_VARh_Q2c", "uint32", 2),
-            155: ("M_Import_VARh_Q3", "uint32", 2),
-            157: ("M_Import_VARh_Q3a", "uint32", 2),
-            159: ("M_Import_VARh_Q3b", "uint32", 2),
-            161: ("M_Import_VARh_Q3c", "uint32", 2),
-            163: ("M_Import_VARh_Q4", "uint32", 2),
-            165: ("M_Import_VARh_Q4a", "uint32", 2),
-            167: ("M_Import_VARh_Q4b", "uint32", 2),
-            169: ("M_Import_VARh_Q4c", "uint32", 2),
-            171: ("M_Import_VAR_SF", "sunssf", 1),
-            172: ("M_Events", "uint32", 2)})
-        if block["C_Manufacturer"] == "":
+        block = self.ReadRegister(UnitId, Address, self.SmartMeterDefinition)
+        if block is None or block.get("C_Manufacturer", "") == "":
             return None
+        if Scaled:
+            block = ModbusScale.Compile(self.SmartMeterDefinition, self.SmartMeterScaleFactors).Apply(block)
         return block
      
     # @brief reads the SolarEdge Battery data for the given UnitId and BatteryId.
@@ -450,93 +1828,90 @@ class SolarEdge(SunSpec):
     def Battery(self, UnitId, BatteryId):
         if BatteryId < 1 or BatteryId > 2:
             return None
-        Address = (0xE100, 0xE200)[BatteryId - 1]
-
-        block1 = self.ReadRegister(UnitId, Address, 
-            {
-            0: ("C_Manufacturer", "string", 16),
-            16: ("C_Model", "string", 16),
-            32: ("C_Version", "string", 16),
-            44: ("C_SerialNumber", "string", 16),
-            64: ("C_DeviceAddress", "uint16", 1),
-            })
-        if block1["C_Manufacturer"] == "":
+        Address = self.BatteryAddresses[BatteryId - 1]
+
+        block1 = self.ReadRegister(UnitId, Address, self.BatteryInfoDefinition)
+        if block1 is None or block1.get("C_Manufacturer", "") == "":
             return None
         # unfortunatley the gap between the blocks can't be read, so we have to read the second 
         # block separately
-        block2 = self.ReadRegister(UnitId, Address + 0x42,
-            {
-              0: ("RatedEnergy", "float32", 2),
-              2: ("MaxChargeContinuesPower", "float32", 2),
-              4: ("MaxDischargeContinuesPower", "float32", 2),
-              6: ("MaxChargePeakPower", "float32", 2),
-              8: ("MaxDischargePeakPower", "float32", 2),
-              10: ("Reserved", "pad", 32),
-              42: ("AverageTemperature", "float32", 2),
-              44: ("MaxTemperature", "float32", 2),
-              46: ("InstantaneousVoltage", "float32", 2),
-              48: ("InstantaneousCurrent", "float32", 2),
-              50: ("InstantaneousPower", "float32", 2),
-              52: ("LifetimeExportEnergyCounter", "uint64", 4),
-              56: ("LifetimeImportEnergyCounter", "uint64", 4),
-              60: ("MaxEnergy", "float32", 2),
-              62: ("AvailableEngergy", "float32", 2),
-              64: ("StateOfHealth", "float32", 2),
-              66: ("StateOfEnergy", "float32", 2),
-              68: ("Status", "uint32", 2),
-              70: ("StatusInternal", "uint32", 2),
-              72: ("EventLog", "8unit16", 8),
-              80: ("EventLogInternal0", "uint16", 8)
-            }) 
+        block2 = self.ReadRegister(UnitId, Address + self.BatteryStatusOffset, self.BatteryStatusDefinition)
+        if block2 is None:
+            return None
         return block1 | block2
 
     # @brief reads the SolarEdge Grid Protection Trip Limits data for the given UnitId.
     # @param UnitId: the unit ID of the SolarEdge device
-    def GridProtectionTripLimits(self, UnitId):
-        Address = 0xF602
-        block = self.ReadRegister(UnitId, Address, 
-            {
-                0: ("VgMax1", "float32", 2),
-                2: ("VgMax1_HoldTime", "uint32", 2),
-                4: ("VgMax2", "float32", 2),
-                6: ("VgMax2_HoldTime", "uint32", 2),
-                8: ("VgMax3", "float32", 2),
-                10: ("VgMax3_HoldTime", "uint32", 2),
-                12: ("VgMax4", "float32", 2),
-                14: ("VgMax4_HoldTime", "uint32", 2),
-                16: ("VgMax5", "float32", 2),
-                18: ("VgMax5_HoldTime", "uint32", 2),
-                20: ("VgMin1", "float32", 2),
-                22: ("VgMin1_HoldTime", "uint32", 2),
-                24: ("VgMin2", "float32", 2),
-                26: ("VgMin2_HoldTime", "uint32", 2),
-                28: ("VgMin3", "float32", 2),
-                30: ("VgMin3_HoldTime", "uint32", 2),
-                32: ("VgMin4", "float32", 2),
-                34: ("VgMin4_HoldTime", "uint32", 2),
-                36: ("VgMin5", "float32", 2),
-                38: ("VgMin5_HoldTime", "uint32", 2),
-                40: ("FgMax1", "float32", 2),
-                42: ("FgMax1_HoldTime", "uint32", 2),
-                44: ("FgMax2", "float32", 2),
-                46: ("FgMax2_HoldTime", "uint32", 2),
-                48: ("FgMax3", "float32", 2),
-                50: ("FgMax3_HoldTime", "uint32", 2),
-                52: ("FgMax4", "float32", 2),
-                54: ("FgMax4_HoldTime", "uint32", 2),
-                56: ("FgMax5", "float32", 2),
-                58: ("FgMax5_HoldTime", "uint32", 2),
-                60: ("FgMin1", "float32", 2),
-                62: ("FgMin1_HoldTime", "uint32", 2),
-                64: ("FgMin2", "float32", 2),
-                66: ("FgMin2_HoldTime", "uint32", 2),
-                68: ("FgMin3", "float32", 2),
-                70: ("FgMin3_HoldTime", "uint32", 2),
-                72: ("FgMin4", "float32", 2),
-                74: ("FgMin4_HoldTime", "uint32", 2),
-                76: ("FgMin5", "float32", 2),
-                78: ("FgMin5_HoldTime", "uint32", 2),
-                80: ("GRM_Time", "uint32", 2),
-            }
-        )
+    # @param Delta: return only the limits which changed since the last read, see Modbus.ReadRegisters()
+    def GridProtectionTripLimits(self, UnitId, Delta = False):
+        Address = self.GridProtectionTripLimitsAddress
+        block = self.ReadRegister(UnitId, Address, self.GridProtectionTripLimitsDefinition, Delta)
         return block
+
+    # @brief reads the export limitation settings (mode, limit mode, site limit in W) of the given UnitId.
+    # @param UnitId: the unit ID of the SolarEdge device
+    def ExportControl(self, UnitId):
+        return self.ReadRegister(UnitId, self.ExportControlAddress, self.ExportControlDefinition)
+
+    # @brief sets the export limit of the site. returns True if the inverter acknowledged it
+    # @param UnitId: the unit ID of the SolarEdge device
+    # @param Limit: site export limit in W
+    def SetExportLimit(self, UnitId, Limit):
+        return self.WriteRegister(UnitId, self.ExportSiteLimitAddress, self.ExportSiteLimitDefinition,
+            {"ExportControlSiteLimit": Limit})
+
+    # @brief sets the active power limit of the inverter. returns True if the inverter acknowledged it
+    # @param UnitId: the unit ID of the SolarEdge device
+    # @param Limit: active power limit in % of the nominal power (0 .. 100)
+    def SetActivePowerLimit(self, UnitId, Limit):
+        return self.WriteRegister(UnitId, self.ActivePowerLimitAddress, self.ActivePowerLimitDefinition,
+            {"ActivePowerLimit": Limit})
+
+    # @brief reads the SunSpec blocks and the SolarEdge SmartMeters, Batteries and Grid Protection Trip Limits of
+    # the unit in one go. The blocks are coalesced into as few requests as possible (see Modbus.ReadRegisters()),
+    # a full poll of an inverter with meters and batteries takes a handful of requests. returns a dictionary
+    # {"SunSpec": [blocks], "SmartMeter": {id: block}, "Battery": {id: block}, "GridProtectionTripLimits": block}
+    # with the same results as ReadBlock(), SmartMeter(), Battery() and GridProtectionTripLimits()
+    # @param UnitId: the unit ID of the SolarEdge device
+    # @param Blocks: list of SunSpecBlock, e.g. the result of SunSpec()
+    # @param SmartMeters: IDs of the SmartMeters (1, 2, 3)
+    # @param Batteries: IDs of the Batteries (1, 2)
+    # @param TripLimits: read the Grid Protection Trip Limits
+    # @param Scaled: return engineering values for the SunSpec blocks and the SmartMeters, see ModbusScale
+    # @param Delta: return only the values which changed since the last poll (see Modbus.ReadRegisters()), an
+    # unchanged block is an empty dictionary. Can't be combined with Scaled
+    def Poll(self, UnitId, Blocks = (), SmartMeters = (), Batteries = (), TripLimits = False, Scaled = False, Delta = False):
+        if Scaled and Delta:
+            raise ValueError("Scaled can't be combined with Delta")
+        requests = []
+        for block in Blocks:
+            BlockDef = self.BlockDefinitions(block.BlockId, block.SubBlockId, block.Length if block.SubBlockId == 0 else None)
+            requests.append((block.Address, BlockDef if BlockDef is not None else {}))
+        for SmartMeterId in SmartMeters:
+            requests.append((self.SmartMeterAddresses[SmartMeterId - 1], self.SmartMeterDefinition))
+        for BatteryId in Batteries:
+            Address = self.BatteryAddresses[BatteryId - 1]
+            requests.append((Address, self.BatteryInfoDefinition))
+            requests.append((Address + self.BatteryStatusOffset, self.BatteryStatusDefinition))
+        if TripLimits:
+            requests.append((self.GridProtectionTripLimitsAddress, self.GridProtectionTripLimitsDefinition))
+        values = iter(self.ReadRegisters(UnitId, requests, Delta = Delta))
+
+        result = {"SunSpec": [self._SunSpec__block_values(block, next(values), Scaled) for block in Blocks],
+            "SmartMeter": {}, "Battery": {}}
+        for SmartMeterId in SmartMeters:
+            block = next(values)
+            # with Delta an unchanged manufacturer is missing
+            valid = block is not None and block.get("C_Manufacturer", "" if not Delta else None) != ""
+            if valid and Scaled:
+                block = ModbusScale.Compile(self.SmartMeterDefinition, self.SmartMeterScaleFactors).Apply(block)
+            result["SmartMeter"][SmartMeterId] = block if valid else None
+        for BatteryId in Batteries:
+            block1 = next(values)
+            block2 = next(values)
+            valid = block1 is not None and block2 is not None and block1.get("C_Manufacturer", "" if not Delta else None) != ""
+            result["Battery"][BatteryId] = block1 | block2 if valid else None
+        if TripLimits:
+            result["GridProtectionTripLimits"] = next(values)
+        return result
+
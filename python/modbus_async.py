@@ -0,0 +1,497 @@
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+
+import asyncio
+import struct
+import time
+from modbus import Modbus, ModbusPlan, ModbusReadPlan, ModbusScale, SunSpec, SolarEdge
+from modbus_capture import REQUEST, RESPONSE
+from modbus_holes import ModbusHoleMap
+from modbus_limits import ModbusLimits
+from sunspec_specification import SunSpec_Specification
+
+# asyncio counterparts of Modbus, SunSpec and SolarEdge. The register definitions and the decode plans are
+# shared with the blocking classes, only the transport is built on asyncio streams so a single event loop can
+# poll many devices concurrently.
+#
+#   tcpmodbus = modbus_async.AsyncSolarEdge()
+#   await tcpmodbus.tcp_connect("wechselrichter1", 1502, 1)
+#   print(await tcpmodbus.SmartMeter(1, 1))
+#   await tcpmodbus.tcp_close()
+
+class AsyncModbus:
+    # MBAP header followed by the function code and the byte count (exception code) of a response
+    __mbap_response = struct.Struct(">HHHBBB")
+    # MBAP header followed by a read register request
+    __mbap_read_request = struct.Struct(">HHHBBHH")
+    # default number of requests in flight per connection
+    Window = 4
+    # instrumentation hooks, see modbus.Modbus.Hooks
+    Hooks = ()
+    # capture of the request and response frames, see modbus.Modbus.Capture
+    Capture = None
+    # unreadable register ranges known and learned per device type, see modbus.Modbus.KnownHoles and HoleMap
+    KnownHoles = ()
+    HoleMap = ModbusHoleMap()
+    LearnHoles = True
+    # request size limits learned per device, see modbus.Modbus.Limits
+    Limits = ModbusLimits()
+    AdaptLimits = True
+    # retries of a failed chunk and the time budget of a read, see modbus.Modbus.Retries
+    Retries = 1
+    Deadline = None
+
+    # @brief receives the response frames and resolves the pending requests by their message ID.
+    # runs as a task for the lifetime of the connection.
+    async def __receive(self):
+        try:
+            while True:
+                header = await self.__reader.readexactly(self.__mbap_response.size)
+                messageId, protocolId, messageLength, unitId, functionCode, dataLength = self.__mbap_response.unpack(header)
+                if messageLength < 3:
+                    raise ConnectionError("invalid MBAP header")
+                data = await self.__reader.readexactly(messageLength - 3) if messageLength > 3 else b""
+                if self.__capture is not None:
+                    self.__capture.Write(self.__device, RESPONSE, header + data, self.__connection)
+                request = self.__pending.pop(messageId, None)
+                if request is None or request[0].done():
+                    # late response of an abandoned request
+                    continue
+                future, UnitId, Length = request
+                if protocolId == 0 and unitId == UnitId and functionCode == 0x83 and len(data) == 0:
+                    # exception response, the exception code takes the place of the byte count
+                    future.set_result(dataLength)
+                elif protocolId != 0 or unitId != UnitId or functionCode != 3 or dataLength != Length * 2 \
+                        or len(data) != dataLength:
+                    future.set_result(None)
+                else:
+                    future.set_result(data)
+        except (asyncio.IncompleteReadError, ConnectionError, OSError) as e:
+            if isinstance(e, asyncio.IncompleteReadError):
+                e = ConnectionError("connection closed by the device")
+            for future, UnitId, Length in self.__pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            self.__pending.clear()
+
+    # @brief sends one read register request and waits for its response. returns the register data (bytes), the
+    # exception code (int) of an exception response or None if the device didn't answer with a matching response.
+    # @param UnitId: unit ID (uint8)
+    # @param Address: register address (uint16)
+    # @param Length: number of registers (uint16)
+    async def __read_register(self, UnitId, Address, Length):
+        async with self.__window:
+            if self.__receiver.done():
+                raise ConnectionError("connection closed by the device")
+            messageId = self.__message_id
+            while messageId in self.__pending:
+                messageId = (messageId + 1) & 0xffff
+            self.__message_id = (messageId + 1) & 0xffff
+            future = asyncio.get_running_loop().create_future()
+            self.__pending[messageId] = (future, UnitId, Length)
+            request = self.__mbap_read_request.pack(messageId, 0, 6, UnitId, 3, Address, Length)
+            if self.__capture is not None:
+                self.__capture.Write(self.__device, REQUEST, request, self.__connection)
+            if not self.Hooks:
+                try:
+                    self.__writer.write(request)
+                    return await asyncio.wait_for(future, self.__timeout)
+                finally:
+                    if self.__pending.get(messageId, (None,))[0] is future:
+                        del self.__pending[messageId]
+            sent = time.perf_counter()
+            data = None
+            error = None
+            try:
+                self.__writer.write(request)
+                for hook in self.Hooks:
+                    hook.Request(self, self.__device, UnitId, 3, self.__mbap_read_request.size)
+                data = await asyncio.wait_for(future, self.__timeout)
+                return data
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                if self.__pending.get(messageId, (None,))[0] is future:
+                    del self.__pending[messageId]
+                code = data if type(data) is int else None
+                received = self.__mbap_response.size + (len(data) if code is None else 0) if data is not None else 0
+                for hook in self.Hooks:
+                    hook.Response(self, self.__device, UnitId, 3, time.perf_counter() - sent, received, code, error)
+
+    # @brief reads a chunk, requests it again after a timeout, an invalid or a "busy" response up to Retries times
+    # while the deadline isn't over. Other exception responses are final. returns the register data (bytes), the
+    # exception code (int) or None, see __read_register()
+    # @param Deadline: time (loop clock) no retry is started after, None for no limit
+    async def __read_chunk(self, UnitId, Address, Length, Deadline):
+        attempt = 0
+        while True:
+            try:
+                data = await self.__read_register(UnitId, Address, Length)
+            except asyncio.TimeoutError:
+                data = None
+                if attempt >= self.Retries or (Deadline is not None and asyncio.get_running_loop().time() >= Deadline):
+                    raise
+            if type(data) is bytes or (data is not None and data != Modbus.ServerDeviceBusy) or attempt >= self.Retries \
+                    or (Deadline is not None and asyncio.get_running_loop().time() >= Deadline):
+                return data
+            attempt += 1
+
+    # @brief locates the unreadable registers within the range by bisecting it, see Modbus.__probe(). The halves
+    # of all failing ranges are requested concurrently. returns the unreadable registers [(first, end)]
+    # @param UnitId: the unit ID of the device
+    # @param Address: first register of the range failing with "illegal data address"
+    # @param Count: number of registers of the range
+    async def __probe(self, UnitId, Address, Count):
+        holes = []
+        failing = [(Address, Count)]
+        while len(failing) > 0:
+            ranges = []
+            for address, count in failing:
+                if count == 1:
+                    holes.append((address, address + 1))
+                    continue
+                half = count // 2
+                ranges += [(address, half), (address + half, count - half)]
+            chunks = await asyncio.gather(*[self.__read_register(UnitId, address, count) for address, count in ranges])
+            failing = [ranges[i] for i in range(len(ranges)) if chunks[i] == Modbus.IllegalDataAddress]
+        return holes
+
+    # @brief Reads a registers from the device defined by the definition. returns a dictionary with the labels
+    # as keys and the register values as values. The chunks (up to the number of registers the device accepts,
+    # see Limits) are requested concurrently, up to Window requests are in flight on the connection. Known
+    # unreadable holes (see Holes()) are not requested, the fields within them are missing in the result. Chunks
+    # failing with "illegal data address" are bisected to learn the holes of the device type (see HoleMap),
+    # chunks rejected for their size shrink the limit of the device. The registers are then requested again,
+    # see Modbus.ReadRegisters(). Failed chunks are requested again, see Retries.
+    # @param UnitId: the unit ID of the device
+    # @param Address: the address of the register to read
+    # @param Definitions: register definition {offset: (name, type, length)}
+    # @param Delta: return only the values which changed since the last read, see Modbus.ReadRegisters()
+    async def ReadRegister(self, UnitId, Address, Definitions, Delta = False):
+        start = time.perf_counter() if self.Hooks else None
+        # if the format is empty, return None
+        if ModbusPlan.Compile(Definitions).Registers == 0:
+            return None
+        limits = "%s:%d/%d" % (self.Peer + (UnitId,)) if self.AdaptLimits else None
+        deadline = asyncio.get_running_loop().time() + self.Deadline if self.Deadline is not None else None
+        retry = True
+        while True:
+            size = self.Limits.Registers(limits) if limits is not None else ModbusLimits.MaxRegisters
+            plan = ModbusReadPlan([(Address, Definitions)], 0, self.Holes(UnitId), size)
+            try:
+                chunks = await asyncio.gather(*[self.__read_chunk(UnitId, address, count, deadline)
+                    for address, count, offset in plan.Ranges])
+            except asyncio.TimeoutError:
+                if limits is not None:
+                    self.Limits.Timeout(limits, max((count for address, count, offset in plan.Ranges), default = 0))
+                raise
+            if not retry:
+                break
+            learned = []
+            rejected = []
+            for (address, count, offset), chunk in zip(plan.Ranges, chunks):
+                if chunk == Modbus.IllegalDataAddress and self.LearnHoles:
+                    holes = await self.__probe(UnitId, address, count)
+                    if len(holes) == 0 and count > 1:
+                        # all registers are readable in smaller requests
+                        rejected.append(count)
+                    learned += holes
+                elif chunk == Modbus.IllegalDataValue and count > 1:
+                    rejected.append(count)
+            if len(learned) > 0:
+                self.HoleMap.Add(self.DeviceKey(UnitId), learned)
+            adapted = limits is not None and len(rejected) > 0
+            if adapted:
+                self.Limits.Rejected(limits, min(rejected))
+            if len(learned) == 0 and not adapted:
+                break
+            # read again, adapting further while the limit shrinks
+            retry = adapted and self.Limits.Registers(limits) < size
+        block, offset, first, last, masked = plan.Blocks[0]
+        if last < first or not all(type(chunk) is bytes for chunk in chunks):
+            return None
+        if limits is not None:
+            self.Limits.Success(limits, max(count for address, count, offset in plan.Ranges))
+        buffer = bytearray(plan.Size)
+        for (address, count, position), chunk in zip(plan.Ranges, chunks):
+            buffer[position:position + count * 2] = chunk
+        decoding = time.perf_counter() if start is not None else None
+        values = self.__unpack(UnitId, Address, Definitions, bytes(buffer[offset:offset + block.Size]), Delta)
+        for name in masked:
+            values.pop(name, None)
+        if start is None:
+            return values
+        end = time.perf_counter()
+        for hook in self.Hooks:
+            hook.Decode(self, self.__device, UnitId, 1, len(values), end - decoding)
+            hook.Read(self, self.__device, UnitId, 1, len(chunks), end - start)
+        return values
+
+    # @brief decodes the registers of a read, see ReadRegister()
+    # @param Message: the registers of the block
+    def __unpack(self, UnitId, Address, Definitions, Message, Delta):
+        plan = ModbusPlan.Compile(Definitions)
+        if not Delta:
+            return plan.Unpack(Message)
+        # the entry keeps the definitions alive so their id in the key can't be reused
+        key = (UnitId, Address, id(Definitions))
+        entry = self.__delta.get(key)
+        previous = entry[1] if entry is not None and entry[0] is Definitions else None
+        values = plan.Unpack(Message, 0, previous)
+        if values is not None and (len(values) > 0 or previous is None):
+            if len(self.__delta) >= 4096 and key not in self.__delta:
+                self.__delta.clear()
+            self.__delta[key] = (Definitions, Message[:plan.Size])
+        return values
+
+    # @brief forgets the registers kept for Delta reads, see Modbus.ResetDelta()
+    # @param UnitId: the unit ID of the device, None for all units
+    def ResetDelta(self, UnitId = None):
+        for key in [key for key in self.__delta if UnitId is None or key[0] == UnitId]:
+            self.__delta.pop(key, None)
+
+    # @brief Reads the register ranges of the unit concurrently without decoding them, see Modbus.ReadRaw()
+    # @param UnitId: the unit ID of the device
+    # @param Ranges: list of (Address, Count), Count up to ModbusReadPlan.MaxRegisters
+    async def ReadRaw(self, UnitId, Ranges):
+        chunks = await asyncio.gather(*[self.__read_register(UnitId, address, count) for address, count in Ranges])
+        return [chunk if type(chunk) is bytes else None for chunk in chunks]
+
+    # @brief returns the key identifying the type of the device, see Modbus.DeviceKey()
+    # @param UnitId: the unit ID of the device
+    def DeviceKey(self, UnitId):
+        key = self.__device_keys.get(UnitId)
+        if key is None:
+            key = "%s:%d/%d" % (self.Peer + (UnitId,))
+        return key
+
+    # @brief sets the key identifying the type of the device, see Modbus.SetDeviceKey()
+    # @param UnitId: the unit ID of the device
+    # @param Key: e.g. "manufacturer/model/version"
+    def SetDeviceKey(self, UnitId, Key):
+        self.__device_keys[UnitId] = Key
+
+    # @brief returns the unreadable register ranges [(first, end)] of the unit, see Modbus.Holes()
+    # @param UnitId: the unit ID of the device
+    def Holes(self, UnitId):
+        return self.KnownHoles + self.HoleMap.Get(self.DeviceKey(UnitId))
+
+    # @brief connect to the given IP and port
+    # @param ip: the IP address of the device
+    # @param port: the port of the device
+    # @param timeout: the timeout in seconds for connecting and for each request
+    # @param window: maximum number of requests in flight (defaults to AsyncModbus.Window)
+    async def tcp_connect(self, ip, port, timeout, window = None):
+        self.__device = "%s:%d" % (ip, port)
+        start = time.perf_counter()
+        try:
+            self.__reader, self.__writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout)
+        except BaseException as e:
+            for hook in self.Hooks:
+                hook.Connect(self, self.__device, time.perf_counter() - start, e)
+            raise
+        for hook in self.Hooks:
+            hook.Connect(self, self.__device, time.perf_counter() - start, None)
+        self.__timeout = timeout
+        self.__capture = self.Capture
+        self.__connection = self.Capture.Connection() if self.Capture is not None else 0
+        self.Peer = (ip, port)
+        self.__window = asyncio.Semaphore(window if window is not None else self.Window)
+        self.__message_id = 1
+        self.__pending = {}
+        # raw registers of the last Delta read per block {(unit ID, address, id(definitions)): (definitions, bytes)}
+        self.__delta = {}
+        self.__device_keys = {}
+        self.__receiver = asyncio.ensure_future(self.__receive())
+
+    # @brief closes the connection
+    async def tcp_close(self):
+        self.__receiver.cancel()
+        self.__writer.close()
+        try:
+            await self.__writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+        self.__writer = None
+        self.__reader = None
+
+
+class AsyncSunSpec(AsyncModbus, SunSpec_Specification):
+    # cache for the SunSpec blocks and the device key (see DeviceKey()), keyed by (host, port, unit ID)
+    __sunspec_blocks_cache = { }
+    # base addresses without SunSpec marker per device, see SunSpec.NegativeTTL
+    __sunspec_negative_cache = { }
+
+    # @ brief Retrieves the SunSpec IDs and the length of the SunSpec blocks, see SunSpec.SunSpec(). Uses the
+    # persistent SunSpec.DiscoveryCache as well.
+    # @param Configuration_UnitID: the unit ID of the SunSpec device
+    # @param SunSpecAddressId: the ID of the SunSpec block to read (0, 1, 2)
+    async def SunSpec(self, Configuration_UnitID, SunSpecAddressId = -1):
+        if SunSpecAddressId < -1 or SunSpecAddressId >= len(SunSpec.SunSpecAddresses):
+            # SunSpecAddressId is out of range
+            return None
+        device = self.Peer + (Configuration_UnitID,)
+        entry = self.__sunspec_blocks_cache.get(device)
+        if entry is not None:
+            # return the cached result. the device key is restored, it is lost when the connection is reopened
+            self.SetDeviceKey(Configuration_UnitID, entry[1])
+            return entry[0]
+
+        result = None
+        key = "%s:%d/%d" % device
+        entry = SunSpec.DiscoveryCache.Get(key) if SunSpec.DiscoveryCache is not None else None
+        if entry is not None and (SunSpecAddressId == -1 or entry["Base"] == SunSpec.SunSpecAddresses[SunSpecAddressId]):
+            message = await self.ReadRegister(Configuration_UnitID, entry["Base"], SunSpec.SunSpecFingerprint)
+            if self.__fingerprint(Configuration_UnitID, message) == entry["Fingerprint"]:
+                result = [SunSpec.SunSpecBlock(*block) for block in entry["Blocks"]]
+            else:
+                # other device or firmware changed
+                SunSpec.DiscoveryCache.Remove(key)
+        if result is None:
+            bases = SunSpec.SunSpecAddresses if SunSpecAddressId == -1 else [SunSpec.SunSpecAddresses[SunSpecAddressId]]
+            base = await self.__probe_bases(Configuration_UnitID, bases)
+            if base is not None:
+                result = await self.__discover(Configuration_UnitID, base)
+        if result is not None:
+            # add block list to cache
+            self.__sunspec_blocks_cache.setdefault(device, (result, self.DeviceKey(Configuration_UnitID)))
+        return result
+
+    # @brief returns the fingerprint of the device from the decoded SunSpecFingerprint registers and sets the
+    # device key of the unit, see SunSpec.SunSpec(). returns None if there is no SunSpec marker
+    # @param UnitId: the unit ID of the SunSpec device
+    # @param Message: SunSpecFingerprint registers read at the SunSpec base address
+    def __fingerprint(self, UnitId, Message):
+        if Message is None or Message.get("C_SunSpec_ID") != "SunS":
+            return None
+        if Message.get("ID") == 1:
+            self.SetDeviceKey(UnitId, "%s/%s/%s" % (Message.get("Mn", ""), Message.get("Md", ""), Message.get("Vr", "")))
+        return "/".join(str(Message.get(name, "")) for name in ("C_SunSpec_ID", "ID", "L", "Mn", "Md", "Vr", "SN"))
+
+    # @brief reads the SunSpec marker at the candidate base addresses concurrently, see SunSpec.SunSpec().
+    # returns the first address with a marker or None
+    # @param UnitId: the unit ID of the SunSpec device
+    # @param Bases: candidate SunSpec base addresses
+    async def __probe_bases(self, UnitId, Bases):
+        now = time.monotonic()
+        negative = self.__sunspec_negative_cache.setdefault(self.Peer + (UnitId,), {})
+        bases = [base for base in Bases if negative.get(base, 0) <= now]
+        if len(bases) == 0:
+            return None
+        markers = await self.ReadRaw(UnitId, [(base, 2) for base in bases])
+        found = None
+        for base, marker in zip(bases, markers):
+            if marker == b"SunS":
+                negative.pop(base, None)
+                if found is None:
+                    found = base
+            else:
+                negative[base] = now + SunSpec.NegativeTTL
+        return found
+
+    # @brief walks the SunSpec block chain at the base address, see SunSpec.WalkBlocks(). returns the blocks.
+    # @param Configuration_UnitID: the unit ID of the SunSpec device
+    # @param Base: SunSpec base address
+    async def __discover(self, Configuration_UnitID, Base):
+        registers = self.Limits.Registers("%s:%d/%d" % (self.Peer + (Configuration_UnitID,))) if self.AdaptLimits else None
+        walk = SunSpec.WalkBlocks(Base, SunSpec.SunSpecReadAhead, registers)
+        try:
+            ranges = next(walk)
+            while True:
+                ranges = walk.send(await self.ReadRaw(Configuration_UnitID, ranges))
+        except StopIteration as stop:
+            result, message = stop.value
+        if message is None:
+            message = await self.ReadRegister(Configuration_UnitID, Base, SunSpec.SunSpecFingerprint)
+        fingerprint = self.__fingerprint(Configuration_UnitID, message)
+        if SunSpec.DiscoveryCache is not None and fingerprint is not None:
+            SunSpec.DiscoveryCache.Put("%s:%d/%d" % (self.Peer + (Configuration_UnitID,)), Base, fingerprint, result)
+        return result
+
+    # @brief reads a SunSpec block for the given UnitId and Address, see SunSpec.ReadBlock()
+    # @param UnitId: the unit ID of the SunSpec device
+    # @param Address: the address of the SunSpec block
+    # @param BlockId: ID of the SunSpec block; specifies the SunSpec specification to use
+    # @param SubBlockId: ID of the sub block, ignored with Length
+    # @param Length: length of the block without ID and L (SunSpecBlock.Length)
+    # @param Scaled: return engineering values, see ModbusScale
+    # @param Delta: return only the points which changed since the last read
+    async def ReadBlock(self, UnitId, Address, BlockId, SubBlockId = 0, Length = None, Scaled = False, Delta = False):
+        if Scaled and Delta:
+            raise ValueError("Scaled can't be combined with Delta")
+        if Length is not None:
+            SubBlockId = 0
+        BlockDef = SunSpec.BlockDefinitions(BlockId, SubBlockId, Length)
+        if BlockDef is None:
+            return None
+        values = await self.ReadRegister(UnitId, Address, BlockDef, Delta)
+        if Scaled:
+            values = SunSpec.BlockScale(BlockId, SubBlockId, Length).Apply(values)
+        return SunSpec.NestGroups(BlockId, values, Length) if values != {} else values
+
+
+class AsyncSolarEdge(AsyncSunSpec):
+    KnownHoles = SolarEdge.KnownHoles
+
+    # @brief reads the SolarEdge SmartMeter data for the given UnitId and SmartMeterId, see SolarEdge.SmartMeter()
+    # @param UnitId: the unit ID of the SolarEdge device
+    # @apram SmartMeterId: 1, 2 or 3
+    # @param Scaled: return engineering values, see ModbusScale
+    async def SmartMeter(self, UnitId, SmartMeterId, Scaled = False):
+        if SmartMeterId < 1 or SmartMeterId > 3:
+            return None
+        Address = SolarEdge.SmartMeterAddresses[SmartMeterId - 1]
+        block = await self.ReadRegister(UnitId, Address, SolarEdge.SmartMeterDefinition)
+        if block is None or block.get("C_Manufacturer", "") == "":
+            return None
+        if Scaled:
+            block = ModbusScale.Compile(SolarEdge.SmartMeterDefinition, SolarEdge.SmartMeterScaleFactors).Apply(block)
+        return block
+
+    # @brief reads the SolarEdge Battery data for the given UnitId and BatteryId, see SolarEdge.Battery()
+    # @param UnitId: the unit ID of the SolarEdge device
+    # @apram BatteryId: 1 or 2
+    async def Battery(self, UnitId, BatteryId):
+        if BatteryId < 1 or BatteryId > 2:
+            return None
+        Address = SolarEdge.BatteryAddresses[BatteryId - 1]
+        # both blocks are requested concurrently
+        block1, block2 = await asyncio.gather(
+            self.ReadRegister(UnitId, Address, SolarEdge.BatteryInfoDefinition),
+            self.ReadRegister(UnitId, Address + SolarEdge.BatteryStatusOffset, SolarEdge.BatteryStatusDefinition))
+        if block1 is None or block1.get("C_Manufacturer", "") == "" or block2 is None:
+            return None
+        return block1 | block2
+
+    # @brief reads the SolarEdge Grid Protection Trip Limits data for the given UnitId.
+    # @param UnitId: the unit ID of the SolarEdge device
+    # @param Delta: return only the limits which changed since the last read
+    async def GridProtectionTripLimits(self, UnitId, Delta = False):
+        return await self.ReadRegister(UnitId, SolarEdge.GridProtectionTripLimitsAddress,
+            SolarEdge.GridProtectionTripLimitsDefinition, Delta)
@@ -0,0 +1,257 @@
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import time
+import modbus
+import modbus_async
+import modbus_simulator
+from sunspec_specification import SunSpec_Specification
+
+# Benchmarks of the decoder and of polling end to end, with machine readable results to compare versions:
+#   - decode: ModbusPlan.Unpack() of every model of the SunSpec specification and of the SolarEdge SmartMeter,
+#     Battery and trip limit maps, in blocks/s and fields/s
+#   - end to end: polls against simulated devices (modbus_simulator) with a response latency, in polls/s and
+#     requests/s with the p50/p95/p99 latency of a poll and the bytes transferred per poll. The simulator runs
+#     in the same process, so the figures are for comparing versions on one machine, not absolute.
+#
+#   python modbus_benchmark.py -o before.json
+#   python modbus_benchmark.py -o after.json
+#   python modbus_benchmark.py --compare before.json after.json
+
+
+# @brief returns the time in seconds of one call of Function, measured over at least MinTime seconds
+def Measure(Function, MinTime):
+    count = 1
+    while True:
+        start = time.perf_counter()
+        for i in range(count):
+            Function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MinTime:
+            return elapsed / count
+        count *= 2 if elapsed <= 0 else max(2, int(1.2 * MinTime / elapsed))
+
+
+# @brief returns the p50, p95 and p99 of the samples in milliseconds
+def Percentiles(Samples):
+    if len(Samples) < 2:
+        return {"p50": Samples[0] * 1000, "p95": Samples[0] * 1000, "p99": Samples[0] * 1000} if Samples else {}
+    quantiles = statistics.quantiles(Samples, n = 100, method = "inclusive")
+    return {"p50": quantiles[49] * 1000, "p95": quantiles[94] * 1000, "p99": quantiles[98] * 1000}
+
+
+# @brief decode benchmark of every definition. returns {name: {"fields", "registers", "blocks_per_s",
+# "fields_per_s"}} and the totals under "total"
+# @param MinTime: minimum measuring time per definition in seconds
+def DecodeBenchmark(MinTime = 0.02):
+    definitions = [("%d/%d" % key, modbus.SunSpec.BlockDefinitions(*key)) for key in SunSpec_Specification.Specification]
+    definitions += [("SolarEdge/SmartMeter", modbus.SolarEdge.SmartMeterDefinition),
+        ("SolarEdge/BatteryInfo", modbus.SolarEdge.BatteryInfoDefinition),
+        ("SolarEdge/BatteryStatus", modbus.SolarEdge.BatteryStatusDefinition),
+        ("SolarEdge/GridProtectionTripLimits", modbus.SolarEdge.GridProtectionTripLimitsDefinition)]
+    # random register contents, the same for every run
+    generator = random.Random(1)
+    results = {}
+    fields = 0
+    seconds = 0
+    for name, definition in definitions:
+        plan = modbus.ModbusPlan.Compile(definition)
+        if plan.Size == 0:
+            continue
+        message = bytes(generator.getrandbits(8) for i in range(plan.Size))
+        duration = Measure(lambda: plan.Unpack(message), MinTime)
+        results[name] = {"fields": len(plan.Fields), "registers": plan.Registers, "blocks_per_s": 1 / duration,
+            "fields_per_s": len(plan.Fields) / duration}
+        fields += len(plan.Fields)
+        seconds += duration
+    # one block of every definition
+    results["total"] = {"blocks_per_s": len(results) / seconds, "fields_per_s": fields / seconds}
+    return results
+
+
+# @brief polls Function(i) Polls times and returns the statistics of the polls
+# @param Devices: simulated devices the requests go to
+def Poll(Devices, Function, Polls):
+    requests = sum(device.Requests for device in Devices)
+    transferred = sum(device.BytesReceived + device.BytesSent for device in Devices)
+    latencies = []
+    start = time.perf_counter()
+    for i in range(Polls):
+        begin = time.perf_counter()
+        Function(i)
+        latencies.append(time.perf_counter() - begin)
+    elapsed = time.perf_counter() - start
+    return Statistics(Devices, requests, transferred, latencies, elapsed)
+
+
+# @brief returns the statistics of polls: Requests and Transferred are the counters of the devices before the polls
+def Statistics(Devices, Requests, Transferred, Latencies, Elapsed):
+    requests = sum(device.Requests for device in Devices) - Requests
+    transferred = sum(device.BytesReceived + device.BytesSent for device in Devices) - Transferred
+    return {"polls": len(Latencies), "polls_per_s": len(Latencies) / Elapsed, "requests_per_s": requests / Elapsed,
+        "requests_per_poll": requests / len(Latencies), "bytes_per_poll": transferred / len(Latencies),
+        "latency_ms": Percentiles(Latencies)}
+
+
+# @brief end to end benchmark against simulated SolarEdge inverters. returns {scenario: statistics}
+# @param Latency: response latency of the simulated devices in seconds
+# @param Polls: number of polls per scenario
+# @param Devices: number of devices polled concurrently by the async scenario
+def EndToEndBenchmark(Latency = 0.002, Polls = 200, Devices = 20):
+    simulator = modbus_simulator.ModbusSimulator()
+    simulator.Start()
+    results = {}
+    try:
+        device = modbus_simulator.SolarEdgeInverter(Latency = Latency)
+        port = simulator.Add(device)
+        client = modbus.SolarEdge()
+        client.tcp_connect("127.0.0.1", port, 2)
+        # every discovery uses another unit ID so it isn't answered from the cache of the client
+        results["discovery"] = Poll([device], lambda i: client.SunSpec(1 + i % 247), min(Polls, 246))
+        blocks = client.SunSpec(1)
+        inverter = [block for block in blocks if block.BlockId == 103][0]
+        results["read_block"] = Poll([device],
+            lambda i: client.ReadBlock(1, inverter.Address, 103, Length = inverter.Length), Polls)
+        results["poll"] = Poll([device],
+            lambda i: client.Poll(1, blocks, SmartMeters = (1,), Batteries = (1,), TripLimits = True), Polls)
+        results["poll_delta"] = Poll([device],
+            lambda i: client.Poll(1, blocks, SmartMeters = (1,), Batteries = (1,), TripLimits = True, Delta = True), Polls)
+        client.tcp_close()
+        # many devices polled concurrently on one event loop
+        fleet = [modbus_simulator.SolarEdgeInverter("7E%06X" % i, Latency = Latency) for i in range(Devices)]
+        ports = [simulator.Add(device) for device in fleet]
+        results["async_fleet"] = asyncio.run(AsyncFleet(fleet, ports, max(1, Polls // Devices)))
+    finally:
+        simulator.Stop()
+    return results
+
+
+# @brief polls the devices concurrently, Polls times each. returns the statistics of the polls
+async def AsyncFleet(Devices, Ports, Polls):
+    clients = []
+    for port in Ports:
+        client = modbus_async.AsyncSolarEdge()
+        await client.tcp_connect("127.0.0.1", port, 2)
+        blocks = await client.SunSpec(1)
+        clients.append((client, [block for block in blocks if block.BlockId == 103][0]))
+    latencies = []
+
+    async def poll(client, block):
+        for i in range(Polls):
+            begin = time.perf_counter()
+            await asyncio.gather(client.ReadBlock(1, block.Address, 103, Length = block.Length), client.SmartMeter(1, 1))
+            latencies.append(time.perf_counter() - begin)
+
+    requests = sum(device.Requests for device in Devices)
+    transferred = sum(device.BytesReceived + device.BytesSent for device in Devices)
+    start = time.perf_counter()
+    await asyncio.gather(*[poll(client, block) for client, block in clients])
+    elapsed = time.perf_counter() - start
+    for client, block in clients:
+        await client.tcp_close()
+    return Statistics(Devices, requests, transferred, latencies, elapsed)
+
+
+# @brief returns the version of the working tree (git describe) or None
+def Version():
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], capture_output = True, text = True,
+            cwd = os.path.dirname(os.path.abspath(__file__)), timeout = 10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+# @brief runs the benchmarks and returns the results with the environment they were measured in
+def Run(Decode = True, EndToEnd = True, MinTime = 0.02, Latency = 0.002, Polls = 200, Devices = 20):
+    results = {"version": Version(), "time": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine(),
+        "parameters": {"min_time": MinTime, "latency": Latency, "polls": Polls, "devices": Devices}}
+    if Decode:
+        results["decode"] = DecodeBenchmark(MinTime)
+    if EndToEnd:
+        results["end_to_end"] = EndToEndBenchmark(Latency, Polls, Devices)
+    return results
+
+
+# @brief returns the numbers of the results as {"path/to/value": number}
+def Flatten(Results, Prefix = ""):
+    values = {}
+    for key, value in Results.items():
+        if isinstance(value, dict):
+            values.update(Flatten(value, Prefix + key + "/"))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            values[Prefix + key] = value
+    return values
+
+
+# @brief compares two results and returns the lines of the report: value before, after and the change in percent
+def Compare(Before, After):
+    before = Flatten({key: Before[key] for key in ("decode", "end_to_end") if key in Before})
+    after = Flatten({key: After[key] for key in ("decode", "end_to_end") if key in After})
+    lines = ["%s -> %s" % (Before.get("version"), After.get("version"))]
+    for key in sorted(set(before) & set(after)):
+        if before[key] == 0:
+            continue
+        change = (after[key] - before[key]) / before[key] * 100
+        lines.append("%-60s %14.2f %14.2f %+8.1f%%" % (key, before[key], after[key], change))
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "decode and end to end benchmarks")
+    parser.add_argument("-o", "--output", help = "write the results as JSON to this file")
+    parser.add_argument("--decode", action = "store_true", help = "run the decode benchmark only")
+    parser.add_argument("--end-to-end", action = "store_true", help = "run the end to end benchmark only")
+    parser.add_argument("--min-time", type = float, default = 0.02, help = "minimum measuring time per definition")
+    parser.add_argument("--latency", type = float, default = 0.002, help = "response latency of the devices in seconds")
+    parser.add_argument("--polls", type = int, default = 200, help = "polls per end to end scenario")
+    parser.add_argument("--devices", type = int, default = 20, help = "devices of the async fleet scenario")
+    parser.add_argument("--compare", nargs = 2, metavar = ("BEFORE", "AFTER"), help = "compare two result files")
+    arguments = parser.parse_args()
+    if arguments.compare:
+        with open(arguments.compare[0]) as before, open(arguments.compare[1]) as after:
+            print("\n".join(Compare(json.load(before), json.load(after))))
+    else:
+        both = not arguments.decode and not arguments.end_to_end
+        results = Run(arguments.decode or both, arguments.end_to_end or both, arguments.min_time, arguments.latency,
+            arguments.polls, arguments.devices)
+        text = json.dumps(results, indent = 1)
+        if arguments.output:
+            with open(arguments.output, "w") as file:
+                file.write(text)
+        else:
+            print(text)
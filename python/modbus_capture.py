@@ -0,0 +1,324 @@
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+
+import atexit
+import collections
+import socket
+import struct
+import threading
+import time
+
+# Capture of the Modbus TCP frames of the clients and their offline replay. With a capture assigned, every
+# request and response frame is appended to a compact binary log together with its time and the device:
+#
+#   modbus.Modbus.Capture = modbus_capture.ModbusCapture("frames.mbcp")
+#
+# The log is replayed by ModbusReplay, which takes the place of the connection pool of tcp_connect(). The
+# recorded responses are returned for the same requests (unit, function code, address, count), at full speed or
+# after their recorded response latency, so ReadRegister(), SunSpec() and the SolarEdge reads run against
+# production traffic without the devices. Only the latency of the responses is replayed, the requests are sent
+# as fast as the client sends them, not with the recorded gaps between them:
+#
+#   replay = modbus_capture.ModbusReplay("frames.mbcp")
+#   tcpmodbus = modbus.SolarEdge()
+#   tcpmodbus.tcp_connect("wechselrichter1", 1502, 1, pool = replay)
+#
+# File layout (little endian): b"MBCP", version (uint8), then records of type (uint8), time (float64, seconds
+# since the epoch), device number (uint16), connection number (uint32), length (uint16) and the data. Record
+# types: DEVICE (data: "host:port" of the device number), REQUEST and RESPONSE (data: the frame). The
+# connection number tells apart the frames of concurrent connections, their message IDs overlap. Logs of
+# version 1 have no connection number, their frames are read as connection 0.
+
+DEVICE = 0
+REQUEST = 1
+RESPONSE = 2
+
+
+class ModbusCapture:
+    Magic = b"MBCP"
+    Version = 2
+    # record header: type, time, device number, connection number, length
+    Record = struct.Struct("<BdHIH")
+    # record header of version 1 logs: type, time, device number, length
+    RecordV1 = struct.Struct("<BdHH")
+
+    # @param Path: log file, records are appended to an existing log
+    def __init__(self, Path):
+        self.Path = Path
+        self.__lock = threading.Lock()
+        self.__devices = {}
+        self.__connections = 0
+        new = True
+        try:
+            with open(Path, "rb") as file:
+                header = file.read(len(self.Magic) + 1)
+                new = header == b""
+                if not new:
+                    if header[:len(self.Magic)] == self.Magic and header[-1] != self.Version:
+                        raise ValueError("can't append to a capture log of version %d" % header[-1])
+                    file.seek(0)
+                    # continue the device and connection numbering of the log
+                    for type_, time_, device, connection, data in self.Read(file):
+                        if type_ == DEVICE:
+                            self.__devices[data.decode()] = device
+                        self.__connections = max(self.__connections, connection + 1)
+        except FileNotFoundError:
+            pass
+        self.__file = open(Path, "ab")
+        if new:
+            self.__file.write(self.Magic + bytes([self.Version]))
+        atexit.register(self.Close)
+
+    # @brief appends a frame to the log
+    # @param Device: "host:port"
+    # @param Type: REQUEST or RESPONSE
+    # @param Frame: the frame
+    # @param Connection: connection number, see Connection()
+    def Write(self, Device, Type, Frame, Connection = 0):
+        now = time.time()
+        with self.__lock:
+            if self.__file is None:
+                return
+            number = self.__devices.get(Device)
+            if number is None:
+                number = self.__devices[Device] = len(self.__devices)
+                name = Device.encode()
+                self.__file.write(self.Record.pack(DEVICE, now, number, 0, len(name)) + name)
+            self.__file.write(self.Record.pack(Type, now, number, Connection, len(Frame)) + bytes(Frame))
+
+    # @brief returns a new connection number, the frames of each connection are written with their own
+    def Connection(self):
+        with self.__lock:
+            self.__connections += 1
+            return self.__connections - 1
+
+    # @brief returns a socket which captures the frames sent and received through Socket
+    # @param Socket: connected socket (or modbus_pool.PooledSocket)
+    # @param Device: "host:port"
+    def Wrap(self, Socket, Device):
+        return CaptureSocket(self, Socket, Device, self.Connection())
+
+    # @brief writes the buffered records to the file
+    def Flush(self):
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.flush()
+
+    # @brief closes the log, later frames are not captured
+    def Close(self):
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
+
+    # @brief returns the records of a log as (type, time, device number, connection number, data)
+    # @param File: log file opened in binary mode
+    @classmethod
+    def Read(cls, File):
+        header = File.read(len(cls.Magic) + 1)
+        if header[:len(cls.Magic)] != cls.Magic or header[-1] not in (1, cls.Version):
+            raise ValueError("not a capture log")
+        version1 = header[-1] == 1
+        size = cls.RecordV1.size if version1 else cls.Record.size
+        while True:
+            record = File.read(size)
+            if len(record) < size:
+                return
+            if version1:
+                type_, time_, device, length = cls.RecordV1.unpack(record)
+                connection = 0
+            else:
+                type_, time_, device, connection, length = cls.Record.unpack(record)
+            data = File.read(length)
+            if len(data) < length:
+                # truncated by a crash while writing
+                return
+            yield type_, time_, device, connection, data
+
+
+# @brief socket wrapper capturing the frames. the sent data is a frame per call, the received data is cut into
+# frames by the length of their MBAP header.
+class CaptureSocket:
+    def __init__(self, Capture, Socket, Device, Connection):
+        self.__capture = Capture
+        self.__socket = Socket
+        self.__device = Device
+        self.__connection = Connection
+        self.__received = bytearray()
+
+    def sendall(self, Data):
+        self.__capture.Write(self.__device, REQUEST, Data, self.__connection)
+        return self.__socket.sendall(Data)
+
+    def send(self, Data):
+        self.__capture.Write(self.__device, REQUEST, Data, self.__connection)
+        return self.__socket.send(Data)
+
+    def recv(self, Length):
+        data = self.__socket.recv(Length)
+        self.__received_data(data)
+        return data
+
+    def recv_into(self, View):
+        received = self.__socket.recv_into(View)
+        self.__received_data(View[:received])
+        return received
+
+    def settimeout(self, Timeout):
+        self.__socket.settimeout(Timeout)
+
+    def close(self):
+        self.__socket.close()
+
+    # @brief collects the received data and captures the complete frames
+    def __received_data(self, Data):
+        self.__received += Data
+        while len(self.__received) >= 6:
+            end = 6 + struct.unpack_from(">H", self.__received, 4)[0]
+            if len(self.__received) < end:
+                break
+            self.__capture.Write(self.__device, RESPONSE, self.__received[:end], self.__connection)
+            del self.__received[:end]
+
+
+class ModbusReplay:
+    # @param Path: capture log
+    # @param Timing: return each response after its recorded response latency instead of at once
+    # @param Loop: start over with the first response when the responses recorded for a request are used up,
+    # otherwise the request times out
+    def __init__(self, Path, Timing = False, Loop = True):
+        self.Timing = Timing
+        self.Loop = Loop
+        names = {}
+        # device -> {request without message ID: [(response without message ID, response time)]}
+        self.Responses = {}
+        sent = {}           # (device, connection, message ID) -> (request key, time)
+        with open(Path, "rb") as file:
+            for type_, time_, device, connection, data in ModbusCapture.Read(file):
+                if type_ == DEVICE:
+                    names[device] = data.decode()
+                    self.Responses.setdefault(names[device], {})
+                elif len(data) >= 7:
+                    messageId = struct.unpack_from(">H", data)[0]
+                    if type_ == REQUEST:
+                        sent[(device, connection, messageId)] = (bytes(data[2:]), time_)
+                    else:
+                        request = sent.pop((device, connection, messageId), None)
+                        if request is not None:
+                            self.Responses[names[device]].setdefault(request[0], []).append(
+                                (bytes(data[2:]), time_ - request[1]))
+
+    # @brief returns a socket answering with the responses recorded for the device. the recorded device is used if
+    # the log holds only one. Raises ConnectionRefusedError if the device isn't in the log
+    # @param Host: host name or IP address of the device
+    # @param Port: port of the device
+    def Connect(self, Host, Port):
+        device = "%s:%d" % (Host, Port)
+        responses = self.Responses.get(device)
+        if responses is None and len(self.Responses) == 1:
+            responses = next(iter(self.Responses.values()))
+        if responses is None:
+            raise ConnectionRefusedError("%s not in the capture" % device)
+        return ReplaySocket(responses, self.Timing, self.Loop)
+
+
+# @brief socket answering the requests with recorded responses
+class ReplaySocket:
+    def __init__(self, Responses, Timing, Loop):
+        self.__responses = Responses
+        self.__next = collections.defaultdict(int)   # index of the next response per request
+        self.__timing = Timing
+        self.__loop = Loop
+        self.__timeout = None
+        self.__pending = collections.deque()         # (time the response is due, response)
+        self.__received = b""
+
+    def sendall(self, Data):
+        Data = bytes(Data)
+        responses = self.__responses.get(Data[2:], ())
+        index = self.__next[Data[2:]]
+        if index >= len(responses):
+            if not self.__loop or len(responses) == 0:
+                # not answered, the request times out
+                return
+            index = 0
+        self.__next[Data[2:]] = index + 1
+        response, seconds = responses[index]
+        due = time.monotonic() + seconds if self.__timing else 0
+        self.__pending.append((due, Data[:2] + response))
+
+    def send(self, Data):
+        self.sendall(Data)
+        return len(Data)
+
+    def recv(self, Length):
+        if len(self.__received) == 0:
+            self.__receive()
+        data = self.__received[:Length]
+        self.__received = self.__received[Length:]
+        return data
+
+    def recv_into(self, View):
+        data = self.recv(len(View))
+        View[:len(data)] = data
+        return len(data)
+
+    def settimeout(self, Timeout):
+        self.__timeout = Timeout
+
+    def close(self):
+        pass
+
+    # @brief waits for the next response
+    def __receive(self):
+        if len(self.__pending) == 0:
+            if self.__timeout is not None:
+                time.sleep(self.__timeout)
+            raise socket.timeout("timed out")
+        due, response = self.__pending[0]
+        delay = due - time.monotonic()
+        if delay > 0:
+            if self.__timeout is not None and delay > self.__timeout:
+                time.sleep(self.__timeout)
+                raise socket.timeout("timed out")
+            time.sleep(delay)
+        self.__pending.popleft()
+        self.__received = response
+
+
+if __name__ == "__main__":
+    import sys
+    # lists the records of a capture log
+    with open(sys.argv[1], "rb") as file:
+        names = {}
+        for type_, time_, device, connection, data in ModbusCapture.Read(file):
+            if type_ == DEVICE:
+                names[device] = data.decode()
+                continue
+            print("%.6f %s #%d %s %s" % (time_, names.get(device, device), connection, ">" if type_ == REQUEST else "<",
+                data.hex()))
@@ -0,0 +1,375 @@
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+import mmap
+import multiprocessing
+import os
+import struct
+import tempfile
+import time
+from collections import namedtuple
+import modbus
+import modbus_scheduler
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Fleet runner polling the devices from a pool of processes. The devices are sharded across the processes
+# (all units behind the same host and port go to the same process, so each inverter still sees a single client
+# connection), every process polls its shard with a modbus_scheduler.Scheduler over its own connections and
+# publishes the decoded samples into a shared memory region. The parent reads the latest values straight from
+# the region, nothing is pickled through queues:
+#
+#   fleet = modbus_fleet.ModbusFleet(
+#       [modbus_scheduler.Device("wechselrichter%d" % i, 1502, 1) for i in range(1, 201)],
+#       [modbus_fleet.Model("inverter", 1, 103),
+#        modbus_fleet.Model("export_control", 60, (modbus.SolarEdge.ExportControlAddress, modbus.SolarEdge.ExportControlDefinition))],
+#       Processes = 4)
+#   fleet.Start()
+#   timestamp, values = fleet.Latest(fleet.Devices[0], "inverter")
+#   power = fleet.Column("inverter", "W[W]")
+#   fleet.Stop()
+#
+# The region is a memory mapped file (in /dev/shm if available) with a slot per (device, model). The layout
+# of a slot is derived from the register definitions of the model (for SunSpec models from the Specification
+# types): sequence (uint32), number of failed polls (uint32), time of the sample (float64, 0 if none yet), a
+# bitmap of the fields present in the sample, then the fields (little endian, numbers in the format of their
+# type, strings and addresses as bytes of the register size). Writers bump the sequence to an odd value before
+# and to the next even value after updating a slot (seqlock), readers retry if the sequence was odd or changed
+# while they copied the slot.
+
+# model to poll: Source is a SunSpec block ID (the fixed points of the first block of the model are published)
+# or (Address, Definitions) for any other register block. Read every Interval seconds
+Model = namedtuple("Model", ["Name", "Interval", "Source"])
+
+
+class SampleLayout:
+    # slot header: sequence, failed polls, time of the sample
+    Header = struct.Struct("<IId")
+    NUMBER = modbus.ModbusPlan.NUMBER
+    STRING = modbus.ModbusPlan.STRING
+    BYTES = modbus.ModbusPlan.BYTES
+
+    # @param Definitions: register definition {offset: (name, type, length)}
+    def __init__(self, Definitions):
+        fields = []
+        for key in Definitions:
+            name, type_, length = Definitions[key]
+            size = length * 2
+            format_ = modbus.ModbusPlan.StructFormat.get(type_)
+            # the same fields as decoded by ModbusPlan.Unpack()
+            if format_ is not None and struct.calcsize("<" + format_) == size:
+                fields.append((name, self.NUMBER, format_))
+            elif size > 0 and type_ == "string":
+                fields.append((name, self.STRING, "%ds" % size))
+            elif size > 0 and (type_ == "ipaddr" or type_ == "ipv6addr"):
+                fields.append((name, self.BYTES, "%ds" % size))
+        self.Fields = tuple(fields)
+        self.Names = tuple(field[0] for field in fields)
+        self.Presence = (len(fields) + 7) // 8
+        structformat = "<%ds" % self.Presence
+        # offset of each field from the start of the slot
+        self.Offsets = {}
+        for name, kind, format_ in fields:
+            self.Offsets[name] = (self.Header.size + struct.calcsize(structformat), format_)
+            structformat += format_
+        self.Struct = struct.Struct(structformat)
+        self.Index = {name: i for i, name in enumerate(self.Names)}
+        # slots are 8 byte aligned
+        self.Size = (self.Header.size + self.Struct.size + 7) & ~7
+
+    # @brief writes the decoded values into the slot at Offset (writer side)
+    # @param Buffer: shared memory
+    # @param Offset: byte offset of the slot
+    # @param Values: decoded values {name: value}
+    # @param Timestamp: time of the sample
+    def Write(self, Buffer, Offset, Values, Timestamp):
+        presence = bytearray(self.Presence)
+        arguments = [presence]
+        for i, (name, kind, format_) in enumerate(self.Fields):
+            value = Values.get(name)
+            if value is None:
+                arguments.append(0 if kind == self.NUMBER else b"")
+                continue
+            presence[i >> 3] |= 1 << (i & 7)
+            arguments.append(value.encode("latin-1") if kind == self.STRING else value)
+        sequence, failed, timestamp = self.Header.unpack_from(Buffer, Offset)
+        self.Header.pack_into(Buffer, Offset, sequence + 1, failed, timestamp)
+        self.Struct.pack_into(Buffer, Offset + self.Header.size, *arguments)
+        self.Header.pack_into(Buffer, Offset, sequence + 2, failed, Timestamp)
+
+    # @brief counts a failed poll in the slot at Offset, the values of the last sample are kept (writer side)
+    # @param Buffer: shared memory
+    # @param Offset: byte offset of the slot
+    def Fail(self, Buffer, Offset):
+        sequence, failed, timestamp = self.Header.unpack_from(Buffer, Offset)
+        self.Header.pack_into(Buffer, Offset, sequence + 1, failed, timestamp)
+        self.Header.pack_into(Buffer, Offset, sequence + 2, failed + 1, timestamp)
+
+    # @brief returns a consistent copy of the slot at Offset (reader side)
+    # @param Buffer: shared memory
+    # @param Offset: byte offset of the slot
+    def Copy(self, Buffer, Offset):
+        while True:
+            sequence = self.Header.unpack_from(Buffer, Offset)[0]
+            if sequence & 1 == 0:
+                data = bytes(Buffer[Offset:Offset + self.Size])
+                if self.Header.unpack_from(Buffer, Offset)[0] == sequence:
+                    return data
+            # the writer is updating the slot
+            time.sleep(0)
+
+    # @brief decodes a copy of the slot, returns (time, {name: value}, failed polls). time is 0 and the
+    # dictionary empty if no sample was published yet
+    # @param Data: copy of the slot, see Copy()
+    def Read(self, Data):
+        sequence, failed, timestamp = self.Header.unpack_from(Data)
+        values = self.Struct.unpack_from(Data, self.Header.size)
+        presence = values[0]
+        result = {}
+        for i, (name, kind, format_) in enumerate(self.Fields):
+            if presence[i >> 3] >> (i & 7) & 1:
+                value = values[i + 1]
+                if kind == self.STRING:
+                    end = value.find(b"\x00")
+                    value = (value if end < 0 else value[:end]).decode("latin-1")
+                result[name] = value
+        return timestamp, result, failed
+
+
+# Shared memory region with a slot per (device, model). The region is created by the fleet runner and opened by
+# the workers and by readers in other processes through its Path, all of them with the same devices and models.
+class FleetMemory:
+    # @param Devices: list of modbus_scheduler.Device
+    # @param Models: list of Model
+    # @param Path: memory mapped file, None creates a new temporary file
+    def __init__(self, Devices, Models, Path = None):
+        self.Devices = list(Devices)
+        self.Models = list(Models)
+        self.Layouts = {model.Name: SampleLayout(self.Definitions(model)) for model in self.Models}
+        self.__devices = {device: i for i, device in enumerate(self.Devices)}
+        # offset of the slot of each model within the slots of a device
+        self.__models = {}
+        self.Stride = 0
+        for model in self.Models:
+            self.__models[model.Name] = self.Stride
+            self.Stride += self.Layouts[model.Name].Size
+        size = max(self.Stride * len(self.Devices), 1)
+        self.Owner = Path is None
+        if self.Owner:
+            fd, Path = tempfile.mkstemp(prefix = "modbus-fleet-", dir = "/dev/shm" if os.path.isdir("/dev/shm") else None)
+            os.ftruncate(fd, size)
+        else:
+            fd = os.open(Path, os.O_RDWR)
+        try:
+            self.Buffer = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        self.Path = Path
+
+    # @brief returns the register definitions of the model
+    # @param Model: Model
+    @staticmethod
+    def Definitions(Model):
+        if isinstance(Model.Source, int):
+            definitions = modbus.SunSpec.BlockDefinitions(Model.Source)
+            if definitions is None:
+                raise ValueError("unknown SunSpec model %d" % Model.Source)
+            return definitions
+        return Model.Source[1]
+
+    # @brief returns the byte offset of the slot of the device and model
+    # @param Device: index of the device or modbus_scheduler.Device
+    # @param Model: name of the model
+    def Offset(self, Device, Model):
+        if not isinstance(Device, int):
+            Device = self.__devices[Device]
+        return Device * self.Stride + self.__models[Model]
+
+    # @brief publishes a sample (writer side)
+    # @param Device: index of the device or modbus_scheduler.Device
+    # @param Model: name of the model
+    # @param Values: decoded values {name: value}
+    # @param Timestamp: time of the sample
+    def Publish(self, Device, Model, Values, Timestamp):
+        self.Layouts[Model].Write(self.Buffer, self.Offset(Device, Model), Values, Timestamp)
+
+    # @brief counts a failed poll (writer side)
+    # @param Device: index of the device or modbus_scheduler.Device
+    # @param Model: name of the model
+    def Fail(self, Device, Model):
+        self.Layouts[Model].Fail(self.Buffer, self.Offset(Device, Model))
+
+    # @brief returns the latest sample (time, {name: value}) of the device and model, or None if no sample was
+    # published yet
+    # @param Device: index of the device or modbus_scheduler.Device
+    # @param Model: name of the model
+    def Latest(self, Device, Model):
+        layout = self.Layouts[Model]
+        timestamp, values, failed = layout.Read(layout.Copy(self.Buffer, self.Offset(Device, Model)))
+        if timestamp == 0:
+            return None
+        return timestamp, values
+
+    # @brief returns the latest value of a single field or None if it is missing
+    # @param Device: index of the device or modbus_scheduler.Device
+    # @param Model: name of the model
+    # @param Name: name of the field
+    def Value(self, Device, Model, Name):
+        layout = self.Layouts[Model]
+        offset = self.Offset(Device, Model)
+        index = layout.Index[Name]
+        field, format_ = layout.Offsets[Name]
+        while True:
+            sequence = layout.Header.unpack_from(self.Buffer, offset)[0]
+            if sequence & 1 == 0:
+                present = self.Buffer[offset + layout.Header.size + (index >> 3)] >> (index & 7) & 1
+                value = struct.unpack_from("<" + format_, self.Buffer, offset + field)[0]
+                if layout.Header.unpack_from(self.Buffer, offset)[0] == sequence:
+                    break
+            time.sleep(0)
+        if not present:
+            return None
+        if layout.Fields[index][1] == layout.STRING:
+            end = value.find(b"\x00")
+            value = (value if end < 0 else value[:end]).decode("latin-1")
+        return value
+
+    # @brief returns the number of failed polls of the device and model
+    # @param Device: index of the device or modbus_scheduler.Device
+    # @param Model: name of the model
+    def Failed(self, Device, Model):
+        return self.Layouts[Model].Header.unpack_from(self.Buffer, self.Offset(Device, Model))[1]
+
+    # @brief returns the latest values of a numeric field of all devices (in the order of Devices): a numpy
+    # array (NaN for missing values) if numpy is installed, otherwise a list (None for missing values)
+    # @param Model: name of the model
+    # @param Name: name of the field
+    def Column(self, Model, Name):
+        layout = self.Layouts[Model]
+        if numpy is None or layout.Fields[layout.Index[Name]][1] != layout.NUMBER or len(self.Devices) == 0:
+            return [self.Value(i, Model, Name) for i in range(len(self.Devices))]
+        base = self.__models[Model]
+        index = layout.Index[Name]
+        field, format_ = layout.Offsets[Name]
+
+        # strided view of the slots of all devices, without copy
+        def view(Format, Offset):
+            return numpy.ndarray((len(self.Devices),), numpy.dtype("<" + Format), self.Buffer, base + Offset, (self.Stride,))
+        before = view("I", 0).copy()
+        values = view(format_, field).astype(numpy.float64)
+        present = view("B", layout.Header.size + (index >> 3)) >> (index & 7) & 1
+        after = view("I", 0)
+        values[present == 0] = numpy.nan
+        # slots written while they were copied are read again one by one
+        for i in numpy.nonzero((before != after) | (before & 1 == 1))[0]:
+            value = self.Value(int(i), Model, Name)
+            values[i] = numpy.nan if value is None else value
+        return values
+
+    # @brief unmaps the region, the owner removes the file
+    def Close(self):
+        self.Buffer.close()
+        if self.Owner:
+            os.unlink(self.Path)
+
+
+# @brief polls a shard of the devices and publishes the samples until Stop is set (worker process)
+# @param Path: file of the shared memory region
+# @param Devices: list of modbus_scheduler.Device (all devices of the fleet)
+# @param Shard: indices of the devices polled by this process
+# @param Models: list of Model
+# @param Stop: multiprocessing.Event
+# @param Options: keyword arguments of modbus_scheduler.Scheduler (Workers, Jitter, Timeout, Client)
+def RunShard(Path, Devices, Shard, Models, Stop, Options):
+    memory = FleetMemory(Devices, Models, Path)
+    indices = {Devices[i]: i for i in Shard}
+
+    def Publish(device, name, result, timestamp):
+        if isinstance(result, Exception) or result is None:
+            memory.Fail(indices[device], name)
+        else:
+            memory.Publish(indices[device], name, result, timestamp)
+
+    jobs = []
+    for model in Models:
+        if isinstance(model.Source, int):
+            jobs.append(modbus_scheduler.Job(model.Name, model.Interval, modbus_scheduler.SunSpecBlock(model.Source)))
+        else:
+            jobs.append(modbus_scheduler.Job(model.Name, model.Interval,
+                lambda client, UnitId, Source = model.Source: client.ReadRegister(UnitId, Source[0], Source[1])))
+    scheduler = modbus_scheduler.Scheduler([Devices[i] for i in Shard], jobs, Callback = Publish, **Options)
+    scheduler.Start()
+    try:
+        Stop.wait()
+    finally:
+        scheduler.Stop()
+        memory.Close()
+
+
+class ModbusFleet(FleetMemory):
+    # @param Devices: list of modbus_scheduler.Device
+    # @param Models: list of Model
+    # @param Processes: number of worker processes, default: number of CPUs
+    # @param Options: keyword arguments passed to the modbus_scheduler.Scheduler of each process (Workers,
+    # Jitter, Timeout, Client), they must be picklable
+    def __init__(self, Devices, Models, Processes = None, **Options):
+        FleetMemory.__init__(self, Devices, Models)
+        self.Processes = Processes or os.cpu_count() or 1
+        self.Options = Options
+        self.__stop = None
+        self.__processes = []
+
+    # @brief returns the shards: lists of device indices, the units behind the same host and port are kept in
+    # the same shard
+    def Shards(self):
+        shards = [[] for i in range(self.Processes)]
+        hosts = {}
+        for i, device in enumerate(self.Devices):
+            shard = hosts.setdefault(device[:2], len(hosts) % self.Processes)
+            shards[shard].append(i)
+        return [shard for shard in shards if len(shard) > 0]
+
+    # @brief starts the worker processes
+    def Start(self):
+        if len(self.__processes) > 0:
+            return
+        self.__stop = multiprocessing.Event()
+        for i, shard in enumerate(self.Shards()):
+            process = multiprocessing.Process(target = RunShard, name = "modbus-fleet-%d" % i, daemon = True,
+                args = (self.Path, self.Devices, shard, self.Models, self.__stop, self.Options))
+            process.start()
+            self.__processes.append(process)
+
+    # @brief stops the worker processes (after their running polls), the region stays readable until Close()
+    def Stop(self):
+        if self.__stop is not None:
+            self.__stop.set()
+        for process in self.__processes:
+            process.join()
+        self.__processes = []
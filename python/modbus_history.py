@@ -0,0 +1,262 @@
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+
+import array
+import bisect
+import struct
+import threading
+import time
+try:
+    import numpy
+except ImportError:
+    numpy = None
+from modbus import ModbusPlan, ModbusScale, SunSpec
+from sunspec_specification import SunSpec_Specification
+
+# In-memory history of poll results. The samples of each series, keyed by (device, series), are kept in a
+# preallocated columnar ring buffer instead of a list of dictionaries: a NumPy structured array if numpy is
+# installed, otherwise one array.array per point. The column types follow the types of the points (int16 ->
+# 2 bytes, ...), strings are not stored. Latest() and Window() return views sharing the memory of the buffer, a
+# NumPy structured array or {column: memoryview}, both indexed by column name ("Time", "W[W]", ...).
+#
+#   history = modbus_history.ModbusHistory(Capacity = 3600)
+#   scheduler = modbus_scheduler.Scheduler(devices, jobs, Callback = history.Record)
+#   ...
+#   power = history.Latest(devices[0], "inverter", 60)["W[W]"]
+#
+# The series of a poll is its job name, a device may have several blocks of the same model (e.g. the common
+# blocks of a SolarEdge inverter and its meter). Samples appended directly are kept per model unless a Series
+# is given.
+#
+# A point which isn't implemented is stored as NaN in float columns and as the "not implemented" value of its
+# type (e.g. 0x8000 for int16) in integer columns. The points of repeating groups are stored in columns named
+# "<group>.<i>.<point>", e.g. "module.0.DCA[A]".
+#
+# With Scaled the scaled points are stored as engineering values. A series whose model has no scale factors in
+# the specification keeps its raw values, its ModbusRing.Scaled is False.
+
+
+# @brief ring buffer of the samples of one series. The buffer holds Capacity samples plus a slack; when the end
+# of the buffer is reached the latest samples are moved to its start, so the samples are always contiguous and
+# every window is a view. Views are overwritten by later samples; copy them to keep them.
+class ModbusRing:
+    # @param Columns: list of (column name, struct format, missing value) of the stored points
+    # @param Capacity: number of samples kept
+    # @param Slack: additional rows as fraction of Capacity, trades memory for less frequent moves
+    # @param Scaled: the scaled points are stored as engineering values, False if the samples are raw values
+    def __init__(self, Columns, Capacity, Slack = 0.25, Scaled = False):
+        self.Capacity = Capacity
+        self.Scaled = Scaled
+        self.Columns = ("Time",) + tuple(name for name, format_, missing in Columns)
+        self.__missing = (float("nan"),) + tuple(missing for name, format_, missing in Columns)
+        self.__size = Capacity + max(1, int(Capacity * Slack))
+        self.__start = 0
+        self.__end = 0
+        self.__lock = threading.Lock()
+        formats = ("d",) + tuple(format_ for name, format_, missing in Columns)
+        if numpy is not None:
+            self.__data = numpy.zeros(self.__size, dtype = [(name, "<" + format_) for name, format_ in zip(self.Columns, formats)])
+        else:
+            self.__data = [array.array(self.__typecode(format_), bytes(self.__size * struct.calcsize("<" + format_)))
+                for format_ in formats]
+
+    # @brief returns the array.array type code with the size of the (standard size) struct format
+    @staticmethod
+    def __typecode(Format):
+        # the sizes of C int and long depend on the platform
+        for typecode in {"i": "il", "I": "IL", "q": "ql", "Q": "QL"}.get(Format, Format):
+            if array.array(typecode).itemsize == struct.calcsize("<" + Format):
+                return typecode
+        raise ValueError("no array type for " + Format)
+
+    # @brief appends a sample
+    # @param Timestamp: time of the sample in seconds (time.time())
+    # @param Values: sample {column name: value}
+    def Append(self, Timestamp, Values):
+        row = [Timestamp]
+        for name, missing in zip(self.Columns[1:], self.__missing[1:]):
+            value = Values.get(name)
+            row.append(missing if value is None else value)
+        with self.__lock:
+            if self.__end == self.__size:
+                # move the latest Capacity - 1 samples to the start of the buffer
+                first = self.__end - self.Capacity + 1
+                if numpy is not None:
+                    self.__data[0:self.Capacity - 1] = self.__data[first:self.__end]
+                else:
+                    for column in self.__data:
+                        column[0:self.Capacity - 1] = column[first:self.__end]
+                self.__start = 0
+                self.__end = self.Capacity - 1
+            if numpy is not None:
+                self.__data[self.__end] = tuple(row)
+            else:
+                for column, value in zip(self.__data, row):
+                    column[self.__end] = value
+            self.__end += 1
+            if self.__end - self.__start > self.Capacity:
+                self.__start += 1
+
+    def __len__(self):
+        return self.__end - self.__start
+
+    # @brief returns the latest N samples (all if N is None), oldest first
+    # @param N: number of samples
+    def Latest(self, N = None):
+        with self.__lock:
+            first = self.__start if N is None else max(self.__start, self.__end - N)
+            return self.__view(first, self.__end)
+
+    # @brief returns the samples with Start <= time < End, oldest first
+    # @param Start: start time in seconds
+    # @param End: end time in seconds, None for the latest sample
+    def Window(self, Start, End = None):
+        with self.__lock:
+            if numpy is not None:
+                times = self.__data["Time"][self.__start:self.__end]
+                first = int(numpy.searchsorted(times, Start, "left"))
+                last = len(times) if End is None else int(numpy.searchsorted(times, End, "left"))
+            else:
+                times = memoryview(self.__data[0])[self.__start:self.__end]
+                first = bisect.bisect_left(times, Start)
+                last = len(times) if End is None else bisect.bisect_left(times, End)
+            return self.__view(self.__start + first, self.__start + max(first, last))
+
+    # @brief returns a view of the rows [First, End)
+    def __view(self, First, End):
+        if numpy is not None:
+            return self.__data[First:End]
+        return {name: memoryview(column)[First:End] for name, column in zip(self.Columns, self.__data)}
+
+
+class ModbusHistory:
+    # @param Capacity: number of samples kept per series
+    # @param Slack: additional rows of each buffer as fraction of Capacity, see ModbusRing
+    # @param Scaled: the samples hold engineering values (see ModbusScale), the scaled points are stored as float64
+    def __init__(self, Capacity = 3600, Slack = 0.25, Scaled = False):
+        self.Capacity = Capacity
+        self.Slack = Slack
+        self.Scaled = Scaled
+        self.__rings = {}
+        self.__lock = threading.Lock()
+
+    # @brief appends a sample of a series. The buffer of the series is created with the first sample, its columns
+    # are taken from the SunSpec model or from Definitions.
+    # @param Device: device of the series, e.g. modbus_scheduler.Device or "host:port/unit"
+    # @param Model: SunSpec model ID or any name of the series if Definitions is given
+    # @param Values: sample as returned by SunSpec.ReadBlock() or ModbusRegister.ReadRegister()
+    # @param Timestamp: time of the sample in seconds, None for now
+    # @param Definitions: register definition {offset: (name, type, length)} of a series which isn't a SunSpec model
+    # @param ScaleFactors: {point name: scale factor point name} of Definitions, only used with Scaled
+    # @param Series: name of the series, defaults to Model
+    def Append(self, Device, Model, Values, Timestamp = None, Definitions = None, ScaleFactors = None, Series = None):
+        if Values is None:
+            return
+        if Series is None:
+            Series = Model
+        group = SunSpec_Specification.Specification.Group(Model) if Definitions is None else None
+        ring = self.__rings.get((Device, Series))
+        if ring is None:
+            ring = self.__create((Device, Series), Model, Values, group, Definitions, ScaleFactors)
+            if ring is None:
+                return
+        if group is not None and group.Name in Values:
+            Values = dict(Values)
+            for i, repeat in enumerate(Values.pop(group.Name)):
+                for name, value in repeat.items():
+                    Values["%s.%d.%s" % (group.Name, i, name)] = value
+        ring.Append(time.time() if Timestamp is None else Timestamp, Values)
+
+    # @brief appends the result of a SunSpec block poll, usable as modbus_scheduler.Scheduler Callback. The series
+    # is named after the job, the model is taken from the ID of the block. Other results (failed polls, SolarEdge
+    # reads) are ignored.
+    # @param Device: polled device
+    # @param Name: name of the job
+    # @param Result: result of the poll
+    # @param Timestamp: time of the poll
+    def Record(self, Device, Name, Result, Timestamp):
+        if isinstance(Result, dict) and isinstance(Result.get("ID"), int):
+            self.Append(Device, Result["ID"], Result, Timestamp, Series = Name)
+
+    # @brief returns the ModbusRing of the series or None
+    # @param Device: device of the series
+    # @param Series: name of the series (the job name of polls), SunSpec model ID if none was given
+    def Ring(self, Device, Series):
+        return self.__rings.get((Device, Series))
+
+    # @brief returns the latest N samples of the series (see ModbusRing.Latest()) or None if there is no series
+    def Latest(self, Device, Series, N = None):
+        ring = self.__rings.get((Device, Series))
+        return ring.Latest(N) if ring is not None else None
+
+    # @brief returns the samples of the series with Start <= time < End (see ModbusRing.Window()) or None if there
+    # is no series
+    def Window(self, Device, Series, Start, End = None):
+        ring = self.__rings.get((Device, Series))
+        return ring.Window(Start, End) if ring is not None else None
+
+    # @brief returns the keys (device, series) of the series
+    def Keys(self):
+        return list(self.__rings)
+
+    # @brief creates the buffer of a series from the definition of its model
+    # @param Key: (device, series)
+    def __create(self, Key, Model, Values, Group, Definitions, ScaleFactors):
+        scale = None
+        if Definitions is None:
+            Length = Values.get("L") if Group is not None else None
+            Definitions = SunSpec.BlockDefinitions(Model, 0, Length)
+            if Definitions is None:
+                return None
+            if self.Scaled:
+                try:
+                    scale = SunSpec.BlockScale(Model, 0, Length)
+                except ValueError:
+                    # no scale factors for the model, the raw values are kept (ModbusRing.Scaled is False)
+                    scale = None
+        elif self.Scaled and ScaleFactors is not None:
+            scale = ModbusScale.Compile(Definitions, ScaleFactors)
+        scaled = set(name for name, scalefactor in scale.Points) if scale is not None else set()
+        columns = []
+        for name, type_, size in Definitions.values():
+            format_ = ModbusPlan.StructFormat.get(type_)
+            if format_ is None or struct.calcsize("<" + format_) != size * 2:
+                # strings, addresses and pads
+                continue
+            if type(name) is tuple:
+                column = "%s.%d.%s" % (Group.Name, name[0], name[1])
+            else:
+                column = name
+            if name in scaled or format_ in "fd":
+                columns.append((column, "d" if name in scaled else format_, float("nan")))
+            else:
+                sentinel = ModbusPlan.NotImplementedSentinel.get(type_)
+                missing = int.from_bytes(sentinel, "big", signed = format_.islower()) if sentinel is not None else 0
+                columns.append((column, format_, missing))
+        with self.__lock:
+            return self.__rings.setdefault(Key, ModbusRing(columns, self.Capacity, self.Slack, scale is not None))
@@ -0,0 +1,85 @@
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+
+import json
+import os
+import threading
+
+# Map of the unreadable register ranges ("holes") per device type. A device type is identified by a key such
+# as "SolarEdge/SE5000H/0004.0019.0022" (manufacturer, model, firmware version), devices without a known
+# identity fall back to "host:port/unit". The map is learned by Modbus.ReadRegisters() from exception
+# responses (illegal data address) and optionally persisted as JSON, so later read plans skip the holes up
+# front:
+#
+#   modbus.Modbus.HoleMap = modbus_holes.ModbusHoleMap("holes.json")
+
+class ModbusHoleMap:
+    # @param Path: JSON file the map is loaded from and saved to, None keeps the map in memory
+    def __init__(self, Path = None):
+        self.Path = Path
+        self.__holes = {}
+        self.__lock = threading.Lock()
+        if Path is not None and os.path.exists(Path):
+            with open(Path, "r") as file:
+                for key, holes in json.load(file).items():
+                    self.__holes[key] = tuple((first, end) for first, end in holes)
+
+    # @brief returns the unreadable register ranges ((first, end), ...) of the device type
+    # @param Key: device type
+    def Get(self, Key):
+        return self.__holes.get(Key, ())
+
+    # @brief adds unreadable register ranges to the device type and saves the map
+    # @param Key: device type
+    # @param Holes: list of register ranges (first, end) with end excluded
+    def Add(self, Key, Holes):
+        with self.__lock:
+            merged = []
+            for first, end in sorted(list(self.__holes.get(Key, ())) + list(Holes)):
+                if len(merged) > 0 and first <= merged[-1][1]:
+                    merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+                else:
+                    merged.append((first, end))
+            self.__holes[Key] = tuple(merged)
+            self.__save()
+
+    # @brief forgets the holes of the device type, e.g. after a firmware update
+    # @param Key: device type
+    def Remove(self, Key):
+        with self.__lock:
+            if self.__holes.pop(Key, None) is not None:
+                self.__save()
+
+    # @brief writes the map to Path (atomically, via a temporary file)
+    def __save(self):
+        if self.Path is None:
+            return
+        temporary = self.Path + ".tmp"
+        with open(temporary, "w") as file:
+            json.dump({key: [list(hole) for hole in holes] for key, holes in self.__holes.items()}, file, indent = 1)
+        os.replace(temporary, self.Path)
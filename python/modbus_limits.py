@@ -0,0 +1,170 @@
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+
+import json
+import os
+import threading
+import time
+
+# Request limits learned per device ("host:port/unit"): the largest number of registers per read request the
+# device accepts and the minimum interval between its requests. Modbus.ReadRegisters() starts at the protocol
+# limit of 125 registers without pacing. The limit is searched for between the largest request size the device
+# accepted (floor) and the smallest one it rejected (ceiling): a request rejected for its size (exception
+# "illegal data value", or "illegal data address" without unreadable registers in the range) lowers the ceiling
+# and sets the limit halfway between floor and ceiling, every success at the limit raises the floor and moves
+# the limit halfway up again, until both meet. A timeout of requests larger than the floor moves the limit
+# halfway down to the floor as well, every timeout doubles the interval. After GrowAfter successful reads in a
+# row the limit grows by GrowStep registers (not beyond the smallest size rejected within CeilingTTL seconds)
+# and the interval is halved. The limits are optionally persisted as JSON:
+#
+#   modbus.Modbus.Limits = modbus_limits.ModbusLimits("limits.json")
+
+class ModbusLimits:
+    # protocol limit of registers per read request
+    MaxRegisters = 125
+    # smallest limit the requests shrink to
+    MinRegisters = 8
+    # number of successful reads before the limits are relaxed
+    GrowAfter = 8
+    # registers the limit grows by
+    GrowStep = 16
+    # seconds a rejected request size is remembered before it is tried again
+    CeilingTTL = 3600
+    # interval between the requests after the first timeout and its limits in seconds
+    MinInterval = 0.01
+    MaxInterval = 1.0
+
+    # @param Path: JSON file the limits are loaded from and saved to, None keeps them in memory
+    def __init__(self, Path = None):
+        self.Path = Path
+        # key -> {"MaxRegisters", "Floor", "Ceiling", "CeilingTime", "Interval", "Successes"}
+        self.__limits = {}
+        self.__lock = threading.Lock()
+        if Path is not None and os.path.exists(Path):
+            with open(Path, "r") as file:
+                for key, limits in json.load(file).items():
+                    self.__limits[key] = dict({"Floor": 0}, **limits, Successes = 0)
+
+    # @brief returns the maximum number of registers per read request of the device
+    # @param Key: device, "host:port/unit"
+    def Registers(self, Key):
+        limits = self.__limits.get(Key)
+        return limits["MaxRegisters"] if limits is not None else self.MaxRegisters
+
+    # @brief returns the minimum interval between two requests to the device in seconds
+    # @param Key: device, "host:port/unit"
+    def Interval(self, Key):
+        limits = self.__limits.get(Key)
+        return limits["Interval"] if limits is not None else 0
+
+    # @brief counts a successful read, relaxes the limits after GrowAfter successes in a row
+    # @param Key: device, "host:port/unit"
+    # @param Count: number of registers of the largest request of the read
+    def Success(self, Key, Count = 0):
+        limits = self.__limits.get(Key)
+        if limits is None:
+            # nothing to relax, the limits are the defaults
+            return
+        with self.__lock:
+            if Count > limits["Floor"]:
+                limits["Floor"] = Count
+                if limits["MaxRegisters"] <= Count < limits["Ceiling"]:
+                    # the limit was accepted, try halfway up to the smallest size rejected
+                    limits["MaxRegisters"] = (Count + limits["Ceiling"] + 1) // 2
+                    limits["Successes"] = 0
+                    self.__save()
+                    return
+            limits["Successes"] += 1
+            if limits["Successes"] < self.GrowAfter:
+                return
+            limits["Successes"] = 0
+            if limits["Ceiling"] < self.MaxRegisters and time.time() - limits["CeilingTime"] > self.CeilingTTL:
+                limits["Ceiling"] = self.MaxRegisters
+            registers = min(limits["MaxRegisters"] + self.GrowStep, limits["Ceiling"])
+            interval = limits["Interval"] / 2 if limits["Interval"] / 2 >= self.MinInterval else 0
+            if registers == limits["MaxRegisters"] and interval == limits["Interval"]:
+                return
+            limits["MaxRegisters"] = registers
+            limits["Interval"] = interval
+            self.__save()
+
+    # @brief shrinks the limit after the device rejected a read request of Count registers for its size
+    # @param Key: device, "host:port/unit"
+    # @param Count: number of registers of the rejected request
+    def Rejected(self, Key, Count):
+        with self.__lock:
+            limits = self.__entry(Key)
+            limits["Ceiling"] = max(self.MinRegisters, min(limits["Ceiling"], Count - 1))
+            limits["CeilingTime"] = time.time()
+            if limits["Floor"] >= Count:
+                # accepted before, e.g. before a firmware update
+                limits["Floor"] = 0
+            # halfway between the largest size accepted and the smallest one rejected
+            limits["MaxRegisters"] = max(self.MinRegisters, min(limits["MaxRegisters"],
+                (limits["Floor"] + limits["Ceiling"] + 1) // 2))
+            limits["Successes"] = 0
+            self.__save()
+
+    # @brief shrinks the limit and slows the requests down after a timeout of a read of up to Count registers
+    # @param Key: device, "host:port/unit"
+    # @param Count: largest number of registers of the requests in flight
+    def Timeout(self, Key, Count):
+        with self.__lock:
+            limits = self.__entry(Key)
+            if Count > limits["Floor"]:
+                # a timeout of requests of an accepted size tells nothing about the size
+                limits["MaxRegisters"] = max(self.MinRegisters, min(limits["MaxRegisters"], (limits["Floor"] + Count) // 2))
+            limits["Interval"] = min(self.MaxInterval, max(self.MinInterval, limits["Interval"] * 2))
+            limits["Successes"] = 0
+            self.__save()
+
+    # @brief forgets the limits of the device
+    # @param Key: device, "host:port/unit"
+    def Remove(self, Key):
+        with self.__lock:
+            if self.__limits.pop(Key, None) is not None:
+                self.__save()
+
+    # @brief returns the limits of the device, created with the defaults. called with the lock held
+    def __entry(self, Key):
+        limits = self.__limits.get(Key)
+        if limits is None:
+            limits = {"MaxRegisters": self.MaxRegisters, "Floor": 0, "Ceiling": self.MaxRegisters, "CeilingTime": 0,
+                "Interval": 0, "Successes": 0}
+            self.__limits[Key] = limits
+        return limits
+
+    # @brief writes the limits to Path (atomically, via a temporary file). called with the lock held
+    def __save(self):
+        if self.Path is None:
+            return
+        temporary = self.Path + ".tmp"
+        with open(temporary, "w") as file:
+            json.dump({key: {name: value for name, value in limits.items() if name != "Successes"}
+                for key, limits in self.__limits.items()}, file, indent = 1)
+        os.replace(temporary, self.Path)
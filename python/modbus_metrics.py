@@ -0,0 +1,272 @@
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+
+import bisect
+import socket
+import threading
+
+# Instrumentation of the Modbus transactions. Modbus and AsyncModbus call the hooks in their Hooks list around
+# connecting, sending a request, receiving its response and decoding; without hooks (the default) the only
+# cost is a check of the empty list. ModbusMetrics is a hook which keeps counters and latency histograms per
+# device, unit ID and function code and exports them as a dictionary or in the Prometheus text format:
+#
+#   metrics = modbus_metrics.ModbusMetrics()
+#   modbus.Modbus.Hooks = [metrics]             # all clients, or tcpmodbus.Hooks = [metrics] for one
+#   ...
+#   print(metrics.Prometheus())
+
+
+# @brief base class of the hooks, all methods do nothing. Client is the modbus.Modbus or
+# modbus_async.AsyncModbus calling the hook, Device is "host:port".
+class ModbusHooks:
+    # @brief called after connecting
+    # @param Seconds: time taken to connect (to lease the connection with a pool)
+    # @param Error: exception raised by the connect or None
+    def Connect(self, Client, Device, Seconds, Error):
+        pass
+
+    # @brief called after sending a request
+    # @param Bytes: size of the request frame
+    def Request(self, Client, Device, UnitId, FunctionCode, Bytes):
+        pass
+
+    # @brief called when a request is done
+    # @param Seconds: time from sending the request to its completion
+    # @param Bytes: size of the response frame, 0 without response
+    # @param ExceptionCode: modbus exception code of an exception response or None
+    # @param Error: exception failing the request (timeout, connection lost) or None. Requests without valid
+    # response, exception code and error were abandoned or answered with a mismatching frame
+    def Response(self, Client, Device, UnitId, FunctionCode, Seconds, Bytes, ExceptionCode, Error):
+        pass
+
+    # @brief called after decoding the blocks of a read
+    # @param Blocks: number of blocks decoded
+    # @param Fields: number of values decoded
+    # @param Seconds: time taken to decode
+    def Decode(self, Client, Device, UnitId, Blocks, Fields, Seconds):
+        pass
+
+    # @brief called after a read of one or more blocks (ReadRegister(), ReadRegisters())
+    # @param Blocks: number of blocks read
+    # @param Chunks: number of requests the blocks were read with
+    # @param Seconds: time taken by the read including decoding
+    def Read(self, Client, Device, UnitId, Blocks, Chunks, Seconds):
+        pass
+
+
+# @brief cumulative histogram with fixed bucket bounds
+class ModbusHistogram:
+    __slots__ = ("Bounds", "Counts", "Sum", "Count")
+
+    def __init__(self, Bounds):
+        self.Bounds = Bounds
+        self.Counts = [0] * (len(Bounds) + 1)   # the last bucket is +Inf
+        self.Sum = 0
+        self.Count = 0
+
+    def Observe(self, Value):
+        self.Counts[bisect.bisect_left(self.Bounds, Value)] += 1
+        self.Sum += Value
+        self.Count += 1
+
+    # @brief returns the histogram as {"buckets": {bound: cumulative count}, "sum", "count"}
+    def Snapshot(self):
+        buckets = {}
+        total = 0
+        for bound, count in zip(list(self.Bounds) + ["+Inf"], self.Counts):
+            total += count
+            buckets[bound] = total
+        return {"buckets": buckets, "sum": self.Sum, "count": self.Count}
+
+
+class ModbusMetrics(ModbusHooks):
+    # latency buckets in seconds
+    LatencyBuckets = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+    # buckets of the requests per read
+    ChunkBuckets = (1, 2, 3, 4, 6, 8, 12, 16, 32)
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__connects = {}        # device -> [connects, errors, ModbusHistogram]
+        self.__requests = {}        # (device, unit, function code) -> [requests, bytes sent, bytes received,
+                                    #   timeouts, errors, invalid, {exception code: count}, ModbusHistogram]
+        self.__decodes = {}         # (device, unit) -> [blocks, fields, seconds]
+        self.__reads = {}           # (device, unit) -> [reads, ModbusHistogram of the chunks, ModbusHistogram]
+
+    def Connect(self, Client, Device, Seconds, Error):
+        with self.__lock:
+            entry = self.__connects.get(Device)
+            if entry is None:
+                entry = self.__connects[Device] = [0, 0, ModbusHistogram(self.LatencyBuckets)]
+            entry[0] += 1
+            if Error is not None:
+                entry[1] += 1
+            else:
+                entry[2].Observe(Seconds)
+
+    def Request(self, Client, Device, UnitId, FunctionCode, Bytes):
+        with self.__lock:
+            entry = self.__request(Device, UnitId, FunctionCode)
+            entry[0] += 1
+            entry[1] += Bytes
+
+    def Response(self, Client, Device, UnitId, FunctionCode, Seconds, Bytes, ExceptionCode, Error):
+        with self.__lock:
+            entry = self.__request(Device, UnitId, FunctionCode)
+            entry[2] += Bytes
+            if Error is not None:
+                if isinstance(Error, (socket.timeout, TimeoutError)):
+                    entry[3] += 1
+                else:
+                    entry[4] += 1
+            elif ExceptionCode is not None:
+                entry[6][ExceptionCode] = entry[6].get(ExceptionCode, 0) + 1
+            elif Bytes == 0:
+                entry[5] += 1
+            else:
+                entry[7].Observe(Seconds)
+
+    def Decode(self, Client, Device, UnitId, Blocks, Fields, Seconds):
+        with self.__lock:
+            entry = self.__decodes.get((Device, UnitId))
+            if entry is None:
+                entry = self.__decodes[(Device, UnitId)] = [0, 0, 0]
+            entry[0] += Blocks
+            entry[1] += Fields
+            entry[2] += Seconds
+
+    def Read(self, Client, Device, UnitId, Blocks, Chunks, Seconds):
+        with self.__lock:
+            entry = self.__reads.get((Device, UnitId))
+            if entry is None:
+                entry = self.__reads[(Device, UnitId)] = [0, ModbusHistogram(self.ChunkBuckets),
+                    ModbusHistogram(self.LatencyBuckets)]
+            entry[0] += 1
+            entry[1].Observe(Chunks)
+            entry[2].Observe(Seconds)
+
+    def __request(self, Device, UnitId, FunctionCode):
+        key = (Device, UnitId, FunctionCode)
+        entry = self.__requests.get(key)
+        if entry is None:
+            entry = self.__requests[key] = [0, 0, 0, 0, 0, 0, {}, ModbusHistogram(self.LatencyBuckets)]
+        return entry
+
+    # @brief clears all metrics
+    def Reset(self):
+        with self.__lock:
+            self.__connects.clear()
+            self.__requests.clear()
+            self.__decodes.clear()
+            self.__reads.clear()
+
+    # @brief returns the metrics as dictionary {"connects": {device: {...}}, "requests": {"device/unit/function
+    # code": {...}}, "decodes": {"device/unit": {...}}, "reads": {"device/unit": {...}}}
+    def Snapshot(self):
+        with self.__lock:
+            return {
+                "connects": {device: {"connects": entry[0], "errors": entry[1], "seconds": entry[2].Snapshot()}
+                    for device, entry in self.__connects.items()},
+                "requests": {"%s/%d/%d" % key: {"requests": entry[0], "bytes_sent": entry[1], "bytes_received": entry[2],
+                        "timeouts": entry[3], "errors": entry[4], "invalid": entry[5], "exceptions": dict(entry[6]),
+                        "seconds": entry[7].Snapshot()}
+                    for key, entry in self.__requests.items()},
+                "decodes": {"%s/%d" % key: {"blocks": entry[0], "fields": entry[1], "seconds": entry[2]}
+                    for key, entry in self.__decodes.items()},
+                "reads": {"%s/%d" % key: {"reads": entry[0], "chunks": entry[1].Snapshot(), "seconds": entry[2].Snapshot()}
+                    for key, entry in self.__reads.items()},
+            }
+
+    # @brief returns the metrics in the Prometheus text exposition format
+    # @param Prefix: prefix of the metric names
+    def Prometheus(self, Prefix = "modbus"):
+        lines = []
+
+        def metric(Name, Type, Help, Samples):
+            lines.append("# HELP %s_%s %s" % (Prefix, Name, Help))
+            lines.append("# TYPE %s_%s %s" % (Prefix, Name, Type))
+            for labels, value in Samples:
+                lines.append("%s_%s%s %s" % (Prefix, Name, labels, repr(float(value)) if isinstance(value, float) else value))
+
+        def histogram(Name, Help, Histograms):
+            samples = []
+            for labels, histogram in Histograms:
+                total = 0
+                for bound, count in zip(list(histogram.Bounds) + ["+Inf"], histogram.Counts):
+                    total += count
+                    samples.append(("_bucket" + self.__labels(labels + (("le", bound),)), total))
+                samples.append(("_sum" + self.__labels(labels), float(histogram.Sum)))
+                samples.append(("_count" + self.__labels(labels), histogram.Count))
+            lines.append("# HELP %s_%s %s" % (Prefix, Name, Help))
+            lines.append("# TYPE %s_%s histogram" % (Prefix, Name))
+            for suffix, value in samples:
+                lines.append("%s_%s%s %s" % (Prefix, Name, suffix, value))
+
+        with self.__lock:
+            connects = [((("device", device),), entry) for device, entry in self.__connects.items()]
+            requests = [((("device", key[0]), ("unit", key[1]), ("function", key[2])), entry)
+                for key, entry in self.__requests.items()]
+            decodes = [((("device", key[0]), ("unit", key[1])), entry) for key, entry in self.__decodes.items()]
+            reads = [((("device", key[0]), ("unit", key[1])), entry) for key, entry in self.__reads.items()]
+            metric("connects_total", "counter", "Connection attempts.",
+                [(self.__labels(labels), entry[0]) for labels, entry in connects])
+            metric("connect_errors_total", "counter", "Failed connection attempts.",
+                [(self.__labels(labels), entry[1]) for labels, entry in connects])
+            histogram("connect_seconds", "Time to connect.", [(labels, entry[2]) for labels, entry in connects])
+            metric("requests_total", "counter", "Requests sent.",
+                [(self.__labels(labels), entry[0]) for labels, entry in requests])
+            metric("sent_bytes_total", "counter", "Bytes of the requests.",
+                [(self.__labels(labels), entry[1]) for labels, entry in requests])
+            metric("received_bytes_total", "counter", "Bytes of the responses.",
+                [(self.__labels(labels), entry[2]) for labels, entry in requests])
+            metric("timeouts_total", "counter", "Requests failed by a timeout.",
+                [(self.__labels(labels), entry[3]) for labels, entry in requests])
+            metric("errors_total", "counter", "Requests failed by a connection error.",
+                [(self.__labels(labels), entry[4]) for labels, entry in requests])
+            metric("invalid_total", "counter", "Requests abandoned or answered with a mismatching frame.",
+                [(self.__labels(labels), entry[5]) for labels, entry in requests])
+            metric("exceptions_total", "counter", "Exception responses by exception code.",
+                [(self.__labels(labels + (("code", code),)), count) for labels, entry in requests
+                    for code, count in sorted(entry[6].items())])
+            histogram("request_seconds", "Round trip time of the answered requests.",
+                [(labels, entry[7]) for labels, entry in requests])
+            metric("decoded_blocks_total", "counter", "Blocks decoded.",
+                [(self.__labels(labels), entry[0]) for labels, entry in decodes])
+            metric("decoded_fields_total", "counter", "Values decoded.",
+                [(self.__labels(labels), entry[1]) for labels, entry in decodes])
+            metric("decode_seconds_total", "counter", "Time spent decoding.",
+                [(self.__labels(labels), float(entry[2])) for labels, entry in decodes])
+            histogram("read_chunks", "Requests per read.", [(labels, entry[1]) for labels, entry in reads])
+            histogram("read_seconds", "Duration of the reads.", [(labels, entry[2]) for labels, entry in reads])
+        return "\n".join(lines) + "\n"
+
+    # @brief formats the labels ((name, value), ...) as {name="value",...}
+    @staticmethod
+    def __labels(Labels):
+        return "{" + ",".join('%s="%s"' % (name, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+            for name, value in Labels) + "}"
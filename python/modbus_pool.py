@@ -0,0 +1,281 @@
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+
+import random
+import socket
+import threading
+import time
+
+# Connection pool for Modbus TCP devices, keyed by (host, port).
+#   - at most Limit connections per device are handed out (SolarEdge inverters accept very few sessions),
+#     further callers wait for a free one
+#   - connections are opened lazily with the first request and kept open when released; idle connections are
+#     probed by TCP keepalive and checked for a close by the device before they are reused
+#   - a failed connection is dropped and reopened with the next request, with an exponential backoff between
+#     the attempts
+#   - after Threshold consecutive failures the circuit of the device opens: requests fail immediately with
+#     ConnectionError until the backoff expired, then a single attempt is let through
+#
+# The pool is used transparently through tcp_connect():
+#
+#   pool = modbus_pool.ModbusPool(Limit = 1)
+#   tcpmodbus = modbus.SolarEdge()
+#   tcpmodbus.tcp_connect("wechselrichter1", 1502, 1, pool = pool)
+#   ...
+#   tcpmodbus.tcp_close()      # returns the connection to the pool
+
+
+# @brief raised if the circuit of a device is open
+class CircuitOpenError(ConnectionError):
+    pass
+
+
+# @brief a connection leased from the pool. provides the socket methods used by Modbus and reconnects lazily
+# after an error
+class PooledSocket:
+    def __init__(self, Pool, Device, Socket):
+        self.__pool = Pool
+        self.__device = Device
+        self.__socket = Socket
+        self.__timeout = Pool.Timeout
+        if Socket is not None:
+            Socket.settimeout(self.__timeout)
+
+    # @brief returns the connected socket, (re)connects if needed
+    def __connected(self):
+        if self.__socket is None:
+            if self.__device is None:
+                raise ConnectionError("connection returned to the pool")
+            self.__socket = self.__pool.Open(self.__device)
+            self.__socket.settimeout(self.__timeout)
+        return self.__socket
+
+    # @brief drops the connection after an error and reports the failure to the pool
+    def __failed(self):
+        if self.__socket is not None:
+            self.__socket.close()
+            self.__socket = None
+        self.__pool.Failure(self.__device)
+
+    def sendall(self, Data):
+        sock = self.__connected()
+        try:
+            return sock.sendall(Data)
+        except OSError:
+            self.__failed()
+            raise
+
+    def send(self, Data):
+        sock = self.__connected()
+        try:
+            return sock.send(Data)
+        except OSError:
+            self.__failed()
+            raise
+
+    def recv(self, Length):
+        if self.__socket is None:
+            raise ConnectionError("not connected")
+        try:
+            data = self.__socket.recv(Length)
+        except OSError:
+            self.__failed()
+            raise
+        if len(data) == 0:
+            self.__failed()
+        else:
+            self.__pool.Success(self.__device)
+        return data
+
+    def recv_into(self, View):
+        if self.__socket is None:
+            raise ConnectionError("not connected")
+        try:
+            received = self.__socket.recv_into(View)
+        except OSError:
+            self.__failed()
+            raise
+        if received == 0:
+            self.__failed()
+        else:
+            self.__pool.Success(self.__device)
+        return received
+
+    def settimeout(self, Timeout):
+        self.__timeout = Timeout
+        if self.__socket is not None:
+            self.__socket.settimeout(Timeout)
+
+    # @brief returns the connection to the pool
+    def close(self):
+        if self.__device is not None:
+            self.__pool.Release(self.__device, self.__socket)
+            self.__device = None
+            self.__socket = None
+
+
+class ModbusPool:
+    # state of one (host, port)
+    class __Device:
+        __slots__ = ("Leased", "Idle", "Failures", "RetryAt")
+
+        def __init__(self):
+            self.Leased = 0         # connections handed out
+            self.Idle = []          # (socket, released at) of the connections kept open
+            self.Failures = 0       # consecutive failures
+            self.RetryAt = 0        # no connection attempt before (monotonic time)
+
+    # @param Timeout: connect timeout and default socket timeout in seconds
+    # @param Limit: maximum number of connections per device
+    # @param KeepAlive: idle time in seconds before TCP keepalive probes are sent
+    # @param IdleTimeout: idle connections are closed after this time in seconds
+    # @param Backoff: first delay in seconds between reconnect attempts, doubled with each failure
+    # @param BackoffMax: maximum delay in seconds between reconnect attempts
+    # @param Threshold: consecutive failures opening the circuit
+    def __init__(self, Timeout = 1, Limit = 1, KeepAlive = 30, IdleTimeout = 300, Backoff = 0.5, BackoffMax = 60, Threshold = 3):
+        self.Timeout = Timeout
+        self.Limit = Limit
+        self.KeepAlive = KeepAlive
+        self.IdleTimeout = IdleTimeout
+        self.Backoff = Backoff
+        self.BackoffMax = BackoffMax
+        self.Threshold = Threshold
+        self.__devices = {}
+        self.__condition = threading.Condition()
+
+    # @brief leases a connection to the device. waits up to Timeout seconds if Limit connections are in use.
+    # The connection itself is opened with the first request. Raises CircuitOpenError if the device failed
+    # repeatedly and its backoff hasn't expired yet.
+    # @param Host: host name or IP address of the device
+    # @param Port: port of the device
+    def Connect(self, Host, Port):
+        device = (Host, Port)
+        deadline = time.monotonic() + self.Timeout
+        with self.__condition:
+            state = self.__devices.setdefault(device, self.__Device())
+            self.__check_circuit(device, state)
+            while state.Leased >= self.Limit:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ConnectionError("connection limit of %s:%d reached" % device)
+                self.__condition.wait(remaining)
+            state.Leased += 1
+            # reuse the most recently released connection which is still alive
+            sock = None
+            now = time.monotonic()
+            while len(state.Idle) > 0 and sock is None:
+                sock, released = state.Idle.pop()
+                if now - released > self.IdleTimeout or not self.__alive(sock):
+                    sock.close()
+                    sock = None
+        return PooledSocket(self, device, sock)
+
+    # @brief closes all idle connections
+    def Close(self):
+        with self.__condition:
+            for state in self.__devices.values():
+                for sock, released in state.Idle:
+                    sock.close()
+                state.Idle = []
+
+    # @brief returns the state of the devices {(host, port): (leased, idle, failures, circuit open)}
+    def Status(self):
+        now = time.monotonic()
+        with self.__condition:
+            return {device: (state.Leased, len(state.Idle), state.Failures,
+                    state.Failures >= self.Threshold and now < state.RetryAt)
+                for device, state in self.__devices.items()}
+
+    # @brief raises CircuitOpenError if the circuit of the device is open
+    def __check_circuit(self, Device, State):
+        if State.Failures >= self.Threshold and time.monotonic() < State.RetryAt:
+            raise CircuitOpenError("%s:%d unavailable, retry in %.1f s" % (Device + (State.RetryAt - time.monotonic(),)))
+
+    # the following methods are called by PooledSocket
+
+    # @brief opens a new connection to the device, respecting the backoff after failures
+    def Open(self, Device):
+        with self.__condition:
+            state = self.__devices[Device]
+            self.__check_circuit(Device, state)
+            delay = state.RetryAt - time.monotonic()
+        if delay > 0:
+            # below the threshold the backoff delays the attempt instead of failing it
+            time.sleep(delay)
+        try:
+            sock = socket.create_connection(Device, self.Timeout)
+        except OSError:
+            self.Failure(Device)
+            raise
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, max(1, int(self.KeepAlive)))
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, max(1, int(self.KeepAlive / 3)))
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+        return sock
+
+    # @brief records a failure of the device and computes the next retry time
+    def Failure(self, Device):
+        with self.__condition:
+            state = self.__devices[Device]
+            state.Failures += 1
+            backoff = min(self.BackoffMax, self.Backoff * 2 ** (state.Failures - 1))
+            state.RetryAt = time.monotonic() + backoff * random.uniform(0.8, 1.2)
+
+    # @brief records a successful transfer, closes the circuit
+    def Success(self, Device):
+        state = self.__devices[Device]
+        if state.Failures != 0:
+            with self.__condition:
+                state.Failures = 0
+                state.RetryAt = 0
+
+    # @brief takes the connection back from a PooledSocket
+    def Release(self, Device, Socket):
+        with self.__condition:
+            state = self.__devices[Device]
+            state.Leased -= 1
+            if Socket is not None:
+                state.Idle.append((Socket, time.monotonic()))
+            self.__condition.notify()
+
+    # @brief returns False if the device closed the idle connection or sent unexpected data
+    @staticmethod
+    def __alive(Socket):
+        try:
+            Socket.setblocking(False)
+            try:
+                data = Socket.recv(1, socket.MSG_PEEK)
+            finally:
+                Socket.setblocking(True)
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+        # b"": closed by the device, data: stray response which would desync the next request
+        return False
@@ -0,0 +1,304 @@
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+import asyncio
+import collections
+import concurrent.futures
+import struct
+import threading
+import time
+import modbus
+
+# Caching Modbus TCP proxy in front of devices which accept only a few client connections (SolarEdge inverters
+# accept a single one). The proxy keeps one upstream connection per device, opened with the Modbus client, and
+# accepts any number of downstream Modbus TCP clients on a port per device:
+#   - the requests of all clients are forwarded over the upstream connection, pipelined within its window.
+#     The client assigns its own message IDs, the responses are returned with the transaction ID of the
+#     downstream request
+#   - read responses (function codes 3 and 4) are cached for TTL seconds per (unit, function code, address,
+#     count), repeated reads of the same range are answered from the cache
+#   - identical reads arriving while one is in flight wait for its response instead of being forwarded again,
+#     unless a write of the unit was forwarded after it
+#   - writes and all other function codes are forwarded one after the other in the order they arrive and drop
+#     the cached reads of their unit
+# so the read traffic to the device stays flat however many clients poll it:
+#
+#   proxy = modbus_proxy.ModbusProxy(TTL = 1)
+#   proxy.Start()
+#   proxy.Add("wechselrichter1", 1502, 1502)
+#
+# Errors of the upstream connection are answered with the gateway exception codes: "gateway path unavailable"
+# if the device can't be connected, "gateway target device failed to respond" on a timeout.
+
+
+class ModbusProxy:
+    # function codes answered from the cache
+    Cacheable = (3, 4)
+    # modbus exception codes of gateways
+    GatewayPathUnavailable = 0x0A
+    GatewayTargetFailed = 0x0B
+
+    # state of one upstream device
+    class __Upstream:
+        __slots__ = ("Host", "Port", "Client", "Lock", "WriteLock", "Cache", "Inflight", "Generation", "Statistics")
+
+    # @param Host: address the proxy listens on
+    # @param TTL: time in seconds a read response is answered from the cache, 0 disables the cache (identical
+    # reads in flight are still coalesced)
+    # @param Timeout: timeout of the upstream requests in seconds
+    # @param Client: client class of the upstream connections
+    # @param Workers: number of threads running the upstream requests
+    # @param CacheSize: maximum number of cached responses per device, the least recently used are evicted
+    # @param Pool: optional modbus_pool.ModbusPool providing the upstream connections
+    def __init__(self, Host = "0.0.0.0", TTL = 1.0, Timeout = 1, Client = modbus.Modbus, Workers = 16, CacheSize = 4096,
+            Pool = None):
+        self.Host = Host
+        self.TTL = TTL
+        self.Timeout = Timeout
+        self.Client = Client
+        self.Workers = Workers
+        self.CacheSize = CacheSize
+        self.Pool = Pool
+        # per device "host:port": requests of the clients, forwarded requests, requests answered from the cache,
+        # coalesced requests and upstream errors
+        self.Statistics = {}
+        self.__upstreams = []
+        self.__servers = []
+        self.__connections = {}        # task serving an open connection -> its writer
+        self.__executor = None
+        self.__loop = None
+        self.__thread = None
+
+    # @brief starts the event loop serving the clients in a background thread
+    def Start(self):
+        self.__executor = concurrent.futures.ThreadPoolExecutor(self.Workers, "modbus-proxy")
+        self.__loop = asyncio.new_event_loop()
+        self.__thread = threading.Thread(target = self.__loop.run_forever, daemon = True)
+        self.__thread.start()
+
+    # @brief serves the device (from any thread, after Start()). returns the port the clients connect to
+    # @param Host: IP address or host name of the device
+    # @param Port: port of the device
+    # @param Listen: TCP port of the proxy, 0 for any free port
+    def Add(self, Host, Port, Listen = 0):
+        return asyncio.run_coroutine_threadsafe(self.Serve(Host, Port, Listen), self.__loop).result()
+
+    # @brief serves the device on the running event loop. returns the port the clients connect to
+    # @param Host: IP address or host name of the device
+    # @param Port: port of the device
+    # @param Listen: TCP port of the proxy, 0 for any free port
+    async def Serve(self, Host, Port, Listen = 0):
+        upstream = self.__Upstream()
+        upstream.Host = Host
+        upstream.Port = Port
+        upstream.Client = None
+        upstream.Lock = threading.Lock()
+        upstream.WriteLock = asyncio.Lock()
+        upstream.Cache = collections.OrderedDict()
+        upstream.Inflight = {}
+        # number of writes per unit, reads overlapping a write aren't cached
+        upstream.Generation = collections.Counter()
+        upstream.Statistics = self.Statistics.setdefault("%s:%d" % (Host, Port),
+            {"Requests": 0, "Forwarded": 0, "Cached": 0, "Coalesced": 0, "Errors": 0})
+        self.__upstreams.append(upstream)
+        server = await asyncio.start_server(lambda reader, writer: self.__connection(upstream, reader, writer),
+            self.Host, Listen)
+        self.__servers.append(server)
+        return server.sockets[0].getsockname()[1]
+
+    # @brief stops serving the clients, the event loop started by Start() and closes the upstream connections
+    def Stop(self):
+        if self.__loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.__close(), self.__loop).result()
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+        self.__loop.close()
+        self.__loop = None
+        self.__executor.shutdown()
+        for upstream in self.__upstreams:
+            self.__disconnect(upstream, upstream.Client)
+        self.__upstreams = []
+
+    async def __close(self):
+        for server in self.__servers:
+            server.close()
+        for writer in self.__connections.values():
+            writer.close()
+        await asyncio.gather(*self.__connections, return_exceptions = True)
+        for server in self.__servers:
+            await server.wait_closed()
+        self.__servers = []
+
+    # @brief serves one client connection. the requests are answered concurrently, each response carries the
+    # transaction ID of its request
+    async def __connection(self, Upstream, Reader, Writer):
+        task = asyncio.current_task()
+        self.__connections[task] = Writer
+        answers = set()
+        try:
+            while True:
+                messageId, protocolId, length, unitId = struct.unpack(">HHHB", await Reader.readexactly(7))
+                if protocolId != 0 or length < 2 or length > 254:
+                    break
+                pdu = await Reader.readexactly(length - 1)
+                answer = asyncio.ensure_future(self.__answer(Upstream, Writer, messageId, unitId, pdu))
+                answers.add(answer)
+                answer.add_done_callback(answers.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.__connections.pop(task, None)
+            for answer in answers:
+                answer.cancel()
+            Writer.close()
+
+    # @brief answers one request of a client
+    async def __answer(self, Upstream, Writer, MessageId, UnitId, Pdu):
+        response = await self.__handle(Upstream, UnitId, Pdu)
+        if Writer.is_closing():
+            return
+        Writer.write(struct.pack(">HHHB", MessageId, 0, len(response) + 1, UnitId) + response)
+        try:
+            await Writer.drain()
+        except ConnectionError:
+            pass
+
+    # @brief returns the response PDU of a request: from the cache, from an identical read in flight or
+    # forwarded to the device. The forwarded requests run as tasks of their own, they complete even if the client
+    # which sent them disconnects
+    async def __handle(self, Upstream, UnitId, Pdu):
+        statistics = Upstream.Statistics
+        statistics["Requests"] += 1
+        if Pdu[0] not in self.Cacheable or len(Pdu) != 5:
+            return await asyncio.shield(asyncio.ensure_future(self.__write(Upstream, UnitId, Pdu)))
+        key = (UnitId, Pdu)
+        entry = Upstream.Cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            statistics["Cached"] += 1
+            Upstream.Cache.move_to_end(key)
+            return entry[1]
+        # only reads sent after the last write of the unit are joined, an older one may answer with the
+        # registers from before the write
+        generation = Upstream.Generation[UnitId]
+        inflight = Upstream.Inflight.get(key + (generation,))
+        if inflight is None:
+            inflight = asyncio.ensure_future(self.__read(Upstream, UnitId, Pdu, key, generation))
+            Upstream.Inflight[key + (generation,)] = inflight
+        else:
+            statistics["Coalesced"] += 1
+        return await asyncio.shield(inflight)
+
+    # @brief forwards a read and caches its response
+    # @param Key: cache key (unit ID, request PDU)
+    # @param Generation: number of writes of the unit when the read was sent
+    async def __read(self, Upstream, UnitId, Pdu, Key, Generation):
+        try:
+            response = await self.__forward(Upstream, UnitId, Pdu)
+        finally:
+            del Upstream.Inflight[Key + (Generation,)]
+        # valid responses and "illegal data address" are answered from the cache, busy and gateway errors not.
+        # a read overlapping a write of the unit may have been answered before the write
+        if self.TTL > 0 and Generation == Upstream.Generation[UnitId] and (response[0] == Pdu[0]
+                or response[1] == modbus.Modbus.IllegalDataAddress):
+            Upstream.Cache[Key] = (time.monotonic() + self.TTL, response)
+            Upstream.Cache.move_to_end(Key)
+            while len(Upstream.Cache) > self.CacheSize:
+                Upstream.Cache.popitem(last = False)
+        return response
+
+    # @brief forwards a write (or any other request which isn't cached) after the ones which arrived before it
+    # and drops the cached reads of the unit
+    async def __write(self, Upstream, UnitId, Pdu):
+        async with Upstream.WriteLock:
+            Upstream.Generation[UnitId] += 1
+            self.__invalidate(Upstream, UnitId)
+            try:
+                return await self.__forward(Upstream, UnitId, Pdu)
+            finally:
+                Upstream.Generation[UnitId] += 1
+                self.__invalidate(Upstream, UnitId)
+
+    # @brief drops the cached reads of the unit
+    @staticmethod
+    def __invalidate(Upstream, UnitId):
+        for key in [key for key in Upstream.Cache if key[0] == UnitId]:
+            del Upstream.Cache[key]
+
+    # @brief forwards the request to the device on a worker thread. returns the response PDU
+    async def __forward(self, Upstream, UnitId, Pdu):
+        Upstream.Statistics["Forwarded"] += 1
+        response = await asyncio.get_running_loop().run_in_executor(self.__executor, self.__request, Upstream,
+            UnitId, Pdu)
+        if response[0] == Pdu[0] | 0x80 and response[1] in (self.GatewayPathUnavailable, self.GatewayTargetFailed):
+            Upstream.Statistics["Errors"] += 1
+        return response
+
+    # @brief sends the request over the upstream connection (worker thread). connects if there is no connection,
+    # a failed connection is closed and reopened by the next request
+    def __request(self, Upstream, UnitId, Pdu):
+        with Upstream.Lock:
+            client = Upstream.Client
+            if client is None:
+                client = self.Client()
+                try:
+                    client.tcp_connect(Upstream.Host, Upstream.Port, self.Timeout, pool = self.Pool)
+                except Exception:
+                    return bytes((Pdu[0] | 0x80, self.GatewayPathUnavailable))
+                Upstream.Client = client
+        try:
+            return client.Request(UnitId, Pdu)
+        except Exception:
+            self.__disconnect(Upstream, client)
+            return bytes((Pdu[0] | 0x80, self.GatewayTargetFailed))
+
+    # @brief closes the upstream connection unless it was already replaced
+    @staticmethod
+    def __disconnect(Upstream, Client):
+        with Upstream.Lock:
+            if Client is None or Upstream.Client is not Client:
+                return
+            Upstream.Client = None
+        try:
+            Client.tcp_close()
+        except Exception:
+            pass
+
+
+if __name__ == "__main__":
+    import sys
+    # modbus_proxy.py host [port] [listen port] [TTL]
+    host = sys.argv[1]
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 1502
+    listen = int(sys.argv[3]) if len(sys.argv) > 3 else port
+    proxy = ModbusProxy(TTL = float(sys.argv[4]) if len(sys.argv) > 4 else 1.0)
+    proxy.Start()
+    print("%s:%d: port %d" % (host, port, proxy.Add(host, port, listen)))
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        proxy.Stop()
@@ -0,0 +1,339 @@
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+
+import collections
+import os
+import select
+import socket
+import struct
+import threading
+import time
+try:
+    import termios
+except ImportError:
+    termios = None
+
+# Modbus RTU transport for devices on a RS485 bus, e.g. SolarEdge followers and meters behind a serial port or a
+# serial gateway. ModbusRtu takes the place of the TCP socket of Modbus: the MBAP frames of the client are
+# converted to RTU frames (unit ID, PDU, CRC16) and back, so the pipelining, hole learning and the SunSpec and
+# SolarEdge reads work unchanged. The requests are put on the bus one after the other, each after the t3.5
+# silence following the previous frame. The link is a serial port (SerialLink, also a pseudo-terminal) or a TCP
+# connection to a gateway forwarding the RTU frames (TcpLink, "RTU over TCP"):
+#
+#   tcpmodbus = modbus.SolarEdge()
+#   tcpmodbus.rtu_connect("/dev/ttyUSB0", 9600, 1)
+#   tcpmodbus.rtu_tcp_connect("gateway1", 502, 1)
+
+# @brief returns the table of the Modbus CRC16 (polynomial 0xA001, reflected), one entry per byte value
+def CrcTableEntries():
+    table = []
+    for byte in range(256):
+        crc = byte
+        for bit in range(8):
+            crc = (crc >> 1) ^ 0xa001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+CrcTable = CrcTableEntries()
+
+
+# @brief returns the CRC16 of the data, transmitted low byte first
+# @param Data: bytes of the frame without the CRC
+def Crc16(Data):
+    crc = 0xffff
+    table = CrcTable
+    for byte in Data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xff]
+    return crc
+
+
+# @brief returns the RTU frame of the PDU
+# @param UnitId: unit ID (uint8)
+# @param Pdu: function code and data
+def Frame(UnitId, Pdu):
+    frame = bytearray(len(Pdu) + 3)
+    frame[0] = UnitId
+    frame[1:-2] = Pdu
+    struct.pack_into("<H", frame, len(frame) - 2, Crc16(frame[:-2]))
+    return frame
+
+
+# @brief returns the length of the RTU frame at the start of Data or None if it isn't known yet. Frames of
+# unknown function codes are delimited by silence only, 0 is returned for them.
+# @param Data: received bytes
+# @param Request: True for a request frame, False for a response frame
+def FrameLength(Data, Request = False):
+    if len(Data) < 2:
+        return None
+    functionCode = Data[1]
+    if functionCode & 0x80:
+        # exception response
+        return 5
+    if functionCode in (5, 6):
+        # write single coil / register, the response repeats the request
+        return 8
+    if functionCode in (1, 2, 3, 4):
+        if Request:
+            return 8
+        return 5 + Data[2] if len(Data) > 2 else None
+    if functionCode in (15, 16):
+        if not Request:
+            return 8
+        return 9 + Data[6] if len(Data) > 6 else None
+    if functionCode == 23:
+        if Request:
+            # read/write multiple registers: read address and count, write address and count, byte count
+            return 13 + Data[10] if len(Data) > 10 else None
+        return 5 + Data[2] if len(Data) > 2 else None
+    return 0
+
+
+# @brief serial port in raw mode (8 data bits). pseudo-terminals are accepted as well, the baudrate is then
+# ignored. POSIX only.
+class SerialLink:
+    # termios flags of the parities
+    Parities = {"N": (), "E": ("PARENB",), "O": ("PARENB", "PARODD")}
+
+    # @param Port: path of the serial port, e.g. "/dev/ttyUSB0"
+    # @param Baudrate: bits per second
+    # @param Parity: "N", "E" or "O"
+    # @param StopBits: 1 or 2
+    def __init__(self, Port, Baudrate, Parity = "E", StopBits = 1):
+        if termios is None:
+            raise NotImplementedError("serial ports require termios")
+        if Parity not in self.Parities:
+            raise ValueError("unsupported parity %r" % (Parity,))
+        self.__fd = os.open(Port, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        try:
+            iflag, oflag, cflag, lflag, ispeed, ospeed, cc = termios.tcgetattr(self.__fd)
+            cflag = termios.CS8 | termios.CREAD | termios.CLOCAL
+            for flag in self.Parities[Parity]:
+                cflag |= getattr(termios, flag)
+            if StopBits == 2:
+                cflag |= termios.CSTOPB
+            speed = getattr(termios, "B%d" % Baudrate)
+            cc[termios.VMIN] = 0
+            cc[termios.VTIME] = 0
+            termios.tcsetattr(self.__fd, termios.TCSANOW, [0, 0, cflag, 0, speed, speed, cc])
+            termios.tcflush(self.__fd, termios.TCIOFLUSH)
+        except BaseException:
+            os.close(self.__fd)
+            raise
+
+    def send(self, Data):
+        view = memoryview(Data)
+        while len(view) > 0:
+            try:
+                view = view[os.write(self.__fd, view):]
+            except BlockingIOError:
+                select.select([], [self.__fd], [])
+
+    # @brief receives the available bytes into View, waits up to Timeout seconds for them. returns the number of
+    # bytes received, 0 if none arrived in time
+    def recv_into(self, View, Timeout):
+        if not select.select([self.__fd], [], [], max(Timeout, 0))[0]:
+            return 0
+        try:
+            return os.readv(self.__fd, [View])
+        except BlockingIOError:
+            return 0
+
+    def close(self):
+        os.close(self.__fd)
+
+
+# @brief TCP connection to a gateway forwarding RTU frames to the bus ("RTU over TCP")
+class TcpLink:
+    # @param Host: host name or IP address of the gateway
+    # @param Port: port of the gateway
+    # @param Timeout: timeout for connecting in seconds
+    def __init__(self, Host, Port, Timeout):
+        self.__socket = socket.create_connection((Host, Port), Timeout)
+        self.__socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def send(self, Data):
+        self.__socket.sendall(Data)
+
+    def recv_into(self, View, Timeout):
+        if Timeout <= 0:
+            return 0
+        self.__socket.settimeout(Timeout)
+        try:
+            received = self.__socket.recv_into(View)
+        except socket.timeout:
+            return 0
+        if received == 0:
+            raise ConnectionError("connection closed by the gateway")
+        return received
+
+    def close(self):
+        self.__socket.close()
+
+
+# @brief socket-like transport of Modbus converting the MBAP frames to RTU frames on the link and back. Requests
+# sent while one is on the bus are queued. A response with a CRC error, of another unit or not matching the
+# request is returned as an invalid frame (function code 0), a missing one raises socket.timeout.
+class ModbusRtu:
+    # silence between two frames above 19200 baud
+    MinSilence = 0.00175
+
+    # @param Link: SerialLink or TcpLink
+    # @param Baudrate: baudrate of the bus to time the frames, None without timing (RTU over TCP)
+    def __init__(self, Link, Baudrate = None):
+        self.__link = Link
+        # characters of 11 bits (start, 8 data, parity or stop, stop)
+        self.__character = 11 / Baudrate if Baudrate else 0
+        self.__t35 = max(3.5 * self.__character, self.MinSilence) if Baudrate else 0
+        # silence ending a frame of unknown length
+        self.__silence = self.__t35 if Baudrate else self.MinSilence
+        self.__timeout = None
+        self.__condition = threading.Condition()
+        self.__queue = collections.deque()  # requests waiting for the bus (message ID, unit ID, function code, frame)
+        self.__current = None               # request on the bus (message ID, unit ID, function code, deadline)
+        self.__idle = 0                     # time the bus is silent long enough for the next frame
+        self.__rx = bytearray()             # received RTU bytes
+        self.__rx_chunk = bytearray(512)
+        self.__out = bytearray()            # MBAP frames returned by recv()
+
+    # @brief queues the MBAP request frame and puts it on the bus when it is free
+    def sendall(self, Data):
+        messageId, protocolId, length, unitId = struct.unpack_from(">HHHB", Data)
+        request = (messageId, unitId, Data[7], Frame(unitId, Data[7:6 + length]))
+        with self.__condition:
+            self.__queue.append(request)
+            if self.__current is None:
+                self.__transmit()
+
+    def send(self, Data):
+        self.sendall(Data)
+        return len(Data)
+
+    def recv(self, Length):
+        if len(self.__out) == 0:
+            self.__receive()
+        data = bytes(self.__out[:Length])
+        del self.__out[:Length]
+        return data
+
+    def recv_into(self, View):
+        if len(self.__out) == 0:
+            self.__receive()
+        length = min(len(View), len(self.__out))
+        View[:length] = self.__out[:length]
+        del self.__out[:length]
+        return length
+
+    def settimeout(self, Timeout):
+        self.__timeout = Timeout
+
+    def close(self):
+        self.__link.close()
+
+    # @brief puts the next queued request on the bus after the silence following the previous frame. called with
+    # the condition held.
+    def __transmit(self):
+        messageId, unitId, functionCode, frame = self.__queue.popleft()
+        delay = self.__idle - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self.__rx.clear()
+        self.__link.send(frame)
+        now = time.monotonic()
+        # the frame is on the wire until all its characters are sent
+        sent = now + len(frame) * self.__character
+        self.__idle = sent + self.__t35
+        if unitId == 0:
+            # broadcasts aren't answered
+            self.__out += struct.pack(">HHHBBB", messageId, 0, 3, unitId, 0, 0)
+            self.__current = None
+            if len(self.__queue) > 0:
+                self.__transmit()
+            return
+        deadline = sent + self.__timeout if self.__timeout is not None else float("inf")
+        self.__current = (messageId, unitId, functionCode, deadline)
+        self.__condition.notify_all()
+
+    # @brief receives the response to the request on the bus and converts it to a MBAP frame
+    def __receive(self):
+        with self.__condition:
+            if len(self.__out) > 0:
+                return
+            if self.__current is None:
+                # the request is being queued by another thread
+                if not self.__condition.wait_for(lambda: self.__current is not None or len(self.__out) > 0,
+                        self.__timeout):
+                    raise socket.timeout("timed out")
+                if len(self.__out) > 0:
+                    return
+            messageId, unitId, functionCode, deadline = self.__current
+        try:
+            frame = self.__read_frame(functionCode, deadline)
+        except BaseException:
+            with self.__condition:
+                # the requests in flight are failed by the client
+                self.__current = None
+                self.__queue.clear()
+            raise
+        valid = len(frame) >= 4 and frame[0] == unitId and frame[1] & 0x7f == functionCode \
+            and Crc16(frame[:-2]) == frame[-2] | frame[-1] << 8
+        with self.__condition:
+            if valid:
+                self.__out += struct.pack(">HHH", messageId, 0, len(frame) - 2) + frame[:-2]
+            else:
+                self.__out += struct.pack(">HHHBBB", messageId, 0, 3, unitId, 0, 0)
+            self.__idle = max(self.__idle, time.monotonic() + self.__t35)
+            self.__current = None
+            if len(self.__queue) > 0:
+                self.__transmit()
+
+    # @brief returns the next frame received from the link. raises socket.timeout if it isn't complete by the
+    # deadline
+    def __read_frame(self, FunctionCode, Deadline):
+        rx = self.__rx
+        chunk = memoryview(self.__rx_chunk)
+        while True:
+            length = FrameLength(rx)
+            if length is not None and 0 < length <= len(rx):
+                break
+            remaining = Deadline - time.monotonic()
+            if remaining <= 0:
+                raise socket.timeout("timed out")
+            if length == 0 or (length is not None and rx[1] & 0x7f != FunctionCode):
+                # unknown frame, ends with silence
+                received = self.__link.recv_into(chunk, min(remaining, self.__silence))
+                if received == 0:
+                    length = len(rx)
+                    break
+            else:
+                received = self.__link.recv_into(chunk, remaining)
+            rx += chunk[:received]
+        frame = bytes(rx[:length])
+        # bytes following the frame are noise
+        rx.clear()
+        return frame
@@ -0,0 +1,231 @@
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+
+import heapq
+import random
+import threading
+import time
+from collections import namedtuple
+import modbus
+
+# Fleet polling scheduler. Every (device, job) pair is polled at the interval of the job on a bounded pool of
+# worker threads:
+#   - the runnable polls are ordered by their deadline (the time the next poll becomes due)
+#   - the first poll of a job starts at a random phase and every poll is jittered so devices sharing an
+#     interval don't poll in synchronized bursts
+#   - a poll which can't be started before its deadline is skipped (skip-if-late), it would only delay the
+#     following one
+#   - at most one poll per (host, port) is running at a time, so the Modbus stack of an inverter sees a single
+#     client connection with a bounded request rate
+#
+#   scheduler = modbus_scheduler.Scheduler(
+#       [modbus_scheduler.Device("wechselrichter1", 1502, 1)],
+#       [modbus_scheduler.Job("inverter", 1, modbus_scheduler.SunSpecBlock(103)),
+#        modbus_scheduler.Job("common", 3600, modbus_scheduler.SunSpecBlock(1)),
+#        modbus_scheduler.Job("trip_limits", 86400, modbus_scheduler.SolarEdgeRead("GridProtectionTripLimits"))],
+#       Callback = print)
+#   scheduler.Start()
+
+# device to poll
+Device = namedtuple("Device", ["Host", "Port", "UnitId"])
+# poll job: Read(client, UnitId) is called every Interval seconds for each device
+Job = namedtuple("Job", ["Name", "Interval", "Read"])
+
+
+# @brief returns a read function for the SunSpec block BlockId. the address of the block is taken from the
+# SunSpec discovery of the device
+# @param BlockId: SunSpec block ID (e.g. 1: common, 103: three phase inverter)
+# @param Index: index of the block if the device has several blocks with the same ID
+def SunSpecBlock(BlockId, Index = 0):
+    def Read(client, UnitId):
+        blocks = client.SunSpec(UnitId)
+        if blocks is None:
+            return None
+        blocks = [block for block in blocks if block.BlockId == BlockId]
+        if Index >= len(blocks):
+            return None
+        return client.ReadBlock(UnitId, blocks[Index].Address, BlockId, Length = blocks[Index].Length)
+    return Read
+
+
+# @brief returns a read function calling the SolarEdge method Name, e.g. SolarEdgeRead("SmartMeter", 1)
+# @param Name: name of the method of modbus.SolarEdge
+# @param Args: arguments following the unit ID
+def SolarEdgeRead(Name, *Args):
+    def Read(client, UnitId):
+        return getattr(client, Name)(UnitId, *Args)
+    return Read
+
+
+class Scheduler:
+    # state of one (device, job) pair
+    class __Task:
+        __slots__ = ("Device", "Job", "Due", "Deadline")
+
+    # @param Devices: list of Device (host, port, unit ID)
+    # @param Jobs: list of Job (name, interval, read function)
+    # @param Callback: called as Callback(device, job name, result, timestamp) for every poll. result is
+    # the exception raised if the poll failed
+    # @param Workers: number of worker threads
+    # @param Jitter: random jitter of each poll as fraction of the interval
+    # @param Timeout: connection timeout in seconds
+    # @param Client: client class used for the devices
+    # @param Pool: optional modbus_pool.ModbusPool providing the connections
+    def __init__(self, Devices, Jobs, Callback = None, Workers = 8, Jitter = 0.05, Timeout = 1, Client = modbus.SolarEdge, Pool = None):
+        self.Callback = Callback
+        self.Workers = Workers
+        self.Jitter = Jitter
+        self.Timeout = Timeout
+        self.Client = Client
+        self.Pool = Pool
+        # statistics per job name: [polls, skipped, failed]
+        self.Statistics = {}
+        self.__condition = threading.Condition()
+        self.__due = []         # heap (due, seq, task) of the tasks waiting for their due time
+        self.__ready = []       # heap (deadline, seq, task) of the due tasks
+        self.__seq = 0
+        self.__busy = set()     # (host, port) of the devices with a poll running
+        self.__clients = {}     # (host, port) -> connected client, shared by the unit IDs behind it
+        self.__threads = []
+        self.__running = False
+        for device in Devices:
+            for job in Jobs:
+                self.Add(Device(*device), job)
+
+    # @brief adds a (device, job) pair. the first poll starts at a random phase within the interval
+    def Add(self, Device, Job):
+        task = self.__Task()
+        task.Device = Device
+        task.Job = Job
+        with self.__condition:
+            self.Statistics.setdefault(Job.Name, [0, 0, 0])
+            self.__schedule(task, time.monotonic() + random.uniform(0, Job.Interval))
+            self.__condition.notify()
+
+    # @brief queues the task for its next poll at Due (plus jitter)
+    def __schedule(self, Task, Due):
+        Task.Due = Due + random.uniform(-self.Jitter, self.Jitter) * Task.Job.Interval
+        Task.Deadline = Due + Task.Job.Interval
+        self.__seq += 1
+        heapq.heappush(self.__due, (Task.Due, self.__seq, Task))
+
+    # @brief returns the next runnable task, skipping the ones which missed their deadline. waits until a
+    # task is due. returns None if the scheduler was stopped
+    def __next(self):
+        with self.__condition:
+            while self.__running:
+                now = time.monotonic()
+                while len(self.__due) > 0 and self.__due[0][0] <= now:
+                    due, seq, task = heapq.heappop(self.__due)
+                    heapq.heappush(self.__ready, (task.Deadline, seq, task))
+                deferred = []
+                task = None
+                while len(self.__ready) > 0:
+                    entry = heapq.heappop(self.__ready)
+                    if entry[0] <= now:
+                        # late: skip this poll and wait for the next slot
+                        self.Statistics[entry[2].Job.Name][1] += 1
+                        self.__schedule(entry[2], entry[0])
+                    elif entry[2].Device[:2] in self.__busy:
+                        deferred.append(entry)
+                    else:
+                        task = entry[2]
+                        break
+                for entry in deferred:
+                    heapq.heappush(self.__ready, entry)
+                if task is not None:
+                    self.__busy.add(task.Device[:2])
+                    return task
+                # wait for the next due task, the deadline of a deferred one, a finished poll or a new task
+                wakeup = [entry[0] for entry in self.__due[:1] + self.__ready[:1]]
+                self.__condition.wait(min(wakeup) - now if len(wakeup) > 0 else None)
+            return None
+
+    # @brief returns the connected client of the device
+    def __client(self, Device):
+        client = self.__clients.get(Device[:2])
+        if client is None:
+            client = self.Client()
+            client.tcp_connect(Device.Host, Device.Port, self.Timeout, pool = self.Pool)
+            self.__clients[Device[:2]] = client
+        return client
+
+    # @brief drops the connection of the device, it is reconnected by the next poll
+    def __disconnect(self, Device):
+        client = self.__clients.pop(Device[:2], None)
+        if client is not None:
+            try:
+                client.tcp_close()
+            except OSError:
+                pass
+
+    # @brief worker thread: polls the runnable tasks until the scheduler is stopped
+    def __worker(self):
+        while True:
+            task = self.__next()
+            if task is None:
+                return
+            try:
+                result = task.Job.Read(self.__client(task.Device), task.Device.UnitId)
+            except Exception as e:
+                # timeout or connection lost: reconnect with the next poll
+                self.__disconnect(task.Device)
+                result = e
+            timestamp = time.time()
+            with self.__condition:
+                statistics = self.Statistics[task.Job.Name]
+                statistics[0] += 1
+                if isinstance(result, Exception):
+                    statistics[2] += 1
+                self.__busy.discard(task.Device[:2])
+                self.__schedule(task, task.Deadline)
+                self.__condition.notify_all()
+            if self.Callback is not None:
+                self.Callback(task.Device, task.Job.Name, result, timestamp)
+
+    # @brief starts the worker threads
+    def Start(self):
+        with self.__condition:
+            if self.__running:
+                return
+            self.__running = True
+        for i in range(self.Workers):
+            thread = threading.Thread(target = self.__worker, name = "modbus-scheduler-%d" % i, daemon = True)
+            thread.start()
+            self.__threads.append(thread)
+
+    # @brief stops the worker threads (after the running polls) and closes the connections
+    def Stop(self):
+        with self.__condition:
+            self.__running = False
+            self.__condition.notify_all()
+        for thread in self.__threads:
+            thread.join()
+        self.__threads = []
+        for device in list(self.__clients):
+            self.__disconnect(Device(*device, 0))
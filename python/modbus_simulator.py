@@ -0,0 +1,506 @@
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+
+import asyncio
+import json
+import os
+import random
+import struct
+import threading
+from modbus import ModbusPlan, SunSpec, SolarEdge
+from modbus_rtu import Crc16, Frame, FrameLength
+from sunspec_specification import SunSpec_Specification
+
+# Modbus TCP simulator of SunSpec / SolarEdge devices for development and load tests without real inverters.
+# A SimulatedDevice holds a register map, built from the SunSpec models (AddSunSpec()), the SolarEdge meter,
+# battery and trip limit ranges (AddSolarEdge()) or a snapshot of a real device (Capture(), Restore()). The
+# devices are served by ModbusSimulator on one asyncio event loop, one port per device, so a single process can
+# simulate hundreds of inverters. Latency, jitter, split response frames, unreadable holes, exception responses
+# and connection limits are configured per device. Several devices are also served as the followers on a RS485
+# bus, via a pseudo-terminal (AddRtu()) or RTU over TCP (AddRtuTcp()).
+#
+#   simulator = modbus_simulator.ModbusSimulator()
+#   simulator.Start()
+#   port = simulator.Add(modbus_simulator.SolarEdgeInverter("7E0001", Latency = 0.02))
+#   tcpmodbus = modbus.SolarEdge()
+#   tcpmodbus.tcp_connect("127.0.0.1", port, 1)
+#   terminal = simulator.AddRtu({1: modbus_simulator.SolarEdgeInverter("7E0002")})
+#   tcpmodbus.rtu_connect(terminal, 115200, 1)
+#
+# or from the command line: python modbus_simulator.py [count] [first port]
+
+
+class SimulatedDevice:
+    # modbus exception codes
+    IllegalFunction = 0x01
+    IllegalDataAddress = 0x02
+    IllegalDataValue = 0x03
+    ServerDeviceBusy = 0x06
+
+    # @param Latency: delay of each response in seconds
+    # @param Jitter: additional random delay of each response in seconds (0 .. Jitter)
+    # @param Split: maximum number of bytes sent at once, responses are split into several TCP segments
+    # @param Holes: unreadable register ranges [(first, end)], requests overlapping them fail with "illegal data
+    # address"
+    # @param Exceptions: register ranges [(first, end, exception code)] answered with an exception response
+    # @param ExceptionRate: probability of a "server device busy" exception response to any request
+    # @param MaxConnections: maximum number of concurrent connections, further connections are closed at once
+    # @param UnitIds: unit IDs the device answers, None for all
+    # @param MaxRegisters: maximum number of registers per read request
+    # @param DropRate: probability a request isn't answered, like a frame lost behind a gateway
+    def __init__(self, Latency = 0, Jitter = 0, Split = None, Holes = (), Exceptions = (), ExceptionRate = 0,
+            MaxConnections = None, UnitIds = None, MaxRegisters = 125, DropRate = 0):
+        self.Latency = Latency
+        self.Jitter = Jitter
+        self.Split = Split
+        self.Holes = list(Holes)
+        self.Exceptions = list(Exceptions)
+        self.ExceptionRate = ExceptionRate
+        self.MaxConnections = MaxConnections
+        self.UnitIds = UnitIds
+        self.MaxRegisters = MaxRegisters
+        self.DropRate = DropRate
+        # statistics
+        self.Connections = 0
+        self.Requests = 0
+        self.BytesReceived = 0
+        self.BytesSent = 0
+        self.__registers = bytearray(0x20000)
+        # 1 for each register of the map
+        self.__mapped = bytearray(0x10000)
+
+    # @brief sets raw registers (big-endian) of the map
+    # @param Address: first register
+    # @param Data: register data, 2 bytes per register
+    def Set(self, Address, Data):
+        self.__registers[Address * 2:Address * 2 + len(Data)] = Data
+        self.__mapped[Address:Address + len(Data) // 2] = b"\x01" * (len(Data) // 2)
+
+    # @brief returns Count raw registers starting at Address
+    def Get(self, Address, Count):
+        return bytes(self.__registers[Address * 2:(Address + Count) * 2])
+
+    # @brief encodes the values with the register definition (see ModbusPlan.Pack()) and sets them at Address
+    # @param Address: first register of the block
+    # @param Definitions: register definition {offset: (name, type, length)}
+    # @param Values: dictionary {name: value}, missing values are "not implemented"
+    def Write(self, Address, Definitions, Values):
+        self.Set(Address, ModbusPlan.Compile(Definitions).Pack(Values))
+
+    # @brief builds a SunSpec register map: the SunSpec marker at Base, the models and the end marker.
+    # returns the list of SunSpecBlock as discovered by SunSpec.SunSpec()
+    # @param Models: list of (BlockId, Values) or (BlockId, Values, Length). The points of a repeating group are
+    # given as list of dictionaries under the name of the group (see SunSpec.NestGroups()), Length defaults to
+    # the length of the model with the given repeats
+    # @param Base: SunSpec base address
+    def AddSunSpec(self, Models, Base = 40000):
+        self.Set(Base, b"SunS")
+        address = Base + 2
+        blocks = []
+        for model in Models:
+            BlockId, Values = model[0], dict(model[1])
+            group = SunSpec_Specification.Specification.Group(BlockId)
+            if len(model) > 2:
+                Length = model[2]
+            elif group is not None:
+                Length = group.FixedLength - 2 + len(Values.get(group.Name, ())) * group.RepeatLength
+            else:
+                Length = ModbusPlan.Compile(SunSpec.BlockDefinitions(BlockId)).Registers - 2
+            if group is not None:
+                for i, repeat in enumerate(Values.pop(group.Name, ())):
+                    for name, value in repeat.items():
+                        Values[(i, name)] = value
+            Values["ID"] = BlockId
+            Values["L"] = Length
+            definitions = SunSpec.BlockDefinitions(BlockId, 0, Length if group is not None else None)
+            self.Set(address, bytes(2 * (Length + 2)))
+            self.Set(address, ModbusPlan.Compile(definitions).Pack(Values)[:2 * (Length + 2)])
+            blocks.append(SunSpec.SunSpecBlock(BlockId, 0, address, Length))
+            address += Length + 2
+        self.Set(address, struct.pack(">HH", 0xffff, 0))
+        return blocks
+
+    # @brief sets the SolarEdge ranges. The SmartMeters continue the SunSpec block chain (common block and meter
+    # model), the end marker is moved behind the last one.
+    # @param SmartMeters: {SmartMeterId: values of SolarEdge.SmartMeterDefinition}
+    # @param Batteries: {BatteryId: values of SolarEdge.BatteryInfoDefinition and BatteryStatusDefinition}
+    # @param TripLimits: values of SolarEdge.GridProtectionTripLimitsDefinition or None
+    # @param MeterModel: SunSpec model of the meters (201 .. 204)
+    # @param ExportControl: values of SolarEdge.ExportControlDefinition and ActivePowerLimitDefinition or None
+    def AddSolarEdge(self, SmartMeters = {}, Batteries = {}, TripLimits = None, MeterModel = 203, ExportControl = None):
+        for SmartMeterId in sorted(SmartMeters):
+            address = SolarEdge.SmartMeterAddresses[SmartMeterId - 1]
+            self.Write(address, SolarEdge.SmartMeterDefinition, SmartMeters[SmartMeterId])
+            # the definition holds two blocks: common block (ID 1, L 65) and meter model (L 105)
+            self.Set(address, struct.pack(">HH", 1, 65))
+            self.Set(address + 67, struct.pack(">HH", MeterModel, 105))
+            end = address + 174
+            if not self.__mapped[end]:
+                self.Set(end, struct.pack(">HH", 0xffff, 0))
+        for BatteryId, values in Batteries.items():
+            address = SolarEdge.BatteryAddresses[BatteryId - 1]
+            self.Write(address, SolarEdge.BatteryInfoDefinition, values)
+            self.Write(address + SolarEdge.BatteryStatusOffset, SolarEdge.BatteryStatusDefinition, values)
+        if TripLimits is not None:
+            self.Write(SolarEdge.GridProtectionTripLimitsAddress, SolarEdge.GridProtectionTripLimitsDefinition, TripLimits)
+        if ExportControl is not None:
+            self.Write(SolarEdge.ExportControlAddress, SolarEdge.ExportControlDefinition, ExportControl)
+            self.Write(SolarEdge.ActivePowerLimitAddress, SolarEdge.ActivePowerLimitDefinition, ExportControl)
+
+    # @brief returns the register map as {address: hex string of the registers} of the runs of mapped registers
+    def Snapshot(self):
+        snapshot = {}
+        address = 0
+        while address < 0x10000:
+            if not self.__mapped[address]:
+                address += 1
+                continue
+            end = self.__mapped.find(b"\x00", address)
+            end = 0x10000 if end < 0 else end
+            snapshot[str(address)] = self.Get(address, end - address).hex()
+            address = end
+        return snapshot
+
+    # @brief sets the registers of a snapshot, see Snapshot() and Capture()
+    def Restore(self, Snapshot):
+        for address, data in Snapshot.items():
+            self.Set(int(address), bytes.fromhex(data))
+
+    # @brief reads the register ranges of a real device and returns them as snapshot (see Snapshot()), unreadable
+    # ranges are left out
+    # @param Client: connected modbus.Modbus
+    # @param UnitId: unit ID of the device
+    # @param Ranges: list of (Address, Count)
+    @staticmethod
+    def Capture(Client, UnitId, Ranges):
+        chunks = []
+        for address, count in Ranges:
+            while count > 0:
+                chunk = min(count, 120)
+                chunks.append((address, chunk))
+                address += chunk
+                count -= chunk
+        snapshot = {}
+        for (address, count), data in zip(chunks, Client.ReadRaw(UnitId, chunks)):
+            if data is not None:
+                snapshot[str(address)] = data.hex()
+        return snapshot
+
+    # @brief writes the snapshot of the register map to a JSON file
+    def Save(self, Path):
+        with open(Path, "w") as file:
+            json.dump(self.Snapshot(), file, indent = 1)
+
+    # @brief sets the registers of a snapshot saved by Save()
+    def Load(self, Path):
+        with open(Path, "r") as file:
+            self.Restore(json.load(file))
+
+    # @brief returns the exception code for a request of the registers [First, End) or None
+    def __check(self, First, End):
+        if End > 0x10000 or b"\x00" in self.__mapped[First:End]:
+            return self.IllegalDataAddress
+        for first, end in self.Holes:
+            if first < End and First < end:
+                return self.IllegalDataAddress
+        for first, end, code in self.Exceptions:
+            if first < End and First < end:
+                return code
+        if self.ExceptionRate > 0 and random.random() < self.ExceptionRate:
+            return self.ServerDeviceBusy
+        return None
+
+    # @brief processes a request PDU (function code and data) and returns the response PDU
+    # @param UnitId: unit ID of the request
+    # @param Request: request PDU
+    def Respond(self, UnitId, Request):
+        self.Requests += 1
+        functionCode = Request[0]
+        code = None
+        if functionCode in (3, 4) and len(Request) == 5:
+            address, count = struct.unpack_from(">HH", Request, 1)
+            if count < 1 or count > self.MaxRegisters:
+                code = self.IllegalDataValue
+            else:
+                code = self.__check(address, address + count)
+            if code is None:
+                return struct.pack(">BB", functionCode, count * 2) + self.Get(address, count)
+        elif functionCode == 6 and len(Request) == 5:
+            address = struct.unpack_from(">H", Request, 1)[0]
+            code = self.__check(address, address + 1)
+            if code is None:
+                self.Set(address, Request[3:5])
+                return bytes(Request)
+        elif functionCode == 23 and len(Request) >= 10:
+            # the write is done before the read
+            address, count, writeAddress, writeCount, length = struct.unpack_from(">HHHHB", Request, 1)
+            if count < 1 or count > 125 or writeCount < 1 or writeCount > 121 or length != writeCount * 2 \
+                    or len(Request) != 10 + length:
+                code = self.IllegalDataValue
+            else:
+                code = self.__check(writeAddress, writeAddress + writeCount)
+                if code is None:
+                    code = self.__check(address, address + count)
+            if code is None:
+                self.Set(writeAddress, Request[10:])
+                return struct.pack(">BB", functionCode, count * 2) + self.Get(address, count)
+        elif functionCode == 16 and len(Request) >= 6:
+            address, count, length = struct.unpack_from(">HHB", Request, 1)
+            if count < 1 or count > 123 or length != count * 2 or len(Request) != 6 + length:
+                code = self.IllegalDataValue
+            else:
+                code = self.__check(address, address + count)
+            if code is None:
+                self.Set(address, Request[6:])
+                return bytes(Request[:5])
+        else:
+            code = self.IllegalFunction
+        return struct.pack(">BB", functionCode | 0x80, code)
+
+
+# @brief returns a SimulatedDevice of a SolarEdge inverter with SunSpec common block and three phase inverter
+# model (103), a SmartMeter, a battery, the grid protection trip limits and the power control registers
+# @param SerialNumber: serial number of the inverter
+# @param Options: options of SimulatedDevice
+def SolarEdgeInverter(SerialNumber = "7E000001", **Options):
+    device = SimulatedDevice(**Options)
+    device.AddSunSpec([
+        (1, {"Mn": "SolarEdge", "Md": "SE10K-RW0TEBNN4", "Vr": "0004.0019.0022", "SN": SerialNumber, "DA": 1}, 65),
+        (103, {"A[A]": 1450, "AphA[A]": 483, "AphB[A]": 484, "AphC[A]": 483, "A_SF": -2,
+            "PPVphAB[V]": 4001, "PPVphBC[V]": 3998, "PPVphCA[V]": 4003, "PhVphA[V]": 2310, "PhVphB[V]": 2308,
+            "PhVphC[V]": 2312, "V_SF": -1, "W[W]": 10000, "W_SF": -1, "Hz[Hz]": 50002, "Hz_SF": -3,
+            "VA[VA]": 10010, "VA_SF": -1, "VAr[var]": 120, "VAr_SF": -1, "PF[Pct]": 9990, "PF_SF": -2,
+            "WH[Wh]": 12345678, "WH_SF": 0, "DCA[A]": 1230, "DCA_SF": -2, "DCV[V]": 7500, "DCV_SF": -1,
+            "DCW[W]": 10150, "DCW_SF": -1, "TmpSnk[C]": 4250, "Tmp_SF": -2, "St": 4, "StVnd": 0})])
+    device.AddSolarEdge(
+        SmartMeters = {1: {"C_Manufacturer": "SolarEdge", "C_Model": "PRO380-Mod", "C_Option": "Export+Import",
+            "C_Version": "2.19", "C_SerialNumber": SerialNumber + "-M1", "C_DeviceAddress": 2,
+            "M_AC_Current": 512, "M_AC_Current_SF": -2, "M_AC_Voltage_L_N": 2310, "M_AC_Voltage_SF": -1,
+            "M_AC_Freq": 5000, "M_AC_Freq_SF": -2, "M_AC_Power": -3500, "M_AC_Power_SF": 0,
+            "M_Exported": 4567890, "M_Imported": 1234567, "M_Energy_WH_SF": 0}},
+        Batteries = {1: {"C_Manufacturer": "LG", "C_Model": "RESU10H", "C_Version": "1.0", "C_SerialNumber": SerialNumber + "-B1",
+            "C_DeviceAddress": 15, "RatedEnergy": 9800.0, "MaxChargeContinuesPower": 5000.0,
+            "MaxDischargeContinuesPower": 5000.0, "InstantaneousPower": -1200.0, "StateOfEnergy": 64.5,
+            "StateOfHealth": 98.0, "Status": 4}},
+        TripLimits = {"VgMax1": 253.0, "VgMax1_HoldTime": 600000},
+        ExportControl = {"ExportControlMode": 1, "ExportControlLimitMode": 0, "ExportControlSiteLimit": 5000.0,
+            "ActivePowerLimit": 100})
+    return device
+
+
+class ModbusSimulator:
+    # @param Host: address the devices are served on
+    def __init__(self, Host = "127.0.0.1"):
+        self.Host = Host
+        self.Devices = {}       # port -> SimulatedDevice
+        self.__servers = []
+        self.__connections = {}        # task serving an open connection -> its writer
+        self.__terminals = []          # (master, slave) file descriptors of the pseudo-terminals
+        self.__loop = None
+        self.__thread = None
+
+    # @brief starts the event loop serving the devices in a background thread
+    def Start(self):
+        self.__loop = asyncio.new_event_loop()
+        self.__thread = threading.Thread(target = self.__loop.run_forever, daemon = True)
+        self.__thread.start()
+
+    # @brief serves the device (from any thread, after Start()). returns the port
+    # @param Device: SimulatedDevice
+    # @param Port: TCP port, 0 for any free port
+    def Add(self, Device, Port = 0):
+        return asyncio.run_coroutine_threadsafe(self.Serve(Device, Port), self.__loop).result()
+
+    # @brief serves the device on the running event loop. returns the port
+    # @param Device: SimulatedDevice
+    # @param Port: TCP port, 0 for any free port
+    async def Serve(self, Device, Port = 0):
+        server = await asyncio.start_server(lambda reader, writer: self.__connection(Device, reader, writer), self.Host, Port)
+        self.__servers.append(server)
+        port = server.sockets[0].getsockname()[1]
+        self.Devices[port] = Device
+        return port
+
+    # @brief serves the devices as the followers on a RS485 bus (Modbus RTU) behind a pseudo-terminal (from any
+    # thread, after Start(), POSIX only). returns the path of the terminal to connect to, see Modbus.rtu_connect()
+    # @param Devices: {unit ID: SimulatedDevice}
+    def AddRtu(self, Devices):
+        import tty
+        master, slave = os.openpty()
+        tty.setraw(slave)
+        self.__terminals.append((master, slave))
+        bus = bytearray()
+
+        def receive():
+            try:
+                bus.extend(os.read(master, 4096))
+            except OSError:
+                return
+            for delay, response in self.__rtu_respond(Devices, bus):
+                self.__loop.call_later(delay, os.write, master, response)
+        self.__loop.call_soon_threadsafe(self.__loop.add_reader, master, receive)
+        return os.ttyname(slave)
+
+    # @brief serves the devices as the followers on a RS485 bus behind a gateway forwarding RTU frames over TCP
+    # (from any thread, after Start()). returns the port
+    # @param Devices: {unit ID: SimulatedDevice}
+    # @param Port: TCP port, 0 for any free port
+    def AddRtuTcp(self, Devices, Port = 0):
+        async def serve():
+            server = await asyncio.start_server(lambda reader, writer: self.__rtu_connection(Devices, reader, writer),
+                self.Host, Port)
+            self.__servers.append(server)
+            return server.sockets[0].getsockname()[1]
+        return asyncio.run_coroutine_threadsafe(serve(), self.__loop).result()
+
+    # @brief stops serving the devices and the event loop started by Start()
+    def Stop(self):
+        if self.__loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.__close(), self.__loop).result()
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+        self.__loop.close()
+        self.__loop = None
+
+    async def __close(self):
+        for server in self.__servers:
+            server.close()
+        # closing the connections ends their tasks
+        for writer in self.__connections.values():
+            writer.close()
+        await asyncio.gather(*self.__connections, return_exceptions = True)
+        for server in self.__servers:
+            await server.wait_closed()
+        self.__servers = []
+        for master, slave in self.__terminals:
+            self.__loop.remove_reader(master)
+            os.close(master)
+            os.close(slave)
+        self.__terminals = []
+
+    # @brief serves one connection: the requests are answered one after the other like by a real device
+    async def __connection(self, Device, Reader, Writer):
+        if Device.MaxConnections is not None and Device.Connections >= Device.MaxConnections:
+            Writer.close()
+            return
+        Device.Connections += 1
+        task = asyncio.current_task()
+        self.__connections[task] = Writer
+        try:
+            while True:
+                messageId, protocolId, length, unitId = struct.unpack(">HHHB", await Reader.readexactly(7))
+                if length < 2 or length > 254:
+                    break
+                request = await Reader.readexactly(length - 1)
+                Device.BytesReceived += 6 + length
+                if protocolId != 0 or (Device.UnitIds is not None and unitId not in Device.UnitIds) \
+                        or (Device.DropRate > 0 and random.random() < Device.DropRate):
+                    # no response, the client times out
+                    continue
+                response = Device.Respond(unitId, request)
+                delay = Device.Latency + random.uniform(0, Device.Jitter)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                frame = struct.pack(">HHHB", messageId, 0, len(response) + 1, unitId) + response
+                Device.BytesSent += len(frame)
+                split = Device.Split if Device.Split else len(frame)
+                for i in range(0, len(frame), split):
+                    Writer.write(frame[i:i + split])
+                    await Writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.__connections.pop(task, None)
+            Device.Connections -= 1
+            Writer.close()
+
+    # @brief serves one RTU over TCP connection of a gateway
+    async def __rtu_connection(self, Devices, Reader, Writer):
+        task = asyncio.current_task()
+        self.__connections[task] = Writer
+        bus = bytearray()
+        try:
+            while True:
+                data = await Reader.read(4096)
+                if len(data) == 0:
+                    break
+                bus += data
+                for delay, response in self.__rtu_respond(Devices, bus):
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    Writer.write(response)
+                    await Writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.__connections.pop(task, None)
+            Writer.close()
+
+    # @brief answers the complete RTU request frames at the start of Bus and removes them from it. Frames with
+    # a CRC error, of unknown units and broadcasts aren't answered. returns [(delay, response frame)]
+    # @param Devices: {unit ID: SimulatedDevice}
+    # @param Bus: received bytes
+    @staticmethod
+    def __rtu_respond(Devices, Bus):
+        responses = []
+        while True:
+            length = FrameLength(Bus, True)
+            if length is None or length > len(Bus):
+                return responses
+            if length == 0:
+                # unknown function code, the rest is noise
+                Bus.clear()
+                return responses
+            frame = bytes(Bus[:length])
+            del Bus[:length]
+            if Crc16(frame[:-2]) != frame[-2] | frame[-1] << 8:
+                continue
+            unitId = frame[0]
+            for device in (Devices.values() if unitId == 0 else [Devices.get(unitId)]):
+                if device is None or (device.DropRate > 0 and random.random() < device.DropRate):
+                    continue
+                device.BytesReceived += length
+                response = Frame(unitId, device.Respond(unitId, frame[1:-2]))
+                if unitId != 0:
+                    device.BytesSent += len(response)
+                    responses.append((device.Latency + random.uniform(0, device.Jitter), response))
+
+
+if __name__ == "__main__":
+    import sys
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 1502
+    simulator = ModbusSimulator("0.0.0.0")
+    simulator.Start()
+    for i in range(count):
+        print("inverter %d: port %d" % (i + 1, simulator.Add(SolarEdgeInverter("7E%06X" % (i + 1)), port + i)))
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        simulator.Stop()
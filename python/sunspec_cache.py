@@ -0,0 +1,114 @@
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+
+import atexit
+import collections
+import json
+import os
+import threading
+import time
+
+# Persistent cache of the SunSpec discovery results, keyed by device ("host:port/unit"). Each entry holds the
+# SunSpec base address, the block list and a fingerprint of the device (SunSpec marker, manufacturer, model,
+# firmware version and serial number of the common block). SunSpec.SunSpec() validates a cached entry with a
+# single read of the fingerprint instead of walking the block chain again; the entry is rediscovered if the
+# fingerprint doesn't match (other device, firmware update) or the entry expired.
+#
+#   modbus.SunSpec.DiscoveryCache = sunspec_cache.SunSpecCache("sunspec.json")
+
+class SunSpecCache:
+    # @param Path: JSON file the cache is loaded from and saved to, None keeps the cache in memory
+    # @param TTL: lifetime of an entry in seconds
+    # @param Size: maximum number of entries, the least recently used ones are evicted
+    # @param SaveInterval: minimum time in seconds between two writes of the file, pending changes are written
+    # by Save() and at exit
+    def __init__(self, Path = None, TTL = 7 * 86400, Size = 4096, SaveInterval = 5):
+        self.Path = Path
+        self.TTL = TTL
+        self.Size = Size
+        self.SaveInterval = SaveInterval
+        self.__entries = collections.OrderedDict()
+        self.__lock = threading.Lock()
+        self.__dirty = False
+        self.__saved = float("-inf")
+        if Path is not None:
+            if os.path.exists(Path):
+                with open(Path, "r") as file:
+                    for key, entry in json.load(file).items():
+                        self.__entries[key] = entry
+            atexit.register(self.Save)
+
+    # @brief returns the entry {"Base", "Fingerprint", "Blocks", "Time"} of the device or None if there is no
+    # entry or it expired. Blocks is a list of [BlockId, SubBlockId, Address, Length]
+    # @param Key: device, "host:port/unit"
+    def Get(self, Key):
+        with self.__lock:
+            entry = self.__entries.get(Key)
+            if entry is None:
+                return None
+            if time.time() - entry["Time"] > self.TTL:
+                del self.__entries[Key]
+                self.__dirty = True
+                return None
+            self.__entries.move_to_end(Key)
+            return entry
+
+    # @brief stores the discovery result of the device
+    # @param Key: device, "host:port/unit"
+    # @param Base: SunSpec base address
+    # @param Fingerprint: fingerprint of the device
+    # @param Blocks: list of (BlockId, SubBlockId, Address, Length)
+    def Put(self, Key, Base, Fingerprint, Blocks):
+        with self.__lock:
+            self.__entries[Key] = {"Base": Base, "Fingerprint": Fingerprint, "Blocks": [list(block) for block in Blocks],
+                "Time": time.time()}
+            self.__entries.move_to_end(Key)
+            while len(self.__entries) > self.Size:
+                self.__entries.popitem(last = False)
+            self.__dirty = True
+        if time.monotonic() - self.__saved >= self.SaveInterval:
+            self.Save()
+
+    # @brief removes the entry of the device
+    # @param Key: device, "host:port/unit"
+    def Remove(self, Key):
+        with self.__lock:
+            if self.__entries.pop(Key, None) is not None:
+                self.__dirty = True
+
+    # @brief writes pending changes to Path (atomically, via a temporary file)
+    def Save(self):
+        with self.__lock:
+            if self.Path is None or not self.__dirty:
+                return
+            temporary = self.Path + ".tmp"
+            with open(temporary, "w") as file:
+                json.dump(self.__entries, file)
+            os.replace(temporary, self.Path)
+            self.__dirty = False
+            self.__saved = time.monotonic()
@@ -1,118 +1,185 @@
-#
-# This is free and unencumbered software released into the public domain.
-#
-# Anyone is free to copy, modify, publish, use, compile, sell, or
-# distribute this software, either in source code form or as a compiled
-# binary, for any purpose, commercial or non-commercial, and by any
-# means.
-#
-# In jurisdictions that recognize copyright laws, the author or authors
-# of this software dedicate any and all copyright interest in the
-# software to the public domain. We make this dedication for the benefit
-# of the public at large and to the detriment of our heirs and
-# successors. We intend this dedication to be an overt act of
-# relinquishment in perpetuity of all present and future rights to this
-# software under copyright law.
-#
-# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
-# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
-# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
-# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
-# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
-# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
-# OTHER DEALINGS IN THE SOFTWARE.
-# 
-# For more information, please refer to <https://unlicense.org>
-#
-
-# Pre-requisites
-#   pip install PyGithub
-# Specification Type 701: https://github.com/sunspec/models/blob/master/json/model_701.json
-
-import json
-import time
-import datetime
-import requests
-import zipfile
-import io
-import os
-from datetime import datetime, timezone
-from github import Github
-
-username = "dersecure"
-# Public Web Github
-g = Github()
-user = g.get_user(username)
-repo = g.get_repo("sunspec/Models")
-
-code = ""
-current_utc_time = datetime.now(timezone.utc)
-
-download_url = repo.get_archive_link("zipball", ref=repo.default_branch)
-response = requests.get(download_url)
-zipfile = zipfile.ZipFile(io.BytesIO(response.content))
-for zipinfo in zipfile.infolist():
-    if zipinfo.is_dir():
-        continue
-    if os.path.basename(os.path.dirname(zipinfo.filename)) != "json":
-        continue
-    filename = os.path.basename(zipinfo.filename)
-    if not filename.startswith("model_") or not filename.endswith(".json"):
-        continue
-    number = int(filename.split("_")[1].split(".")[0])
-    # exlude test schemas
-    if number > 63000:
-        continue
-
-    file = zipfile.open(zipinfo)
- 
-    jsonobj = json.loads(file.read().decode())
-    file.close()
-    
-    specs = {}
-    count = 0
-    offset = 0
- 
-
-    def AppendCode(code, specs, id, subid, group_name):
-        if code != "":
-            code += ",\n"
-        code += "\t(" + str(id) + ", " + str(subid) + ")"
-        code += ": (\"" + str(group_name) 
-        code += "\", " + str(specs) 
-        code += ")" 
-        return code
-
-    print("group id:", jsonobj["id"], ", group name:", jsonobj["group"]["name"])
-
-    subid = 0
-    count = 0
-    while subid <= count:
-        if subid == 0:
-            grouping = jsonobj["group"]["points"]
-        else:
-            grouping = jsonobj["group"]["groups"][subid - 1]["points"]
-        for point in grouping:
-            type = point["type"]
-            if point["size"] > 1:
-                size = point["size"]
-            else:
-                size = 1
-            if type == "count":
-                count += 1
-            if "units" in point:
-                units = "[" + point["units"] + "]"
-            else:
-                units = ""
-
-            specs[offset] = (point["name"] + units, type, size)
-            offset += size
-
-        code = AppendCode(code, specs, jsonobj["id"], subid, jsonobj["group"]["name"])
-        subid += 1
-
-
-code = "# created by sunspec_create.py (" + str(current_utc_time) + ")\n# source https://github.com/sunspec/models/tree/master/json \n# Copyright and Trademark: SunpSpec Alliance: Apache License https://github.com/sunspec/models/blob/master/LICENSE \n\nclass SunSpec_Specification:\n\tSpecification = {\n" + code + "}\n"
-fd = os.open(os.path.dirname(os.path.abspath(__file__)) + "/sunspec_specification.py", os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o666)
-os.write(fd, code.encode())
-os.close(fd)
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+# Creates sunspec_specification.dat from the SunSpec JSON models (https://github.com/sunspec/models/tree/master/json)
+#
+#   python sunspec_create.py models                 checkout of the models repository or its json directory
+#   python sunspec_create.py models-master.zip      zip archive of the models repository
+#   python sunspec_create.py                        downloads the archive from GitHub
+#   python sunspec_create.py models other.dat       writes other.dat instead of sunspec_specification.dat
+#
+# The output only depends on the models: they are processed in the order of their file names and the source
+# recorded in the file is the SHA-256 of the model files instead of a timestamp.
+#
+# Pre-requisites (download only)
+#   pip install PyGithub
+# Specification Type 701: https://github.com/sunspec/models/blob/master/json/model_701.json
+
+import hashlib
+import json
+import zipfile
+import io
+import os
+import sys
+from sunspec_specification import SunSpec_Models, SunSpec_Group
+
+# @brief returns the model files [(file name, content)] of a directory or a zip archive, sorted by file name
+# @param Source: directory, zip file or zip content (bytes)
+def ReadModels(Source):
+    files = []
+    if isinstance(Source, str) and os.path.isdir(Source):
+        if os.path.isdir(os.path.join(Source, "json")):
+            Source = os.path.join(Source, "json")
+        for filename in os.listdir(Source):
+            with open(os.path.join(Source, filename), "rb") as file:
+                files.append((filename, file.read()))
+    else:
+        archive = zipfile.ZipFile(io.BytesIO(Source) if isinstance(Source, bytes) else Source)
+        for zipinfo in archive.infolist():
+            if zipinfo.is_dir():
+                continue
+            if os.path.basename(os.path.dirname(zipinfo.filename)) != "json":
+                continue
+            files.append((os.path.basename(zipinfo.filename), archive.read(zipinfo)))
+    models = []
+    for filename, content in files:
+        if not filename.startswith("model_") or not filename.endswith(".json"):
+            continue
+        number = int(filename.split("_")[1].split(".")[0])
+        # exlude test schemas
+        if number > 63000:
+            continue
+        models.append((filename, content))
+    return sorted(models)
+
+# @brief downloads the zip archive of the models repository
+def DownloadModels():
+    import requests
+    from github import Github
+    # Public Web Github
+    g = Github()
+    repo = g.get_repo("sunspec/Models")
+    download_url = repo.get_archive_link("zipball", ref=repo.default_branch)
+    return requests.get(download_url).content
+
+# @brief returns the points {offset: (name, type, length)} of a group appended at offset, their scale factors
+# {name: scale factor point} and the new offset
+def GroupPoints(points, offset):
+    specs = {}
+    scalefactors = {}
+    for point in points:
+        if point["size"] > 1:
+            size = point["size"]
+        else:
+            size = 1
+        if "units" in point:
+            units = "[" + point["units"] + "]"
+        else:
+            units = ""
+        specs[offset] = (point["name"] + units, point["type"], size)
+        # scale factors given as constant aren't supported
+        if isinstance(point.get("sf"), str):
+            scalefactors[point["name"] + units] = point["sf"]
+        offset += size
+    return specs, scalefactors, offset
+
+# @brief returns the points of one repeat of a group and of its nested groups (one repeat each) appended at
+# offset, their scale factors and the new offset, see GroupPoints()
+def NestedPoints(group, offset):
+    specs, scalefactors, offset = GroupPoints(group["points"], offset)
+    for subgroup in group.get("groups", []):
+        points, sfs, offset = NestedPoints(subgroup, offset)
+        specs.update(points)
+        scalefactors.update(sfs)
+    return specs, scalefactors, offset
+
+# @brief returns the scale factors {name: scale factor point} that refer to a sunssf point of the specs, the
+# others are reported and dropped. The scale factor points are named as in the specs, i.e. with their units
+def VerifiedScaleFactors(model, specs, scalefactors):
+    points = {name.split("[")[0]: name for name, type_, length in specs.values() if type_ == "sunssf"}
+    for name, sf in scalefactors.items():
+        if sf not in points:
+            print("model", model, ": scale factor", sf, "of", name, "is no sunssf point, ignored")
+    return {name: points[sf] for name, sf in scalefactors.items() if sf in points}
+
+# @brief converts the models into the specification {(id, subid): (group name, points)} and the repeating
+# groups {id: SunSpec_Group} and the scale factors {(id, subid): {name: scale factor point}}. subid 0 holds the
+# fixed points of a model, subid n the fixed points followed by the points of the first n groups (one repeat each).
+# Models whose groups have no count point get subid 1 with one repeat of the first group and of its nested groups,
+# so the scale factors of the points in the groups are part of the specification.
+def Convert(models):
+    specification = {}
+    groups = {}
+    scalefactors = {}
+    for filename, content in models:
+        jsonobj = json.loads(content.decode())
+        group = jsonobj["group"]
+        print("group id:", jsonobj["id"], ", group name:", group["name"])
+
+        specs, sfs, offset = GroupPoints(group["points"], 0)
+        specification[(jsonobj["id"], 0)] = (group["name"], dict(specs))
+        scalefactors[(jsonobj["id"], 0)] = VerifiedScaleFactors(jsonobj["id"], specs, sfs)
+        fixed = offset
+        count = [point["name"] for point in group["points"] if point["type"] == "count"]
+        subgroups = group.get("groups", [])
+        for subid in range(1, min(len(count), len(subgroups)) + 1):
+            points, groupsfs, offset = GroupPoints(subgroups[subid - 1]["points"], offset)
+            specs.update(points)
+            sfs.update(groupsfs)
+            specification[(jsonobj["id"], subid)] = (group["name"], dict(specs))
+            scalefactors[(jsonobj["id"], subid)] = VerifiedScaleFactors(jsonobj["id"], specs, sfs)
+        if len(subgroups) > 0 and (jsonobj["id"], 1) not in specification:
+            points, groupsfs, offset = NestedPoints(subgroups[0], fixed)
+            specs.update(points)
+            sfs.update(groupsfs)
+            specification[(jsonobj["id"], 1)] = (group["name"], dict(specs))
+            scalefactors[(jsonobj["id"], 1)] = VerifiedScaleFactors(jsonobj["id"], specs, sfs)
+        # a single repeating group without nested groups is decoded by SunSpec.ReadBlock()
+        if len(subgroups) == 1 and len(subgroups[0].get("groups", [])) == 0:
+            repeat = GroupPoints(subgroups[0]["points"], 0)[2]
+            counter = subgroups[0].get("count")
+            if not isinstance(counter, str):
+                counter = count[0] if len(count) > 0 else ""
+            groups[jsonobj["id"]] = SunSpec_Group(subgroups[0]["name"], fixed, repeat, counter)
+    return specification, groups, scalefactors
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        models = ReadModels(sys.argv[1])
+    else:
+        models = ReadModels(DownloadModels())
+    specification, groups, scalefactors = Convert(models)
+    digest = hashlib.sha256()
+    for filename, content in models:
+        digest.update(filename.encode() + b"\0" + content)
+    source = "created by sunspec_create.py from https://github.com/sunspec/models/tree/master/json (sha256 " + digest.hexdigest() + ")"
+    if len(sys.argv) > 2:
+        path = sys.argv[2]
+    else:
+        path = os.path.dirname(os.path.abspath(__file__)) + "/sunspec_specification.dat"
+    SunSpec_Models.Write(path, specification, source, groups, scalefactors)
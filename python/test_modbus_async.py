@@ -0,0 +1,61 @@
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+
+# Tests of the asyncio client against the simulator, run with: python -m pytest
+
+import asyncio
+import modbus_async
+import modbus_simulator
+
+
+# @brief the device key of a unit is kept per device and restored when the discovery is served from the cache
+def test_device_key_cached():
+    simulator = modbus_simulator.ModbusSimulator()
+    simulator.Start()
+    other = modbus_simulator.SimulatedDevice()
+    other.AddSunSpec([(1, {"Mn": "Other", "Md": "OT-1", "Vr": "1.0", "SN": "1", "DA": 1}, 65), (103, {}, 50)])
+    ports = [simulator.Add(modbus_simulator.SolarEdgeInverter()), simulator.Add(other)]
+
+    async def keys():
+        result = []
+        for port in ports:
+            client = modbus_async.AsyncSunSpec()
+            await client.tcp_connect("127.0.0.1", port, 2)
+            assert await client.SunSpec(1) is not None
+            result.append(client.DeviceKey(1))
+            await client.tcp_close()
+        return result
+
+    try:
+        discovered = asyncio.run(keys())
+        # the second round is served from the cache of the blocks
+        cached = asyncio.run(keys())
+    finally:
+        simulator.Stop()
+    assert discovered == ["SolarEdge/SE10K-RW0TEBNN4/0004.0019.0022", "Other/OT-1/1.0"]
+    assert cached == discovered
@@ -0,0 +1,79 @@
+#
+# This is free and unencumbered software released into the public domain.
+#
+# Anyone is free to copy, modify, publish, use, compile, sell, or
+# distribute this software, either in source code form or as a compiled
+# binary, for any purpose, commercial or non-commercial, and by any
+# means.
+#
+# In jurisdictions that recognize copyright laws, the author or authors
+# of this software dedicate any and all copyright interest in the
+# software to the public domain. We make this dedication for the benefit
+# of the public at large and to the detriment of our heirs and
+# successors. We intend this dedication to be an overt act of
+# relinquishment in perpetuity of all present and future rights to this
+# software under copyright law.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.
+# IN NO EVENT SHALL THE AUTHORS BE LIABLE FOR ANY CLAIM, DAMAGES OR
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE,
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+# 
+# For more information, please refer to <https://unlicense.org>
+#
+
+
+# Tests of the SunSpec specification data file, run with: python -m pytest
+
+from modbus import SunSpec
+from modbus_history import ModbusHistory
+from sunspec_specification import SunSpec_Models, SunSpec_Specification
+
+
+# @brief every model with scale factor points maps its scaled points to them
+def test_scalable():
+    specification = SunSpec_Specification.Specification
+    for id in sorted(set(key[0] for key in specification)):
+        keys = [key for key in specification if key[0] == id]
+        if any(type_ == "sunssf" for key in keys for name, type_, length in specification[key][1].values()):
+            assert specification.Scalable(id), id
+
+
+# @brief the scale factors of a definition are sunssf points of the same definition
+def test_scale_factors():
+    specification = SunSpec_Specification.Specification
+    for key in specification:
+        points = dict((name, type_) for name, type_, length in specification[key][1].values())
+        for name, scalefactor in specification.ScaleFactors(key).items():
+            assert name in points and points.get(scalefactor) == "sunssf", (key, name, scalefactor)
+
+
+# @brief the repeats of a group are scaled with the scale factors of the fixed points
+def test_group_scale():
+    scale = SunSpec.BlockScale(160, 0, 48)
+    values = {"ID": 160, "L": 48, "DCA_SF": -2, (0, "DCA[A]"): 150, (1, "DCA[A]"): 250}
+    result = scale.Apply(values)
+    assert result[(0, "DCA[A]")] == 1.5 and result[(1, "DCA[A]")] == 2.5
+
+
+# @brief a series of a model without scale factors keeps its raw values
+def test_history_unscaled(tmp_path, monkeypatch):
+    path = str(tmp_path / "unscaled.dat")
+    points = {0: ("ID", "uint16", 1), 1: ("L", "uint16", 1), 2: ("W[W]", "int16", 1), 3: ("W_SF", "sunssf", 1)}
+    SunSpec_Models.Write(path, {(64999, 0): ("unscaled", points)})
+    monkeypatch.setattr(SunSpec_Specification, "Specification", SunSpec_Models(path))
+    history = ModbusHistory(Scaled = True)
+    history.Append("dev", 64999, {"ID": 64999, "L": 2, "W[W]": 1234, "W_SF": -1}, 1)
+    assert not history.Ring("dev", 64999).Scaled
+    assert list(history.Latest("dev", 64999)["W[W]"]) == [1234]
+
+
+# @brief a series of a model with scale factors stores engineering values
+def test_history_scaled():
+    history = ModbusHistory(Scaled = True)
+    history.Append("dev", 101, {"ID": 101, "L": 50, "W[W]": 123.4, "W_SF": -1}, 1)
+    assert history.Ring("dev", 101).Scaled
+    assert list(history.Latest("dev", 101)["W[W]"]) == [123.4]